@@ -0,0 +1,421 @@
+"""
+Banco de pruebas de rendimiento de utilities_for_graphical_computing.
+
+Mide el tiempo y la memoria pico de cada operación pública (métodos de Imagen, fusionar*,
+ColorConverter, cada FiltroStrategy, desde_archivo y el renderizado de SimpleImageViewer)
+sobre imágenes sintéticas de distintos tamaños, tipos de dato y tamaños de kernel. También
+mide el tiempo de importación del paquete en procesos nuevos y comprueba que no cargue
+matplotlib ni Pillow.
+
+Uso (desde la raíz del repositorio):
+    python benchmarks/benchmark.py run -o resultados.json --tamanos miniatura,hd --dtypes uint8,float32
+    python benchmarks/benchmark.py compare base.json resultados.json --umbral 0.1
+    python benchmarks/benchmark.py importacion --limite 50
+"""
+import argparse
+import atexit
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Callable, Iterator, Optional, Sequence
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+from PIL import Image
+
+from utilities_for_graphical_computing import (
+    Imagen,
+    ColorConverter,
+    FiltroContraste,
+    FiltroIntensidad,
+    FiltroIdentity,
+    FiltroGamma,
+    FiltroConvolucion,
+    FiltroGaussiano,
+    FiltroEnfoque,
+    FiltroSobel,
+    FiltroScharr,
+    SimpleImageViewer,
+)
+
+# Tamaños (alto, ancho), desde una miniatura hasta 50 megapíxeles.
+TAMANOS = {
+    "miniatura": (128, 128),
+    "vga": (480, 640),
+    "hd": (1080, 1920),
+    "12mp": (3000, 4000),
+    "50mp": (5773, 8660),
+}
+DTYPES = ("uint8", "float32", "float64")
+KERNELS = (3, 7, 15)
+# Módulos que importar el paquete no debe cargar (se importan al usarse).
+MODULOS_PEREZOSOS = ("matplotlib", "PIL")
+
+# Un caso recibe la imagen sintética y retorna la función (sin argumentos) a medir.
+Preparador = Callable[[np.ndarray], Callable[[], object]]
+
+
+@dataclass
+class Caso:
+    """
+    Operación a medir.
+
+    Atributos:
+        nombre (str): Nombre de la operación (p. ej., 'Imagen.mean_filter').
+        parametros (str): Descripción de los parámetros (p. ej., 'k=7').
+        preparar (Preparador): Construye la función a medir a partir de la imagen.
+        dtypes (tuple[str, ...] | None): Tipos de dato admitidos (None para todos).
+    """
+    nombre: str
+    parametros: str
+    preparar: Preparador
+    dtypes: Optional[tuple[str, ...]] = None
+
+
+@dataclass
+class Resultado:
+    """
+    Medición de un caso sobre un tamaño y tipo de dato.
+    """
+    caso: str
+    parametros: str
+    tamano: str
+    dtype: str
+    repeticiones: int
+    tiempo_min: float
+    tiempo_mediana: float
+    memoria_pico: int
+
+    @property
+    def clave(self) -> str:
+        return f"{self.caso}|{self.parametros}|{self.tamano}|{self.dtype}"
+
+
+def imagen_sintetica(tamano: tuple[int, int], dtype: str, canales: int = 3, semilla: int = 0) -> np.ndarray:
+    """
+    Genera una imagen con gradientes y ruido (uint8 en [0, 255], flotantes en [0, 1]).
+    """
+    alto, ancho = tamano
+    rng = np.random.default_rng(semilla)
+    y = np.linspace(0, 1, alto, dtype=np.float32)[:, np.newaxis, np.newaxis]
+    x = np.linspace(0, 1, ancho, dtype=np.float32)[np.newaxis, :, np.newaxis]
+    fase = np.linspace(0, 1, canales, dtype=np.float32)
+    datos = (0.5 * (x + y) * (1 - fase) + 0.5 * fase * x) * 0.8
+    datos = datos + rng.random((alto, ancho, canales), dtype=np.float32) * 0.2
+    if dtype == "uint8":
+        return (datos * 255).astype(np.uint8)
+    return datos.astype(dtype)
+
+
+_DIRECTORIO_TEMPORAL = tempfile.mkdtemp(prefix="benchmark_")
+atexit.register(shutil.rmtree, _DIRECTORIO_TEMPORAL, True)
+
+
+def _archivo_jpeg(datos: np.ndarray) -> str:
+    """
+    Guarda la imagen como JPEG temporal (para medir la decodificación) y retorna su ruta.
+    """
+    descriptor, ruta = tempfile.mkstemp(suffix=".jpg", dir=_DIRECTORIO_TEMPORAL)
+    os.close(descriptor)
+    Image.fromarray(datos).save(ruta, quality=90)
+    return ruta
+
+
+def _visor(datos: np.ndarray) -> Callable[[], None]:
+    """
+    Renderiza cuatro imágenes con SimpleImageViewer en el backend sin pantalla (Agg).
+    """
+    visor = SimpleImageViewer({f"imagen {i}": datos for i in range(4)})
+
+    def renderizar() -> None:
+        visor.show()
+        for numero in plt.get_fignums():
+            plt.figure(numero).canvas.draw()
+        plt.close("all")
+    return renderizar
+
+
+def _color(datos: np.ndarray) -> list:
+    """Color de pintado con tantos canales como la imagen."""
+    return [1] * (datos.shape[2] if datos.ndim == 3 else 1)
+
+
+def _hojas(datos: np.ndarray, motor: str) -> Callable[[], None]:
+    """
+    Guarda una hoja de contactos de 16 imágenes en un archivo PNG temporal.
+    """
+    visor = SimpleImageViewer({f"imagen {i}": datos for i in range(16)})
+    ruta = os.path.join(_DIRECTORIO_TEMPORAL, f"hoja_{motor}.png")
+    return lambda: visor.save_contact_sheets(ruta, tile_size=128, engine=motor)
+
+
+def casos() -> list[Caso]:
+    """
+    Retorna todos los casos del banco de pruebas.
+    """
+    lista = [
+        Caso("Imagen.normalizar", "", lambda d: lambda: Imagen(d).normalizar()),
+        Caso("Imagen.desnormalizar", "", lambda d: lambda: Imagen(d).desnormalizar(), ("float32", "float64")),
+        Caso("Imagen.invertir", "", lambda d: lambda: Imagen(d).invertir(), ("float32", "float64")),
+        Caso("Imagen.colorear_pixel", "", lambda d: lambda: Imagen(d).bifurcar().colorear_pixel(0, 0, [0, 0, 0])),
+        Caso("Imagen.colorear_region", "mitad superior",
+             lambda d: lambda: Imagen(d).bifurcar().colorear_region(slice(0, len(d) // 2), slice(None), _color(d))),
+        Caso("Imagen.colorear_mascara", "alfa=0.5",
+             lambda d: (lambda m: lambda: Imagen(d).bifurcar().colorear_mascara(m, _color(d), alfa=0.5))(
+                 np.add.outer(np.arange(d.shape[0]), np.arange(d.shape[1])) % 3 == 0)),
+        Caso("Imagen.dibujar_poligono", "alfa=0.5",
+             lambda d: lambda: Imagen(d).bifurcar().dibujar_poligono(
+                 [(0, 0), (len(d) - 1, d.shape[1] // 3), (len(d) // 2, d.shape[1] - 1)], _color(d), alfa=0.5)),
+        Caso("Imagen.extraer_capa_rgb", "", lambda d: lambda: Imagen(d).extraer_capa_rgb(0)),
+        Caso("Imagen.extraer_capa_cmyk", "", lambda d: lambda: Imagen(d).extraer_capa_cmyk(0)),
+        Caso("Imagen.separar_rgb", "", lambda d: lambda: Imagen(d).separar_rgb()),
+        Caso("Imagen.separar_cmyk", "", lambda d: lambda: Imagen(d).separar_cmyk()),
+        Caso("Imagen.gris_promedio", "", lambda d: lambda: Imagen(d).gris_promedio()),
+        Caso("Imagen.gris_luminosidad", "", lambda d: lambda: Imagen(d).gris_luminosidad()),
+        Caso("Imagen.gris_tonalidad", "", lambda d: lambda: Imagen(d).gris_tonalidad()),
+        Caso("Imagen.ajustar", "factor=-0.8", lambda d: lambda: Imagen(d).ajustar(-0.8)),
+        Caso("Imagen.ajustar", "factor=0.8", lambda d: lambda: Imagen(d).ajustar(0.8)),
+        Caso("Imagen.estadisticas", "", lambda d: lambda: Imagen(d).estadisticas()),
+        Caso("Imagen.autocontraste", "recorte=0.01",
+             lambda d: lambda: Imagen(d).autocontraste(0.01, inplace=False)),
+        Caso("Imagen.ecualizar", "", lambda d: lambda: Imagen(d).ecualizar(inplace=False)),
+        Caso("Imagen.clahe", "teselas=8x8", lambda d: lambda: Imagen(d).clahe(inplace=False)),
+        Caso("Imagen.redimensionar", "escala=0.5 bilineal",
+             lambda d: lambda: Imagen(d).redimensionar(escala=0.5)),
+        Caso("Imagen.redimensionar", "escala=0.3 area",
+             lambda d: lambda: Imagen(d).redimensionar(escala=0.3, metodo="area")),
+        Caso("Imagen.redimensionar", "escala=0.5 lanczos",
+             lambda d: lambda: Imagen(d).redimensionar(escala=0.5, metodo="lanczos")),
+        Caso("Imagen.piramide", "", lambda d: lambda: Imagen(d).piramide()),
+        Caso("Imagen.diferido", "normalizar+ajustar+desnormalizar",
+             lambda d: lambda: Imagen(d).diferido().normalizar().ajustar(-0.8).desnormalizar().datos, ("uint8",)),
+        Caso("Imagen.fusionar", "n=4", lambda d: lambda: Imagen.fusionar([Imagen(d)] * 4)),
+        Caso("Imagen.fusionar_ecualizado", "n=4",
+             lambda d: lambda: Imagen.fusionar_ecualizado([(Imagen(d), 0.25)] * 4)),
+        Caso("Imagen.desde_archivo", "jpeg", lambda d: (lambda r: lambda: Imagen.desde_archivo(r))(_archivo_jpeg(d)),
+             ("uint8",)),
+        Caso("Imagen.desde_archivo", "jpeg escala=0.25",
+             lambda d: (lambda r: lambda: Imagen.desde_archivo(r, escala=0.25))(_archivo_jpeg(d)), ("uint8",)),
+        Caso("SimpleImageViewer.show", "4 imágenes, Agg", _visor),
+        Caso("SimpleImageViewer.save_contact_sheets", "16 imágenes, matplotlib",
+             lambda d: _hojas(d, "matplotlib")),
+        Caso("SimpleImageViewer.save_contact_sheets", "16 imágenes, pillow", lambda d: _hojas(d, "pillow")),
+        Caso("FiltroContraste", "factor=-0.8", lambda d: lambda: FiltroContraste(-0.8).aplicar(Imagen(d))),
+        Caso("FiltroIntensidad", "factor=0.8", lambda d: lambda: FiltroIntensidad(0.8).aplicar(Imagen(d))),
+        Caso("FiltroGamma", "gamma=2.2", lambda d: lambda: FiltroGamma(2.2).aplicar(Imagen(d))),
+        Caso("FiltroIdentity", "", lambda d: lambda: FiltroIdentity().aplicar(Imagen(d))),
+        Caso("FiltroEnfoque", "cantidad=1", lambda d: lambda: FiltroEnfoque(1.0).aplicar(Imagen(d))),
+        Caso("FiltroSobel", "", lambda d: lambda: FiltroSobel().aplicar(Imagen(d))),
+        Caso("FiltroScharr", "", lambda d: lambda: FiltroScharr().aplicar(Imagen(d))),
+    ]
+    for k in KERNELS:
+        lista.append(Caso("Imagen.mean_filter", f"k={k}", lambda d, k=k: lambda: Imagen(d).mean_filter(k)))
+        lista.append(Caso("FiltroGaussiano", f"k={k}",
+                          lambda d, k=k: lambda: FiltroGaussiano(k / 6.0, tamano=k).aplicar(Imagen(d))))
+        lista.append(Caso("FiltroConvolucion", f"k={k} no separable",
+                          lambda d, k=k: lambda: FiltroConvolucion(
+                              np.random.default_rng(k).random((k, k))).aplicar(Imagen(d))))
+    for conversion, entrada in (("rgb_a_cmyk", None), ("cmyk_a_rgb", "rgb_a_cmyk"), ("rgb_a_hsv", None),
+                                ("hsv_a_rgb", "rgb_a_hsv"), ("rgb_a_ycbcr", None), ("ycbcr_a_rgb", "rgb_a_ycbcr"),
+                                ("rgb_a_lab", None), ("lab_a_rgb", "rgb_a_lab")):
+        def preparar(d: np.ndarray, conversion: str = conversion, entrada: Optional[str] = entrada):
+            fuente = Imagen(d) if entrada is None else getattr(ColorConverter, entrada)(Imagen(d))
+            return lambda: getattr(ColorConverter, conversion)(fuente)
+        lista.append(Caso(f"ColorConverter.{conversion}", "", preparar))
+    return lista
+
+
+def medir(funcion: Callable[[], object], repeticiones: int) -> tuple[list[float], int]:
+    """
+    Mide una función: una ejecución de calentamiento, `repeticiones` ejecuciones cronometradas
+    y una ejecución adicional bajo tracemalloc para obtener la memoria pico (en bytes).
+    """
+    funcion()
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    tracemalloc.start()
+    try:
+        funcion()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return tiempos, pico
+
+
+def ejecutar(tamanos: Sequence[str], dtypes: Sequence[str], repeticiones: int,
+             filtro: Optional[str] = None) -> Iterator[Resultado]:
+    """
+    Ejecuta la matriz de casos x tamaños x tipos de dato, generando un resultado por combinación.
+    """
+    patron = re.compile(filtro) if filtro else None
+    seleccion = [c for c in casos() if patron is None or patron.search(f"{c.nombre} {c.parametros}")]
+    for nombre_tamano in tamanos:
+        for dtype in dtypes:
+            datos = imagen_sintetica(TAMANOS[nombre_tamano], dtype)
+            for caso in seleccion:
+                if caso.dtypes is not None and dtype not in caso.dtypes:
+                    continue
+                tiempos, pico = medir(caso.preparar(datos), repeticiones)
+                yield Resultado(caso.nombre, caso.parametros, nombre_tamano, dtype, repeticiones,
+                                min(tiempos), statistics.median(tiempos), pico)
+
+
+def medir_importacion(repeticiones: int) -> tuple[list[float], list[str]]:
+    """
+    Importa el paquete en procesos nuevos, después de numpy, con una ejecución previa de
+    calentamiento (compilación de los .pyc y caché de disco).
+
+    Retorna:
+        tuple[list[float], list[str]]: Tiempos de importación (s) y módulos de
+        MODULOS_PEREZOSOS que quedaron cargados.
+    """
+    codigo = (
+        "import sys, time, numpy\n"
+        "inicio = time.perf_counter()\n"
+        "import utilities_for_graphical_computing\n"
+        "print(time.perf_counter() - inicio)\n"
+        f"print(','.join(sorted({{m.split('.')[0] for m in sys.modules}} & {set(MODULOS_PEREZOSOS)!r})))\n"
+    )
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    entorno = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [raiz, os.environ.get("PYTHONPATH")])))
+    tiempos, cargados = [], []
+    for i in range(repeticiones + 1):
+        salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True,
+                                cwd=raiz, env=entorno).stdout.splitlines()
+        cargados = [m for m in salida[1].split(",") if m] if len(salida) > 1 else []
+        if i:
+            tiempos.append(float(salida[0]))
+    return tiempos, cargados
+
+
+def metadatos() -> dict:
+    """
+    Describe el entorno de la ejecución.
+    """
+    return {
+        "fecha": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "procesador": platform.processor(),
+        "nucleos": os.cpu_count(),
+    }
+
+
+def comparar(base: dict, nuevo: dict, umbral: float) -> tuple[list[str], list[str]]:
+    """
+    Compara dos archivos de resultados.
+
+    Se considera regresión un aumento relativo de la mediana del tiempo o de la memoria pico
+    mayor que `umbral` (p. ej., 0.1 = 10 %).
+
+    Retorna:
+        tuple[list[str], list[str]]: Líneas del informe y líneas de las regresiones.
+    """
+    anteriores = {Resultado(**r).clave: Resultado(**r) for r in base["resultados"]}
+    informe, regresiones = [], []
+    for datos in nuevo["resultados"]:
+        actual = Resultado(**datos)
+        anterior = anteriores.get(actual.clave)
+        if anterior is None:
+            informe.append(f"  nuevo      {actual.clave}")
+            continue
+        cambio_t = actual.tiempo_mediana / anterior.tiempo_mediana - 1 if anterior.tiempo_mediana else 0.0
+        cambio_m = actual.memoria_pico / anterior.memoria_pico - 1 if anterior.memoria_pico else 0.0
+        linea = (f"{actual.clave}: tiempo {anterior.tiempo_mediana * 1e3:.2f} -> {actual.tiempo_mediana * 1e3:.2f} ms "
+                 f"({cambio_t:+.1%}), memoria {anterior.memoria_pico / 2**20:.1f} -> "
+                 f"{actual.memoria_pico / 2**20:.1f} MiB ({cambio_m:+.1%})")
+        if cambio_t > umbral or cambio_m > umbral:
+            regresiones.append(linea)
+            informe.append("  REGRESIÓN " + linea)
+        elif cambio_t < -umbral:
+            informe.append("  mejora     " + linea)
+        else:
+            informe.append("  igual      " + linea)
+    return informe, regresiones
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Banco de pruebas de rendimiento.")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    run = subcomandos.add_parser("run", help="Ejecuta el banco de pruebas y guarda los resultados en JSON")
+    run.add_argument("-o", "--salida", default="benchmark.json", help="Archivo JSON de resultados")
+    run.add_argument("--tamanos", default="miniatura,vga,hd",
+                     help=f"Tamaños separados por comas ({', '.join(TAMANOS)})")
+    run.add_argument("--dtypes", default=",".join(DTYPES), help="Tipos de dato separados por comas")
+    run.add_argument("-r", "--repeticiones", type=int, default=5, help="Repeticiones cronometradas por caso")
+    run.add_argument("-k", "--filtro", default=None, help="Expresión regular sobre 'nombre parámetros'")
+
+    compare = subcomandos.add_parser("compare", help="Compara resultados con una línea base")
+    compare.add_argument("base", help="JSON de la línea base")
+    compare.add_argument("nuevo", help="JSON a comparar")
+    compare.add_argument("--umbral", type=float, default=0.1, help="Aumento relativo tolerado (0.1 = 10 %%)")
+    importacion = subcomandos.add_parser("importacion", help="Mide el tiempo de importación del paquete")
+    importacion.add_argument("-r", "--repeticiones", type=int, default=10, help="Procesos cronometrados")
+    importacion.add_argument("--limite", type=float, default=None,
+                             help="Mediana máxima tolerada en ms (falla si se supera)")
+    importacion.add_argument("-o", "--salida", default=None, help="Archivo JSON de resultados (para compare)")
+    args = parser.parse_args(argv)
+
+    if args.comando == "importacion":
+        tiempos, cargados = medir_importacion(args.repeticiones)
+        resultado = Resultado("import utilities_for_graphical_computing", "", "", "", args.repeticiones,
+                              min(tiempos), statistics.median(tiempos), 0)
+        print(f"importación: mediana {resultado.tiempo_mediana * 1e3:.1f} ms, "
+              f"mínimo {resultado.tiempo_min * 1e3:.1f} ms")
+        if args.salida:
+            with open(args.salida, "w", encoding="utf-8") as archivo:
+                json.dump({"metadatos": metadatos(), "resultados": [asdict(resultado)]}, archivo, indent=2,
+                          ensure_ascii=False)
+        fallos = [f"la importación carga {', '.join(cargados)}"] if cargados else []
+        if args.limite is not None and resultado.tiempo_mediana * 1e3 > args.limite:
+            fallos.append(f"la mediana supera el límite de {args.limite:.1f} ms")
+        for fallo in fallos:
+            print(f"REGRESIÓN: {fallo}")
+        return 1 if fallos else 0
+
+    if args.comando == "run":
+        tamanos = args.tamanos.split(",")
+        dtypes = args.dtypes.split(",")
+        desconocidos = [t for t in tamanos if t not in TAMANOS] + [d for d in dtypes if d not in DTYPES]
+        if desconocidos:
+            parser.error(f"Valores no reconocidos: {', '.join(desconocidos)}")
+        resultados = []
+        for resultado in ejecutar(tamanos, dtypes, args.repeticiones, args.filtro):
+            print(f"{resultado.clave}: {resultado.tiempo_mediana * 1e3:.2f} ms, "
+                  f"{resultado.memoria_pico / 2**20:.1f} MiB", file=sys.stderr)
+            resultados.append(asdict(resultado))
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump({"metadatos": metadatos(), "resultados": resultados}, archivo, indent=2, ensure_ascii=False)
+        return 0
+
+    with open(args.base, encoding="utf-8") as archivo:
+        base = json.load(archivo)
+    with open(args.nuevo, encoding="utf-8") as archivo:
+        nuevo = json.load(archivo)
+    informe, regresiones = comparar(base, nuevo, args.umbral)
+    print("\n".join(informe))
+    print(f"\n{len(regresiones)} regresiones (umbral {args.umbral:.0%})")
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,36 +2,6 @@ from utilities_for_graphical_computing import Imagen, SimpleImageViewer
 import numpy as np
 
 
-def colorear_region(imagen: Imagen, rows, cols, color: list[int]) -> Imagen:
-    """
-    Colorea una región de la imagen especificada por filas y columnas.
-    Los parámetros 'rows' y 'cols' pueden ser índices individuales o slices.
-    
-    Parámetros:
-        imagen (Imagen): Instancia de Imagen.
-        rows (int o slice): Índice o rango de filas a colorear.
-        cols (int o slice): Índice o rango de columnas a colorear.
-        color (list[int]): Lista de valores de color (la longitud debe coincidir con el número de canales).
-    
-    Retorna:
-        Imagen: La misma instancia con la región coloreada.
-    """
-    # Convertir rows a lista de índices
-    if isinstance(rows, slice):
-        rows = list(range(*rows.indices(imagen.datos.shape[0])))
-    elif isinstance(rows, int):
-        rows = [rows]
-    # Convertir cols a lista de índices
-    if isinstance(cols, slice):
-        cols = list(range(*cols.indices(imagen.datos.shape[1])))
-    elif isinstance(cols, int):
-        cols = [cols]
-    for r in rows:
-        for c in cols:
-            imagen.colorear_pixel(r, c, color)
-    return imagen
-
-
 def matriz3x3Personalizada():
     """
     Genera y retorna una matriz 3x3 con valores personalizados.
@@ -59,16 +29,16 @@ def matriz6x11PantallaTelevision():
         np.ndarray: Arreglo de imagen resultante.
     """
     imagen = Imagen(np.zeros((8, 11, 3), dtype=float))
-    # Asignar barras de color utilizando la función auxiliar para colorear regiones
-    colorear_region(imagen, slice(0, 6), 0, [1, 1, 0])        # barra amarilla
-    colorear_region(imagen, slice(0, 6), slice(1, 3), [0, 1, 1])  # barra cyan
-    colorear_region(imagen, slice(0, 6), slice(3, 5), [0, 1, 0])  # barra verde
-    colorear_region(imagen, slice(0, 6), slice(5, 7), [1, 0, 1])  # barra magenta
-    colorear_region(imagen, slice(0, 6), slice(7, 9), [1, 0, 0])  # barra roja
-    colorear_region(imagen, slice(0, 6), slice(9, 11), [0, 0, 1]) # barra azul
-    # Asignar la barra de escala de grises
-    for i in range(8):
-        colorear_region(imagen, slice(6, 8), i, [(7 - i) / 7] * 3)
+    # Asignar barras de color; cada región se pinta con una sola asignación vectorizada
+    imagen.colorear_region(slice(0, 6), 0, [1, 1, 0])             # barra amarilla
+    imagen.colorear_region(slice(0, 6), slice(1, 3), [0, 1, 1])   # barra cyan
+    imagen.colorear_region(slice(0, 6), slice(3, 5), [0, 1, 0])   # barra verde
+    imagen.colorear_region(slice(0, 6), slice(5, 7), [1, 0, 1])   # barra magenta
+    imagen.colorear_region(slice(0, 6), slice(7, 9), [1, 0, 0])   # barra roja
+    imagen.colorear_region(slice(0, 6), slice(9, 11), [0, 0, 1])  # barra azul
+    # Asignar la barra de escala de grises: un color por columna, difundido sobre las filas
+    grises = np.repeat((np.arange(7, -1, -1) / 7)[:, np.newaxis], 3, axis=1)
+    imagen.colorear_region(slice(6, 8), slice(0, 8), grises)
     return imagen.datos * 0.6
 
 
@@ -80,15 +50,19 @@ if __name__ == "__main__":
     # Cargar y procesar la imagen "paris.jpg"
     paris = Imagen.desde_archivo("paris.jpg").normalizar()
 
-    # Crear copias para cada operación, de modo que no se modifique la imagen original
-    paris_invertida = Imagen(paris.datos.copy()).invertir().datos
-    paris_roja = Imagen(paris.datos.copy()).extraer_capa_rgb(0)
-    paris_verda = Imagen(paris.datos.copy()).extraer_capa_rgb(1)
-    paris_azul = Imagen(paris.datos.copy()).extraer_capa_rgb(2)
-    paris_cyan = Imagen(paris.datos.copy()).extraer_capa_cmyk(0)
-    paris_magenta = Imagen(paris.datos.copy()).extraer_capa_cmyk(1)
-    paris_yellow = Imagen(paris.datos.copy()).extraer_capa_cmyk(2)
-    paris_black = Imagen(paris.datos.copy()).extraer_capa_cmyk(3)
+    # Las operaciones en sitio se ejecutan con inplace=False para no modificar la imagen original.
+    paris_invertida = paris.invertir(inplace=False).datos
+
+    # Separaciones completas en una sola llamada; las versiones de 3 canales se construyen al pedirlas.
+    separacion_rgb = paris.separar_rgb()
+    separacion_cmyk = paris.separar_cmyk()
+    paris_roja = separacion_rgb.visualizar("R")
+    paris_verda = separacion_rgb.visualizar("G")
+    paris_azul = separacion_rgb.visualizar("B")
+    paris_cyan = separacion_cmyk.visualizar("C")
+    paris_magenta = separacion_cmyk.visualizar("M")
+    paris_yellow = separacion_cmyk.visualizar("Y")
+    paris_black = separacion_cmyk.visualizar("K")
 
     paris_original_rgb = Imagen.fusionar([paris_roja, paris_verda, paris_azul]).datos
     paris_original_cmyk = Imagen.fusionar_ecualizado([
@@ -98,12 +72,12 @@ if __name__ == "__main__":
         (paris_black, 0.202)
     ]).datos
 
-    paris_alto_contraste = Imagen(paris.datos.copy()).ajustar(-0.8).desnormalizar().datos
-    paris_alta_intensidad = Imagen(paris.datos.copy()).ajustar(0.8).desnormalizar().datos
-    paris_mean = Imagen(paris.datos.copy()).mean_filter(3).datos
-    paris_gray_mean = Imagen(paris.datos.copy()).gris_promedio().datos
-    paris_gray_lum = Imagen(paris.datos.copy()).gris_luminosidad().datos
-    paris_gray_ton = Imagen(paris.datos.copy()).gris_tonalidad().datos
+    paris_alto_contraste = paris.ajustar(-0.8, inplace=False).desnormalizar().datos
+    paris_alta_intensidad = paris.ajustar(0.8, inplace=False).desnormalizar().datos
+    paris_mean = paris.mean_filter(3, inplace=False).datos
+    paris_gray_mean = paris.gris_promedio().datos
+    paris_gray_lum = paris.gris_luminosidad().datos
+    paris_gray_ton = paris.gris_tonalidad().datos
 
     # Preparar diccionario de imágenes para visualizar
     images = {
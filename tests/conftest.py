@@ -0,0 +1,22 @@
+"""
+Configuración común de las pruebas (desde la raíz del repositorio: python -m pytest -q tests).
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def imagen_uint8() -> np.ndarray:
+    """Imagen RGB uint8 aleatoria de tamaño no múltiplo de las teselas."""
+    return np.random.default_rng(0).integers(0, 256, size=(37, 53, 3), dtype=np.uint8)
+
+
+@pytest.fixture
+def imagen_float() -> np.ndarray:
+    """Imagen RGB float32 aleatoria en [0, 1]."""
+    return np.random.default_rng(1).random((37, 53, 3), dtype=np.float32)
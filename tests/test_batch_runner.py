@@ -0,0 +1,45 @@
+import os
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from utilities_for_graphical_computing import Imagen
+from utilities_for_graphical_computing.BatchRunner import _interpretar_operacion, procesar_lote
+from utilities_for_graphical_computing.ImageProcessor import _datos_uint8
+
+
+@pytest.mark.parametrize("texto, esperado", [
+    ("normalizar", ("normalizar",)),
+    ("ajustar:-0.8", ("ajustar", -0.8)),
+    ("mean_filter:(3,5)", ("mean_filter", (3, 5))),
+    ("colorear_pixel:10,20,[255,0,0]", ("colorear_pixel", 10, 20, [255, 0, 0])),
+    ("dibujar_poligono:[(1,2),(3,4),(5,1)],(0,255,0)", ("dibujar_poligono", [(1, 2), (3, 4), (5, 1)], (0, 255, 0))),
+    ("redimensionar:(64,64),None,area", ("redimensionar", (64, 64), None, "area")),
+    ("guardar:'a,b.png'", ("guardar", "a,b.png")),
+])
+def test_interpretar_operacion(texto, esperado):
+    assert _interpretar_operacion(texto) == esperado
+
+
+def _escribir(ruta: str, datos: np.ndarray) -> None:
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    Image.fromarray(datos).save(ruta)
+
+
+def test_lote_conserva_rutas_relativas_y_detecta_colisiones(tmp_path, imagen_uint8):
+    entrada, salida = tmp_path / "fotos", tmp_path / "salida"
+    for nombre in ("a/x.png", "b/x.png", "a/y.png", "a/y.bmp"):
+        _escribir(str(entrada / nombre), imagen_uint8)
+    operaciones = [("invertir",)]
+    resultado = procesar_lote(str(entrada / "**" / "*.*"), operaciones, str(salida), trabajadores=2, formato="png")
+
+    assert len(resultado.procesados) == 3
+    assert len(resultado.fallidos) == 1
+    assert os.path.basename(next(iter(resultado.fallidos))) in ("y.png", "y.bmp")
+    for relativa in ("a/x.png", "b/x.png", "a/y.png"):
+        assert os.path.exists(salida / relativa)
+    esperado = Imagen.desde_archivo(str(entrada / "a/x.png")).aplicar_operaciones(operaciones)
+    for relativa in ("a/x.png", "b/x.png"):
+        obtenido = Imagen.desde_archivo(str(salida / relativa))
+        np.testing.assert_array_equal(_datos_uint8(obtenido.datos), _datos_uint8(esperado.datos))
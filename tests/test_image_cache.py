@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from utilities_for_graphical_computing import Imagen
+from utilities_for_graphical_computing.ImageCache import CacheImagenes
+
+
+def test_mascaras_distintas_no_comparten_entrada(imagen_uint8):
+    # Las máscaras difieren en un píxel que el repr de NumPy abrevia.
+    mascara_a = np.zeros(imagen_uint8.shape[:2], dtype=bool)
+    mascara_b = mascara_a.copy()
+    mascara_b[18, 26] = True
+    cache = CacheImagenes()
+    imagen = Imagen(imagen_uint8)
+    a = cache.aplicar(imagen, [("colorear_mascara", mascara_a, [255, 0, 0])]).datos
+    b = cache.aplicar(imagen, [("colorear_mascara", mascara_b, [255, 0, 0])]).datos
+    assert cache.estadisticas.fallos == 2
+    esperado = Imagen(imagen_uint8.copy()).colorear_mascara(mascara_b, [255, 0, 0]).datos
+    np.testing.assert_array_equal(b, esperado)
+    assert not np.array_equal(a, b)
+
+
+def test_factores_cercanos_no_comparten_entrada(imagen_float):
+    cache = CacheImagenes()
+    imagen = Imagen(imagen_float)
+    cache.aplicar(imagen, [("ajustar", 0.5)])
+    cache.aplicar(imagen, [("ajustar", float(np.nextafter(0.5, 1.0)))])
+    assert cache.estadisticas.fallos == 2
+
+
+def test_aplicar_no_modifica_la_imagen_del_llamador(imagen_uint8):
+    original = imagen_uint8.copy()
+    imagen = Imagen(imagen_uint8)
+    cache = CacheImagenes()
+    resultado = cache.aplicar(imagen, [("colorear_pixel", 1, 2, [1, 2, 3])])
+    np.testing.assert_array_equal(imagen.datos, original)
+    assert imagen.datos.flags.writeable
+    np.testing.assert_array_equal(resultado.datos, Imagen(original).colorear_pixel(1, 2, [1, 2, 3]).datos)
+
+
+def test_resultado_reutilizado_igual_al_calculo_inmediato(imagen_uint8):
+    cadena = [("normalizar",), ("mean_filter", 3)]
+    cache = CacheImagenes()
+    primero = cache.aplicar(Imagen(imagen_uint8), cadena).datos
+    segundo = cache.aplicar(Imagen(imagen_uint8.copy()), cadena).datos
+    assert cache.estadisticas.aciertos == 1
+    esperado = Imagen(imagen_uint8.copy()).aplicar_operaciones(cadena).datos
+    np.testing.assert_array_equal(primero, esperado)
+    np.testing.assert_array_equal(segundo, esperado)
+
+
+def test_argumento_no_serializable_se_rechaza(imagen_uint8):
+    with pytest.raises(ValueError):
+        CacheImagenes().aplicar(Imagen(imagen_uint8), [("ajustar", object())])
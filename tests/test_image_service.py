@@ -0,0 +1,70 @@
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from utilities_for_graphical_computing import Imagen
+from utilities_for_graphical_computing.ImageProcessor import _datos_uint8
+from utilities_for_graphical_computing.ImageService import ClienteLocal, ServicioImagenes, _codificar
+
+
+def _ejecutar(corrutina_servicio):
+    async def principal():
+        async with ServicioImagenes(ejecutor=ThreadPoolExecutor(2), espera_lote=0.02) as servicio:
+            return await corrutina_servicio(servicio)
+    return asyncio.run(principal())
+
+
+def _esperado(datos: np.ndarray, operaciones) -> np.ndarray:
+    fuente = Imagen.desde_archivo(io.BytesIO(_codificar(Imagen(datos), "png")))
+    return _datos_uint8(fuente.aplicar_operaciones(operaciones).datos)
+
+
+def test_lote_igual_a_cada_imagen_por_separado():
+    rng = np.random.default_rng(2)
+    imagenes = [rng.integers(0, 256, size=(24, 32, 3), dtype=np.uint8) for _ in range(4)]
+    operaciones = [("normalizar",), ("mean_filter", 3), ("gris_luminosidad",)]
+
+    async def cuerpo(servicio):
+        resultados = await ClienteLocal(servicio).procesar_varias([Imagen(d) for d in imagenes], operaciones)
+        return resultados, servicio.estadisticas()
+
+    resultados, estadisticas = _ejecutar(cuerpo)
+    for datos, resultado in zip(imagenes, resultados):
+        np.testing.assert_array_equal(resultado.datos, _esperado(datos, operaciones))
+    assert estadisticas.completados == 4
+    assert estadisticas.lotes < 4
+
+
+def test_mascara_como_argumento(imagen_uint8):
+    mascara = np.zeros(imagen_uint8.shape[:2], dtype=bool)
+    mascara[5:9, 7:20] = True
+    operaciones = [("colorear_mascara", mascara, [255, 0, 0])]
+
+    async def cuerpo(servicio):
+        return await ClienteLocal(servicio).procesar(Imagen(imagen_uint8), operaciones)
+
+    np.testing.assert_array_equal(_ejecutar(cuerpo).datos, _esperado(imagen_uint8, operaciones))
+
+
+def test_argumento_no_hashable_no_detiene_el_servicio(imagen_uint8):
+    async def cuerpo(servicio):
+        cliente = ClienteLocal(servicio)
+        with pytest.raises(ValueError):
+            await cliente.procesar(Imagen(imagen_uint8), [("colorear_pixel", 1, 1, {"rojo": 255})])
+        return await cliente.procesar(Imagen(imagen_uint8), [("invertir",)], tiempo_espera=5)
+
+    resultado = _ejecutar(cuerpo)
+    np.testing.assert_array_equal(resultado.datos, _esperado(imagen_uint8, [("invertir",)]))
+
+
+@pytest.mark.parametrize("operacion", [("guardar", "x.png"), ("desde_npy", "x.npy"), ("__class__",)])
+def test_operacion_no_permitida(imagen_uint8, operacion):
+    async def cuerpo(servicio):
+        with pytest.raises(ValueError):
+            await ClienteLocal(servicio).procesar(Imagen(imagen_uint8), [operacion])
+        return servicio.estadisticas()
+
+    assert _ejecutar(cuerpo).recibidos == 0
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from utilities_for_graphical_computing import Imagen
+from utilities_for_graphical_computing.Convolution import FiltroGaussiano, FiltroSobel
+from utilities_for_graphical_computing.TiledExecutor import EjecutorTeselas
+
+
+@pytest.mark.parametrize("modo", ["constant", "edge", "reflect", "symmetric", "wrap"])
+def test_filtro_por_teselas_igual_a_imagen_completa(imagen_float, modo):
+    filtro = FiltroGaussiano(1.0, modo=modo)
+    esperado = filtro.aplicar(Imagen(imagen_float.copy())).datos
+    resultado = EjecutorTeselas((16, 16)).ejecutar(Imagen(imagen_float.copy()), filtro).datos
+    np.testing.assert_allclose(resultado, esperado, rtol=0, atol=1e-6)
+
+
+def test_bordes_por_teselas_igual_a_imagen_completa(imagen_uint8):
+    filtro = FiltroSobel()
+    esperado = filtro.aplicar(Imagen(imagen_uint8.copy())).datos
+    resultado = EjecutorTeselas((10, 12)).ejecutar(Imagen(imagen_uint8.copy()), filtro).datos
+    np.testing.assert_array_equal(resultado, esperado)
+
+
+def test_cadena_por_teselas_igual_a_imagen_completa(imagen_uint8):
+    cadena = [("normalizar",), ("mean_filter", 5), ("invertir",), ("gris_luminosidad",)]
+    esperado = Imagen(imagen_uint8.copy()).aplicar_operaciones(cadena).datos
+    resultado = EjecutorTeselas((16, 16)).ejecutar(Imagen(imagen_uint8.copy()), cadena).datos
+    np.testing.assert_allclose(resultado, esperado, rtol=0, atol=1e-6)
+
+
+def test_funcion_con_halo_explicito(imagen_uint8):
+    def funcion(imagen):
+        return imagen.mean_filter(3, inplace=False)
+    esperado = funcion(Imagen(imagen_uint8.copy())).datos
+    resultado = EjecutorTeselas((16, 16)).ejecutar(Imagen(imagen_uint8.copy()), funcion, halo=1).datos
+    np.testing.assert_array_equal(resultado, esperado)
+
+
+def test_salida_en_archivo_mapeado(tmp_path, imagen_float):
+    filtro = FiltroGaussiano(1.0)
+    esperado = filtro.aplicar(Imagen(imagen_float.copy())).datos
+    ruta = str(tmp_path / "salida.npy")
+    resultado = EjecutorTeselas((16, 16)).ejecutar(Imagen(imagen_float.copy()), filtro, salida=ruta)
+    np.testing.assert_allclose(np.load(ruta), esperado, rtol=0, atol=1e-6)
+    assert isinstance(resultado.datos, np.memmap)
+
+
+def test_funcion_sin_halo_se_rechaza(imagen_uint8):
+    with pytest.raises(ValueError):
+        EjecutorTeselas().ejecutar(Imagen(imagen_uint8), lambda imagen: imagen)
+
+
+@pytest.mark.parametrize("cadena", [[("ecualizar",)], [("normalizar",), ("redimensionar", (10, 10))]])
+def test_cadena_con_operacion_global_se_rechaza(imagen_uint8, cadena):
+    with pytest.raises(ValueError):
+        EjecutorTeselas().ejecutar(Imagen(imagen_uint8), cadena, halo=2)
+
+
+def test_modo_estadistico_se_rechaza(imagen_float):
+    with pytest.raises(ValueError):
+        EjecutorTeselas((16, 16)).ejecutar(Imagen(imagen_float), FiltroGaussiano(1.0, modo="mean"))
@@ -0,0 +1,222 @@
+import argparse
+import ast
+import glob
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Sequence
+
+from . import Precision
+from .ImageProcessor import Imagen
+
+# Función de progreso: (completados, total, ruta, error o None).
+CallbackProgreso = Callable[[int, int, str, Optional[str]], None]
+
+
+@dataclass
+class ResultadoLote:
+    """
+    Resumen de una ejecución por lotes.
+
+    Atributos:
+        procesados (dict[str, str]): Ruta de entrada -> ruta de salida de cada archivo exitoso.
+        fallidos (dict[str, str]): Ruta de entrada -> mensaje de error de cada archivo fallido.
+    """
+    procesados: dict[str, str] = field(default_factory=dict)
+    fallidos: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return len(self.procesados) + len(self.fallidos)
+
+
+def _raiz_patron(patron: str) -> str:
+    """
+    Directorio fijo de un patrón glob: sus componentes iniciales sin comodines.
+    """
+    raiz = os.path.dirname(patron)
+    while glob.has_magic(raiz):
+        raiz = os.path.dirname(raiz)
+    return raiz
+
+
+def _ruta_salida(ruta: str, raiz: str, directorio_salida: str, formato: Optional[str]) -> str:
+    """
+    Calcula la ruta de salida conservando la ruta del archivo relativa a la raíz del patrón
+    (los archivos de subdirectorios distintos no se sobrescriben entre sí).
+    """
+    nombre, extension = os.path.splitext(os.path.relpath(ruta, raiz or os.curdir))
+    if formato:
+        extension = "." + formato.lstrip(".")
+    return os.path.join(directorio_salida, nombre + extension)
+
+
+def _procesar_archivo(ruta: str, operaciones: Sequence[Sequence], destino: str, precision: str) -> str:
+    """
+    Decodifica, procesa y codifica un archivo (se ejecuta en un proceso trabajador, con la
+    política de precisión de quien llamó a procesar_lote).
+    """
+    os.makedirs(os.path.dirname(destino) or os.curdir, exist_ok=True)
+    with Precision.usar_precision(precision):
+        Imagen.desde_archivo(ruta).aplicar_operaciones(operaciones).guardar(destino)
+    return destino
+
+
+def procesar_lote(patron: str, operaciones: Sequence[Sequence], directorio_salida: str,
+                  trabajadores: Optional[int] = None, max_en_vuelo: Optional[int] = None,
+                  formato: Optional[str] = None, progreso: Optional[CallbackProgreso] = None) -> ResultadoLote:
+    """
+    Procesa en paralelo todos los archivos que coinciden con un patrón glob.
+
+    Cada archivo se carga con Imagen.desde_archivo, se le aplica la cadena de operaciones
+    (ver Imagen.aplicar_operaciones) y se guarda en el directorio de salida. La decodificación,
+    el procesamiento y la codificación se ejecutan en un grupo de procesos. El número de
+    tareas enviadas y no terminadas se limita a `max_en_vuelo`, de modo que la memoria no
+    crece con el número de archivos. Los errores de un archivo se registran sin detener el lote.
+
+    Las salidas conservan la ruta de cada archivo relativa a la parte fija del patrón
+    (p. ej., 'fotos/**/*.jpg' escribe 'fotos/a/x.jpg' en '<salida>/a/x.jpg'). Si dos archivos
+    producen la misma salida (p. ej., 'x.jpg' y 'x.png' con formato='png'), solo se procesa
+    el primero y los demás se registran como fallidos.
+
+    Parámetros:
+        patron (str): Patrón glob de entrada (admite '**' recursivo).
+        operaciones (Sequence[Sequence]): Cadena de operaciones, p. ej. [('ajustar', -0.8)].
+        directorio_salida (str): Directorio de destino (se crea si no existe).
+        trabajadores (int | None): Número de procesos (por defecto, uno por núcleo).
+        max_en_vuelo (int | None): Máximo de tareas pendientes (por defecto, 2 por trabajador).
+        formato (str | None): Extensión de salida (p. ej., 'png'); por defecto la de entrada.
+        progreso (CallbackProgreso | None): Función llamada al terminar cada archivo.
+
+    Retorna:
+        ResultadoLote: Archivos procesados y fallidos.
+    """
+    rutas = sorted(glob.glob(patron, recursive=True))
+    os.makedirs(directorio_salida, exist_ok=True)
+    raiz = _raiz_patron(patron)
+    destinos: dict[str, str] = {}
+    duplicados: dict[str, str] = {}
+    for ruta in rutas:
+        destino = _ruta_salida(ruta, raiz, directorio_salida, formato)
+        clave = os.path.normcase(os.path.abspath(destino))
+        if clave in destinos:
+            duplicados[ruta] = f"ValueError: La salida {destino} coincide con la de {destinos[clave]}"
+        else:
+            destinos[clave] = ruta
+    trabajadores = trabajadores or os.cpu_count() or 1
+    max_en_vuelo = max_en_vuelo or 2 * trabajadores
+    operaciones = [tuple(op) for op in operaciones]
+    precision = Precision.obtener_precision().nombre
+    resultado = ResultadoLote()
+    total = len(rutas)
+    for ruta, error in duplicados.items():
+        resultado.fallidos[ruta] = error
+        if progreso is not None:
+            progreso(resultado.total, total, ruta, error)
+
+    with ProcessPoolExecutor(max_workers=trabajadores) as pool:
+        pendientes: dict[Future, str] = {}
+        siguientes = (ruta for ruta in rutas if ruta not in duplicados)
+        agotado = False
+        while pendientes or not agotado:
+            while not agotado and len(pendientes) < max_en_vuelo:
+                ruta = next(siguientes, None)
+                if ruta is None:
+                    agotado = True
+                    break
+                destino = _ruta_salida(ruta, raiz, directorio_salida, formato)
+                pendientes[pool.submit(_procesar_archivo, ruta, operaciones, destino, precision)] = ruta
+            if not pendientes:
+                break
+            terminados, _ = wait(pendientes, return_when=FIRST_COMPLETED)
+            for futuro in terminados:
+                ruta = pendientes.pop(futuro)
+                error = None
+                try:
+                    resultado.procesados[ruta] = futuro.result()
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                    resultado.fallidos[ruta] = error
+                if progreso is not None:
+                    progreso(resultado.total, total, ruta, error)
+    return resultado
+
+
+def _separar_argumentos(texto: str) -> list[str]:
+    """
+    Separa los argumentos por las comas de primer nivel (fuera de paréntesis, corchetes,
+    llaves y comillas).
+    """
+    partes, actual, profundidad, comilla = [], [], 0, None
+    for caracter in texto:
+        if comilla:
+            comilla = None if caracter == comilla else comilla
+        elif caracter in "'\"":
+            comilla = caracter
+        elif caracter in "([{":
+            profundidad += 1
+        elif caracter in ")]}":
+            profundidad -= 1
+        elif caracter == "," and profundidad == 0:
+            partes.append("".join(actual))
+            actual = []
+            continue
+        actual.append(caracter)
+    partes.append("".join(actual))
+    return [parte.strip() for parte in partes if parte.strip()]
+
+
+def _interpretar_operacion(texto: str) -> tuple:
+    """
+    Convierte 'nombre:arg1,arg2' en ('nombre', arg1, arg2), interpretando literales de Python
+    (p. ej., 'mean_filter:(3,5)' -> ('mean_filter', (3, 5))). Las palabras sueltas que no son
+    literales (p. ej., 'area' en 'redimensionar:(64,64),None,area') se conservan como texto.
+    """
+    nombre, _, argumentos = texto.partition(":")
+    if not argumentos.strip():
+        return (nombre,)
+    try:
+        return (nombre, *ast.literal_eval(f"({argumentos},)"))
+    except (ValueError, SyntaxError):
+        pass
+    valores = []
+    for argumento in _separar_argumentos(argumentos):
+        try:
+            valores.append(ast.literal_eval(argumento))
+        except (ValueError, SyntaxError):
+            valores.append(argumento)
+    return (nombre, *valores)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Punto de entrada de línea de comandos para el procesamiento por lotes.
+
+    Ejemplo:
+        python -m utilities_for_graphical_computing.BatchRunner "fotos/*.jpg" salida \\
+            -o normalizar -o ajustar:-0.8 -o desnormalizar -j 8
+    """
+    parser = argparse.ArgumentParser(description="Procesa imágenes por lotes en paralelo.")
+    parser.add_argument("entrada", help="Patrón glob de los archivos de entrada")
+    parser.add_argument("salida", help="Directorio de salida")
+    parser.add_argument("-o", "--operacion", action="append", default=[],
+                        help="Operación 'nombre:arg1,arg2' (se puede repetir, se aplican en orden)")
+    parser.add_argument("-j", "--trabajadores", type=int, default=None, help="Número de procesos")
+    parser.add_argument("--max-en-vuelo", type=int, default=None, help="Máximo de tareas pendientes")
+    parser.add_argument("--formato", default=None, help="Extensión de salida (p. ej., png)")
+    args = parser.parse_args(argv)
+
+    def informar(completados: int, total: int, ruta: str, error: Optional[str]) -> None:
+        estado = f"ERROR {error}" if error else "ok"
+        print(f"[{completados}/{total}] {ruta}: {estado}", file=sys.stderr)
+
+    operaciones = [_interpretar_operacion(op) for op in args.operacion]
+    resultado = procesar_lote(args.entrada, operaciones, args.salida, args.trabajadores,
+                              args.max_en_vuelo, args.formato, informar)
+    print(f"Procesados: {len(resultado.procesados)}, fallidos: {len(resultado.fallidos)}", file=sys.stderr)
+    return 1 if resultado.fallidos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
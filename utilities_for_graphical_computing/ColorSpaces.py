@@ -0,0 +1,189 @@
+from typing import Callable, Optional
+import numpy as np
+
+# Tamaño por defecto de los bloques de píxeles procesados de una vez (cabe en caché L2).
+BLOQUE_BYTES = 256 * 1024
+
+# Un núcleo de conversión lee un bloque (n x canales_entrada) float32 y escribe su resultado
+# en `out` (n x canales_salida). Puede modificar el bloque de entrada.
+Nucleo = Callable[[np.ndarray, np.ndarray], None]
+
+# Coeficientes BT.601 (rango completo, como en JPEG) para YCbCr.
+_RGB_A_YCBCR = np.array([
+    [0.299, 0.587, 0.114],
+    [-0.168736, -0.331264, 0.5],
+    [0.5, -0.418688, -0.081312],
+], dtype=np.float32)
+_YCBCR_A_RGB = np.linalg.inv(_RGB_A_YCBCR.astype(np.float64)).astype(np.float32)
+
+# sRGB lineal <-> CIE XYZ (iluminante D65), con el punto blanco ya normalizado.
+_BLANCO_D65 = np.array([0.95047, 1.0, 1.08883])
+_RGB_A_XYZ = (np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+]) / _BLANCO_D65[:, np.newaxis]).astype(np.float32)
+_XYZ_A_RGB = np.linalg.inv(_RGB_A_XYZ.astype(np.float64)).astype(np.float32)
+_DELTA = 6.0 / 29.0
+
+
+def convertir_por_bloques(datos: np.ndarray, nucleo: Nucleo, canales_salida: int, escala: float = 1.0,
+                          out: Optional[np.ndarray] = None, bloque_bytes: int = BLOQUE_BYTES) -> np.ndarray:
+    """
+    Aplica un núcleo de conversión de color por bloques de píxeles en float32.
+
+    Los datos se recorren en bloques de tamaño acotado: cada bloque se convierte a float32
+    (aplicando `escala`) en un búfer reutilizado y el núcleo escribe directamente en la
+    región correspondiente de la salida, de modo que los temporales nunca superan el
+    tamaño de un bloque.
+
+    Parámetros:
+        datos (np.ndarray): Arreglo (..., canales_entrada).
+        nucleo (Nucleo): Función de conversión por bloque.
+        canales_salida (int): Número de canales del resultado.
+        escala (float): Factor aplicado a la entrada (p. ej., 1/255 para datos en [0, 255]).
+        out (np.ndarray | None): Arreglo float32 C-contiguo preasignado para el resultado.
+        bloque_bytes (int): Tamaño aproximado de cada bloque.
+
+    Retorna:
+        np.ndarray: Resultado float32 de forma (..., canales_salida).
+
+    Raises:
+        ValueError: Si `out` no tiene la forma o el tipo esperados.
+    """
+    forma = datos.shape[:-1] + (canales_salida,)
+    if out is None:
+        out = np.empty(forma, dtype=np.float32)
+    elif out.shape != forma or out.dtype != np.float32 or not out.flags.c_contiguous:
+        raise ValueError(f"La salida debe ser un arreglo float32 C-contiguo de forma {forma}")
+    entrada = datos.reshape(-1, datos.shape[-1])
+    salida = out.reshape(-1, canales_salida)
+    pixeles = max(1, bloque_bytes // (4 * max(datos.shape[-1], canales_salida)))
+    bufer = np.empty((min(pixeles, len(entrada)), datos.shape[-1]), dtype=np.float32)
+    for inicio in range(0, len(entrada), pixeles):
+        fin = min(inicio + pixeles, len(entrada))
+        bloque = bufer[:fin - inicio]
+        np.multiply(entrada[inicio:fin], escala, out=bloque, casting="unsafe")
+        nucleo(bloque, salida[inicio:fin])
+    return out
+
+
+def rgb_a_cmyk(rgb: np.ndarray, out: np.ndarray) -> None:
+    """
+    RGB [0, 1] -> CMYK [0, 1]. Reutiliza 1 - K (= máximo de los canales) para C, M y Y.
+    """
+    uno_menos_k = np.max(rgb, axis=-1)
+    np.subtract(1, uno_menos_k, out=out[:, 3])
+    inverso = np.divide(1, uno_menos_k, out=np.zeros_like(uno_menos_k), where=uno_menos_k > 0)
+    for canal in range(3):
+        # (1 - X - K) / (1 - K) == (max - X) / max
+        np.subtract(uno_menos_k, rgb[:, canal], out=out[:, canal])
+        out[:, canal] *= inverso
+
+
+def cmyk_a_rgb(cmyk: np.ndarray, out: np.ndarray) -> None:
+    """
+    CMYK [0, 1] -> RGB [0, 1]. Reutiliza 1 - K para los tres canales.
+    """
+    uno_menos_k = np.subtract(1, cmyk[:, 3])
+    for canal in range(3):
+        np.subtract(1, cmyk[:, canal], out=out[:, canal])
+        out[:, canal] *= uno_menos_k
+
+
+def rgb_a_hsv(rgb: np.ndarray, out: np.ndarray) -> None:
+    """
+    RGB [0, 1] -> HSV con H, S y V en [0, 1].
+    """
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    v = np.max(rgb, axis=-1, out=out[:, 2])
+    delta = v - np.min(rgb, axis=-1)
+    np.divide(delta, v, out=out[:, 1], where=v > 0)
+    out[:, 1][v <= 0] = 0
+    h = out[:, 0]
+    h[...] = 0
+    con_tono = delta > 0
+    inverso = np.divide(1, delta, out=np.zeros_like(delta), where=con_tono)
+    es_r = con_tono & (r == v)
+    es_g = con_tono & (g == v) & ~es_r
+    es_b = con_tono & ~es_r & ~es_g
+    h[es_r] = ((g - b) * inverso)[es_r]
+    h[es_g] = (2 + (b - r) * inverso)[es_g]
+    h[es_b] = (4 + (r - g) * inverso)[es_b]
+    h /= 6
+    np.mod(h, 1, out=h)
+
+
+def hsv_a_rgb(hsv: np.ndarray, out: np.ndarray) -> None:
+    """
+    HSV [0, 1] -> RGB [0, 1].
+    """
+    h, s, v = hsv[:, 0], hsv[:, 1], hsv[:, 2]
+    h6 = np.mod(h, 1) * 6
+    sector = np.floor(h6)
+    f = h6 - sector
+    sector = sector.astype(np.int8) % 6
+    p = v * (1 - s)
+    q = v * (1 - s * f)
+    t = v * (1 - s * (1 - f))
+    # Componentes (R, G, B) de cada uno de los seis sectores del hexágono de tono.
+    tabla = ((v, t, p), (q, v, p), (p, v, t), (p, q, v), (t, p, v), (v, p, q))
+    for canal in range(3):
+        np.choose(sector, [componentes[canal] for componentes in tabla], out=out[:, canal])
+
+
+def rgb_a_ycbcr(rgb: np.ndarray, out: np.ndarray) -> None:
+    """
+    RGB [0, 1] -> YCbCr BT.601 de rango completo, con Y, Cb y Cr en [0, 1].
+    """
+    np.matmul(rgb, _RGB_A_YCBCR.T, out=out)
+    out[:, 1:] += 0.5
+
+
+def ycbcr_a_rgb(ycbcr: np.ndarray, out: np.ndarray) -> None:
+    """
+    YCbCr BT.601 de rango completo [0, 1] -> RGB [0, 1] (recortado al rango válido).
+    """
+    ycbcr[:, 1:] -= 0.5
+    np.matmul(ycbcr, _YCBCR_A_RGB.T, out=out)
+    np.clip(out, 0, 1, out=out)
+
+
+def rgb_a_lab(rgb: np.ndarray, out: np.ndarray) -> None:
+    """
+    sRGB [0, 1] -> CIE L*a*b* (D65), con L en [0, 100] y a, b aproximadamente en [-128, 127].
+    """
+    lineal = rgb
+    bajo = lineal <= 0.04045
+    np.copyto(lineal, np.power((lineal + 0.055) / 1.055, 2.4), where=~bajo)
+    np.divide(lineal, 12.92, out=lineal, where=bajo)
+    xyz = np.matmul(lineal, _RGB_A_XYZ.T)
+    lineal_f = xyz > _DELTA ** 3
+    np.copyto(xyz, np.cbrt(xyz), where=lineal_f)
+    np.copyto(xyz, xyz / (3 * _DELTA ** 2) + 4.0 / 29.0, where=~lineal_f)
+    fx, fy, fz = xyz[:, 0], xyz[:, 1], xyz[:, 2]
+    np.multiply(fy, 116, out=out[:, 0])
+    out[:, 0] -= 16
+    np.subtract(fx, fy, out=out[:, 1])
+    out[:, 1] *= 500
+    np.subtract(fy, fz, out=out[:, 2])
+    out[:, 2] *= 200
+
+
+def lab_a_rgb(lab: np.ndarray, out: np.ndarray) -> None:
+    """
+    CIE L*a*b* (D65) -> sRGB [0, 1] (recortado al rango válido).
+    """
+    fy = (lab[:, 0] + 16) / 116
+    f = np.empty_like(lab)
+    f[:, 0] = fy + lab[:, 1] / 500
+    f[:, 1] = fy
+    f[:, 2] = fy - lab[:, 2] / 200
+    cubico = f > _DELTA
+    np.copyto(f, 3 * _DELTA ** 2 * (f - 4.0 / 29.0), where=~cubico)
+    np.power(f, 3, out=f, where=cubico)
+    np.matmul(f, _XYZ_A_RGB.T, out=out)
+    np.clip(out, 0, 1, out=out)
+    bajo = out <= 0.0031308
+    np.copyto(out, 1.055 * np.power(out, 1 / 2.4) - 0.055, where=~bajo)
+    np.multiply(out, 12.92, out=out, where=bajo)
@@ -0,0 +1,309 @@
+from typing import Optional
+import numpy as np
+
+from .ImageProcessor import Imagen, FiltroStrategy
+
+# Modos de borde aceptados (los mismos que np.pad).
+MODOS_BORDE = (
+    "constant", "edge", "linear_ramp", "maximum", "mean", "median",
+    "minimum", "reflect", "symmetric", "wrap",
+)
+
+# Modos de borde cuyo relleno solo depende de los píxeles cercanos al borde. Los demás
+# ('wrap' y los estadísticos) leen el eje completo, por lo que una tesela o banda con halo
+# no reproduce el resultado de la imagen completa.
+MODOS_LOCALES = frozenset({"constant", "edge", "linear_ramp", "reflect", "symmetric"})
+
+# Número de pasadas (multiplicaciones-suma sobre la imagen completa) a partir del cual
+# la convolución por FFT resulta más económica que las pasadas directas o separables.
+UMBRAL_FFT = 40
+
+
+def _tipo_trabajo(dtype: np.dtype) -> np.dtype:
+    """
+    Retorna el tipo flotante con el que se opera: float64 solo si la entrada ya lo es.
+    """
+    return np.dtype(np.float64) if dtype == np.float64 else np.dtype(np.float32)
+
+
+def _a_tipo_original(resultado: np.ndarray, imagen: Imagen) -> np.ndarray:
+    """
+    Convierte el resultado flotante al tipo de la imagen original.
+
+    Para tipos enteros se redondea y se satura al rango del tipo para evitar desbordes; los
+    flotantes se guardan según la política de precisión de la imagen.
+    """
+    dtype = imagen.datos.dtype
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        return np.clip(np.rint(resultado), info.min, info.max).astype(dtype)
+    return imagen._almacenar(resultado, blanco=None)
+
+
+def factorizar_kernel(kernel: np.ndarray, tolerancia: float = 1e-6) -> Optional[tuple[np.ndarray, np.ndarray]]:
+    """
+    Determina si un kernel 2D es separable (rango 1) y, en tal caso, lo factoriza.
+
+    Parámetros:
+        kernel (np.ndarray): Kernel 2D.
+        tolerancia (float): Tolerancia relativa sobre el segundo valor singular.
+
+    Retorna:
+        tuple[np.ndarray, np.ndarray] | None: Vectores (columna, fila) tales que
+        kernel == np.outer(columna, fila), o None si el kernel no es separable.
+    """
+    kernel = np.asarray(kernel, dtype=np.float64)
+    if kernel.ndim != 2:
+        raise ValueError("El kernel debe ser bidimensional")
+    if min(kernel.shape) == 1:
+        return _factorizar_vector(kernel)
+    u, s, vt = np.linalg.svd(kernel)
+    if s[0] == 0 or (len(s) > 1 and s[1] > tolerancia * s[0]):
+        return None
+    escala = np.sqrt(s[0])
+    return u[:, 0] * escala, vt[0, :] * escala
+
+
+def _factorizar_vector(kernel: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Factoriza un kernel con una sola fila o columna (siempre separable).
+    """
+    if kernel.shape[0] == 1:
+        return np.ones(1), kernel[0, :].copy()
+    return kernel[:, 0].copy(), np.ones(1)
+
+
+def _convolucion_directa(padded: np.ndarray, kernel: np.ndarray, forma: tuple) -> np.ndarray:
+    """
+    Convolución 2D directa: una pasada vectorizada por cada coeficiente no nulo del kernel.
+    """
+    alto, ancho = forma[0], forma[1]
+    volteado = kernel[::-1, ::-1]
+    resultado = np.zeros(forma, dtype=padded.dtype)
+    temporal = np.empty(forma, dtype=padded.dtype)
+    for i in range(volteado.shape[0]):
+        for j in range(volteado.shape[1]):
+            peso = volteado[i, j]
+            if peso == 0:
+                continue
+            np.multiply(padded[i:i + alto, j:j + ancho], peso, out=temporal)
+            resultado += temporal
+    return resultado
+
+
+def _convolucion_1d(datos: np.ndarray, kernel: np.ndarray, eje: int, longitud: int) -> np.ndarray:
+    """
+    Convolución 1D a lo largo de un eje sobre datos ya extendidos en ese eje.
+    """
+    volteado = kernel[::-1]
+    forma = list(datos.shape)
+    forma[eje] = longitud
+    resultado = np.zeros(forma, dtype=datos.dtype)
+    temporal = np.empty(forma, dtype=datos.dtype)
+    for t, peso in enumerate(volteado):
+        if peso == 0:
+            continue
+        ventana = datos[t:t + longitud] if eje == 0 else datos[:, t:t + longitud]
+        np.multiply(ventana, peso, out=temporal)
+        resultado += temporal
+    return resultado
+
+
+def _convolucion_separable(padded: np.ndarray, columna: np.ndarray, fila: np.ndarray,
+                           forma: tuple) -> np.ndarray:
+    """
+    Convolución separable: una pasada horizontal con `fila` y otra vertical con `columna`.
+    """
+    horizontal = _convolucion_1d(padded, fila.astype(padded.dtype), 1, forma[1])
+    return _convolucion_1d(horizontal, columna.astype(padded.dtype), 0, forma[0])
+
+
+def _convolucion_fft(padded: np.ndarray, kernel: np.ndarray, forma: tuple) -> np.ndarray:
+    """
+    Convolución mediante FFT real sobre los dos primeros ejes.
+
+    El tamaño de la transformada coincide con el del arreglo extendido; la parte circular
+    de la convolución solo afecta a las filas y columnas de padding, que se descartan.
+    """
+    alto_k, ancho_k = kernel.shape
+    tamano = padded.shape[:2]
+    espectro_k = np.fft.rfft2(kernel, s=tamano)
+    if padded.ndim == 3:
+        espectro_k = espectro_k[:, :, np.newaxis]
+    espectro = np.fft.rfft2(padded, s=tamano, axes=(0, 1))
+    espectro *= espectro_k
+    completo = np.fft.irfft2(espectro, s=tamano, axes=(0, 1))
+    return completo[alto_k - 1:alto_k - 1 + forma[0], ancho_k - 1:ancho_k - 1 + forma[1]].astype(padded.dtype)
+
+
+def elegir_metodo(kernel: np.ndarray, separable: bool) -> str:
+    """
+    Selecciona el algoritmo de convolución más económico para un kernel.
+
+    Parámetros:
+        kernel (np.ndarray): Kernel 2D.
+        separable (bool): Indica si el kernel es de rango 1.
+
+    Retorna:
+        str: 'directo', 'separable' o 'fft'.
+    """
+    pasadas = sum(kernel.shape) if separable else int(np.count_nonzero(kernel))
+    if pasadas >= UMBRAL_FFT:
+        return "fft"
+    return "separable" if separable else "directo"
+
+
+def convolucionar(datos: np.ndarray, kernel: np.ndarray, modo: str = "reflect",
+                  metodo: str = "auto", **opciones_borde) -> np.ndarray:
+    """
+    Convoluciona una imagen (H x W o H x W x C) con un kernel 2D, canal por canal.
+
+    Parámetros:
+        datos (np.ndarray): Arreglo de imagen.
+        kernel (np.ndarray): Kernel 2D de dimensiones impares.
+        modo (str): Modo de borde, igual que en np.pad (por defecto, 'reflect').
+        metodo (str): 'auto', 'directo', 'separable' o 'fft'.
+        **opciones_borde: Argumentos adicionales para np.pad (p. ej., constant_values).
+
+    Retorna:
+        np.ndarray: Resultado flotante (float32, o float64 si la entrada lo es).
+
+    Raises:
+        ValueError: Si el kernel, el modo de borde o el método no son válidos.
+    """
+    kernel = np.asarray(kernel, dtype=np.float64)
+    if kernel.ndim != 2:
+        raise ValueError("El kernel debe ser bidimensional")
+    if kernel.shape[0] % 2 == 0 or kernel.shape[1] % 2 == 0:
+        raise ValueError("Las dimensiones del kernel deben ser impares")
+    if modo not in MODOS_BORDE:
+        raise ValueError(f"Modo de borde no soportado: {modo}")
+    if metodo not in ("auto", "directo", "separable", "fft"):
+        raise ValueError(f"Método de convolución no soportado: {metodo}")
+
+    factores = factorizar_kernel(kernel) if metodo in ("auto", "separable") else None
+    if metodo == "separable" and factores is None:
+        raise ValueError("El kernel no es separable")
+    if metodo == "auto":
+        metodo = elegir_metodo(kernel, factores is not None)
+
+    tipo = _tipo_trabajo(datos.dtype)
+    pad_y, pad_x = kernel.shape[0] // 2, kernel.shape[1] // 2
+    pad = [(pad_y, pad_y), (pad_x, pad_x)] + [(0, 0)] * (datos.ndim - 2)
+    padded = np.pad(datos.astype(tipo, copy=False), pad, mode=modo, **opciones_borde)
+    forma = datos.shape
+
+    if metodo == "fft":
+        return _convolucion_fft(padded, kernel, forma)
+    if metodo == "separable":
+        columna, fila = factores
+        return _convolucion_separable(padded, columna, fila, forma)
+    return _convolucion_directa(padded, kernel.astype(tipo), forma)
+
+
+def kernel_gaussiano(sigma: float, tamano: Optional[int] = None) -> np.ndarray:
+    """
+    Construye un kernel gaussiano 1D normalizado.
+
+    Parámetros:
+        sigma (float): Desviación estándar (positiva).
+        tamano (int | None): Longitud impar del kernel; por defecto 2 * ceil(3 * sigma) + 1.
+
+    Retorna:
+        np.ndarray: Kernel 1D cuya suma es 1.
+    """
+    if sigma <= 0:
+        raise ValueError("Sigma debe ser positivo")
+    if tamano is None:
+        tamano = 2 * int(np.ceil(3 * sigma)) + 1
+    if tamano % 2 == 0:
+        raise ValueError("El tamaño del kernel debe ser impar")
+    x = np.arange(tamano) - tamano // 2
+    g = np.exp(-(x ** 2) / (2.0 * sigma ** 2))
+    return g / g.sum()
+
+
+class FiltroConvolucion(FiltroStrategy):
+    """
+    Filtro que convoluciona la imagen con un kernel arbitrario definido por el usuario.
+
+    El algoritmo (directo, separable o FFT) se elige automáticamente según el kernel.
+    """
+    def __init__(self, kernel: np.ndarray, modo: str = "reflect", metodo: str = "auto", **opciones_borde) -> None:
+        self.kernel = np.asarray(kernel, dtype=np.float64)
+        self.modo = modo
+        self.metodo = metodo
+        self.opciones_borde = opciones_borde
+
+    def aplicar(self, imagen: Imagen) -> Imagen:
+        """
+        Aplica la convolución a la imagen conservando su tipo de dato (los flotantes, según
+        la política de precisión).
+
+        Retorna:
+            Imagen: Imagen filtrada.
+        """
+        resultado = convolucionar(imagen.datos, self.kernel, self.modo, self.metodo, **self.opciones_borde)
+        imagen.datos = _a_tipo_original(resultado, imagen)
+        return imagen
+
+
+class FiltroGaussiano(FiltroConvolucion):
+    """
+    Filtro de desenfoque gaussiano (kernel separable).
+    """
+    def __init__(self, sigma: float, tamano: Optional[int] = None, modo: str = "reflect", metodo: str = "auto") -> None:
+        g = kernel_gaussiano(sigma, tamano)
+        super().__init__(np.outer(g, g), modo, metodo)
+        self.sigma = sigma
+
+
+class FiltroEnfoque(FiltroConvolucion):
+    """
+    Filtro de enfoque (sharpen): suma a la imagen su laplaciano escalado por `cantidad`.
+    """
+    def __init__(self, cantidad: float = 1.0, modo: str = "reflect") -> None:
+        laplaciano = np.array([[0, -1, 0], [-1, 4, -1], [0, -1, 0]], dtype=np.float64)
+        identidad = np.zeros((3, 3))
+        identidad[1, 1] = 1.0
+        super().__init__(identidad + cantidad * laplaciano, modo)
+        self.cantidad = cantidad
+
+
+class FiltroBordes(FiltroStrategy):
+    """
+    Filtro de detección de bordes: magnitud del gradiente a partir de dos kernels derivativos.
+    """
+    def __init__(self, kernel_x: np.ndarray, modo: str = "reflect") -> None:
+        self.kernel_x = np.asarray(kernel_x, dtype=np.float64)
+        self.kernel_y = self.kernel_x.T
+        self.modo = modo
+
+    def aplicar(self, imagen: Imagen) -> Imagen:
+        """
+        Calcula la magnitud del gradiente sqrt(gx² + gy²) canal por canal.
+
+        Retorna:
+            Imagen: Imagen con la magnitud de los bordes.
+        """
+        gx = convolucionar(imagen.datos, self.kernel_x, self.modo)
+        gy = convolucionar(imagen.datos, self.kernel_y, self.modo)
+        magnitud = np.hypot(gx, gy, out=gx)
+        imagen.datos = _a_tipo_original(magnitud, imagen)
+        return imagen
+
+
+class FiltroSobel(FiltroBordes):
+    """
+    Detección de bordes con el operador de Sobel.
+    """
+    def __init__(self, modo: str = "reflect") -> None:
+        super().__init__(np.outer([1, 2, 1], [-1, 0, 1]), modo)
+
+
+class FiltroScharr(FiltroBordes):
+    """
+    Detección de bordes con el operador de Scharr (mejor isotropía que Sobel).
+    """
+    def __init__(self, modo: str = "reflect") -> None:
+        super().__init__(np.outer([3, 10, 3], [-1, 0, 1]), modo)
@@ -0,0 +1,142 @@
+from typing import Optional, Union
+import numpy as np
+
+Indice = Union[int, slice]
+
+
+def preparar_color(color, datos: np.ndarray) -> np.ndarray:
+    """
+    Valida un color (o un arreglo de colores) para pintar sobre `datos`.
+
+    Parámetros:
+        color: Valores de color; el último eje debe coincidir con el número de canales (un
+            solo valor, o un último eje de longitud 1, en imágenes de un canal). Puede
+            contener un color por píxel pintado, o cualquier forma que se difunda sobre la
+            región (p. ej., un degradado de un color por columna).
+        datos (np.ndarray): Imagen de destino.
+
+    Retorna:
+        np.ndarray: Color listo para asignarse o mezclarse sobre la región.
+
+    Raises:
+        ValueError: Si el número de canales del color es incorrecto.
+    """
+    color = np.asarray(color)
+    if datos.ndim == 3:
+        if color.ndim == 0 or color.shape[-1] != datos.shape[2]:
+            raise ValueError("La longitud de la lista de color no coincide con el número de canales")
+    elif color.ndim and color.shape[-1] == 1:
+        color = color[..., 0]
+    return color
+
+
+def validar_alfa(alfa: float) -> None:
+    if not 0 <= alfa <= 1:
+        raise ValueError("El valor de alfa debe estar en el rango [0, 1]")
+
+
+def mezclar(actual: np.ndarray, color: np.ndarray, alfa: Union[float, np.ndarray]) -> np.ndarray:
+    """
+    Mezcla un color sobre los valores actuales: actual + (color - actual) * alfa.
+
+    Parámetros:
+        actual (np.ndarray): Valores actuales de la región (N x C, región x C o sin canales).
+        color (np.ndarray): Color a mezclar (difundible sobre `actual`).
+        alfa (float | np.ndarray): Opacidad global o por píxel (sin el eje de canales).
+
+    Retorna:
+        np.ndarray: Valores mezclados en flotante (redondeados y saturados si `actual` es
+        entero), listos para asignarse de vuelta a la región.
+    """
+    tipo = np.float64 if actual.dtype == np.float64 else np.float32
+    resultado = actual.astype(tipo)
+    alfa = np.asarray(alfa, dtype=tipo)
+    if alfa.ndim and alfa.ndim < resultado.ndim:
+        alfa = alfa[..., np.newaxis]
+    resultado += (np.asarray(color, dtype=tipo) - resultado) * alfa
+    if np.issubdtype(actual.dtype, np.integer):
+        limites = np.iinfo(actual.dtype)
+        np.rint(resultado, out=resultado)
+        np.clip(resultado, limites.min, limites.max, out=resultado)
+    return resultado
+
+
+def pintar(destino: np.ndarray, indice, color: np.ndarray, alfa: Union[float, np.ndarray] = 1.0) -> None:
+    """
+    Pinta (o mezcla, si alfa < 1) un color sobre `destino[indice]` en una sola asignación.
+
+    Parámetros:
+        destino (np.ndarray): Arreglo escribible.
+        indice: Índice de NumPy de la región (slices, máscara booleana o arreglos de coordenadas).
+        color (np.ndarray): Color validado con preparar_color.
+        alfa (float | np.ndarray): Opacidad global o por píxel seleccionado.
+    """
+    if np.ndim(alfa) == 0 and alfa >= 1:
+        destino[indice] = color
+    elif np.ndim(alfa) or alfa > 0:
+        destino[indice] = mezclar(destino[indice], color, alfa)
+
+
+def franjas_rectangulo(fila: int, columna: int, alto: int, ancho: int,
+                       grosor: Optional[int]) -> list[tuple[slice, slice]]:
+    """
+    Regiones (sin solaparse) que forman un rectángulo relleno o su contorno.
+
+    Parámetros:
+        fila (int), columna (int): Esquina superior izquierda (puede quedar fuera de la imagen).
+        alto (int), ancho (int): Tamaño del rectángulo.
+        grosor (int | None): Grosor del contorno; None para rellenarlo.
+
+    Retorna:
+        list[tuple[slice, slice]]: Pares (filas, columnas); el recorte a la imagen lo hace
+        la indexación (los índices negativos se llevan a 0).
+    """
+    def rango(inicio: int, fin: int) -> slice:
+        return slice(max(inicio, 0), max(fin, 0))
+
+    fin_fila, fin_columna = fila + alto, columna + ancho
+    if grosor is None or 2 * grosor >= min(alto, ancho):
+        return [(rango(fila, fin_fila), rango(columna, fin_columna))]
+    return [
+        (rango(fila, fila + grosor), rango(columna, fin_columna)),
+        (rango(fin_fila - grosor, fin_fila), rango(columna, fin_columna)),
+        (rango(fila + grosor, fin_fila - grosor), rango(columna, columna + grosor)),
+        (rango(fila + grosor, fin_fila - grosor), rango(fin_columna - grosor, fin_columna)),
+    ]
+
+
+def tramos_poligono(vertices: np.ndarray, alto: int, ancho: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calcula los tramos horizontales de píxeles cuyo centro queda dentro de un polígono
+    (regla par-impar).
+
+    Los cruces de todas las filas con todas las aristas se calculan a la vez; ordenados
+    por fila, cada par de cruces consecutivos delimita un tramo interior. Pintar por
+    tramos son escrituras contiguas, mucho más rápidas que una máscara booleana sobre
+    el rectángulo envolvente.
+
+    Parámetros:
+        vertices (np.ndarray): Vértices (fila, columna) de forma N x 2; el polígono se cierra solo.
+        alto (int), ancho (int): Tamaño de la imagen.
+
+    Retorna:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Fila, columna inicial y columna final
+        (excluida) de cada tramo no vacío, recortados a la imagen.
+    """
+    y0, x0 = vertices[:, 0], vertices[:, 1]
+    y1, x1 = np.roll(y0, -1), np.roll(x0, -1)
+    primera, ultima = max(int(np.ceil(y0.min())), 0), min(int(np.floor(y0.max())), alto - 1)
+    filas = np.arange(primera, max(ultima + 1, primera), dtype=np.float64)[:, np.newaxis]
+    # Intervalos semiabiertos [min, max) para no contar dos veces los vértices compartidos;
+    # así cada fila tiene un número par de cruces.
+    cruza = (np.minimum(y0, y1) <= filas) & (filas < np.maximum(y0, y1))
+    dy = np.where(y1 != y0, y1 - y0, 1.0)
+    cruces = np.where(cruza, x0 + (filas - y0) * ((x1 - x0) / dy), np.inf)
+    cruces.sort(axis=1)
+    orden = np.arange(len(vertices))
+    fila, par = np.nonzero((orden % 2 == 0) & (orden < cruza.sum(axis=1, keepdims=True)))
+    # El píxel c está dentro del tramo [a, b) si a <= c < b, es decir, ceil(a) <= c < ceil(b).
+    inicios = np.clip(np.ceil(cruces[fila, par]), 0, ancho).astype(np.intp)
+    fines = np.clip(np.ceil(cruces[fila, par + 1]), 0, ancho).astype(np.intp)
+    validos = fines > inicios
+    return fila[validos] + primera, inicios[validos], fines[validos]
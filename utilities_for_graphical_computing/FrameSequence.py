@@ -0,0 +1,330 @@
+import argparse
+import contextvars
+import glob
+import os
+import queue
+import re
+import sys
+import threading
+from typing import Callable, Iterable, Iterator, Optional, Sequence, TypeVar, Union
+import numpy as np
+
+from .ImageProcessor import Imagen, _datos_uint8, _tamano_decodificado
+
+T = TypeVar("T")
+
+# Fuente de fotogramas: un archivo con varios fotogramas (GIF, TIFF multipágina, ...), un
+# patrón glob de archivos numerados o una secuencia de rutas.
+Fuente = Union[str, Sequence[str]]
+
+
+def _clave_natural(ruta: str) -> list:
+    """
+    Clave de orden que compara numéricamente los números del nombre ('2' antes que '10').
+    """
+    return [int(parte) if parte.isdigit() else parte for parte in re.split(r"(\d+)", ruta)]
+
+
+def _rutas(fuente: Fuente) -> Optional[list[str]]:
+    """
+    Rutas de una secuencia de archivos, o None si la fuente es un único archivo.
+    """
+    if not isinstance(fuente, str):
+        return list(fuente)
+    if glob.has_magic(fuente):
+        return sorted(glob.glob(fuente, recursive=True), key=_clave_natural)
+    return None
+
+
+def leer_fotogramas(fuente: Fuente, modo: str = "RGB", tamano: Optional[tuple[int, int]] = None,
+                    escala: Optional[float] = None) -> Iterator[Imagen]:
+    """
+    Genera los fotogramas de una animación, de un archivo multipágina o de una secuencia de
+    archivos, uno a uno.
+
+    Solo se decodifica el fotograma que se está entregando, por lo que la memoria no depende
+    del número de fotogramas. En los GIF animados cada fotograma se entrega ya compuesto
+    sobre los anteriores, tal como se visualiza.
+
+    Parámetros:
+        fuente (str | Sequence[str]): Ruta de un archivo con varios fotogramas (GIF, TIFF,
+            WebP o PNG animados), patrón glob de archivos numerados ('frames/*.png',
+            ordenados por su número) o secuencia de rutas.
+        modo (str): 'RGB' o 'L' (ver Imagen.desde_archivo).
+        tamano (tuple[int, int] | None): Tamaño máximo (alto, ancho) de los fotogramas.
+        escala (float | None): Factor de escala en (0, 1] (alternativa a `tamano`).
+
+    Retorna:
+        Iterator[Imagen]: Fotogramas en orden.
+
+    Raises:
+        ValueError: Si los parámetros no son válidos o un archivo no se puede cargar.
+    """
+    rutas = _rutas(fuente)
+    if rutas is not None:
+        for ruta in rutas:
+            yield Imagen.desde_archivo(ruta, tamano=tamano, escala=escala, modo=modo)
+        return
+    if modo not in ("RGB", "L"):
+        raise ValueError("El modo debe ser 'RGB' o 'L'")
+    if tamano is not None and escala is not None:
+        raise ValueError("Indique solo uno de 'tamano' o 'escala'")
+    from PIL import Image, ImageSequence
+    try:
+        archivo = Image.open(fuente)
+    except Exception as e:
+        raise ValueError(f"Error al cargar la imagen desde {fuente}: {e}")
+    with archivo:
+        for fotograma in ImageSequence.Iterator(archivo):
+            # seek() reutiliza el mismo objeto: la conversión (o la copia) independiza los datos.
+            fotograma = fotograma.convert(modo) if fotograma.mode != modo else fotograma.copy()
+            destino = _tamano_decodificado(fotograma.size, tamano, escala)
+            if destino != fotograma.size:
+                fotograma = fotograma.resize(destino, Image.Resampling.BILINEAR, reducing_gap=2.0)
+            yield Imagen(np.asarray(fotograma))
+
+
+class EscritorFotogramas:
+    """
+    Escribe fotogramas uno a uno, sin acumularlos en memoria.
+
+    El formato se deduce del destino:
+        - '.gif': GIF animado. Cada fotograma se cuantiza con su propia paleta y se escribe
+          en cuanto se recibe (Pillow, en cambio, retiene todos los fotogramas hasta el final).
+        - '.tif' / '.tiff': TIFF multipágina, una página por fotograma.
+        - Una ruta con el marcador '{indice}' (p. ej., 'salida/{indice:04d}.png'): un archivo
+          por fotograma.
+
+    Las imágenes flotantes se asumen en [0, 1] (ver Imagen.guardar). Se usa como
+    administrador de contexto:
+
+        with EscritorFotogramas("salida.gif", duracion=40) as escritor:
+            for fotograma in leer_fotogramas("entrada.gif"):
+                escritor.escribir(fotograma.gris_luminosidad())
+    """
+
+    def __init__(self, destino: str, duracion: int = 100, bucle: Optional[int] = 0) -> None:
+        """
+        Parámetros:
+            destino (str): Ruta del archivo de salida o patrón con '{indice}'.
+            duracion (int): Duración de cada fotograma en milisegundos (solo GIF).
+            bucle (int | None): Repeticiones del GIF (0 = infinitas; None = sin bucle).
+
+        Raises:
+            ValueError: Si el formato de destino no admite varios fotogramas.
+        """
+        extension = os.path.splitext(destino)[1].lower()
+        if "{indice" in destino:
+            self.formato = "secuencia"
+        elif extension == ".gif":
+            self.formato = "gif"
+        elif extension in (".tif", ".tiff"):
+            self.formato = "tiff"
+        else:
+            raise ValueError("El destino debe ser .gif, .tif/.tiff o contener el marcador '{indice}'")
+        self.destino = destino
+        self.duracion = duracion
+        self.bucle = bucle
+        self.fotogramas = 0
+        self._archivo = None
+        self._tamano: Optional[tuple[int, int]] = None
+
+    def __enter__(self) -> 'EscritorFotogramas':
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+    def escribir(self, imagen: Imagen) -> None:
+        """
+        Codifica y escribe un fotograma.
+
+        Parámetros:
+            imagen (Imagen): Fotograma (H x W o H x W x 3).
+
+        Raises:
+            ValueError: Si el fotograma no puede escribirse (p. ej., un GIF con fotogramas de
+                distinto tamaño).
+        """
+        from PIL import Image
+        if self.formato == "secuencia":
+            imagen.guardar(self.destino.format(indice=self.fotogramas))
+            self.fotogramas += 1
+            return
+        fotograma = Image.fromarray(_datos_uint8(imagen.datos))
+        if self._tamano is not None and self.formato == "gif" and fotograma.size != self._tamano:
+            raise ValueError("Todos los fotogramas de un GIF deben tener el mismo tamaño")
+        if self.formato == "gif":
+            self._escribir_gif(fotograma)
+        else:
+            if self._archivo is None:
+                from PIL import TiffImagePlugin
+                self._archivo = TiffImagePlugin.AppendingTiffWriter(self.destino, new=True)
+            fotograma.save(self._archivo, format="TIFF")
+            self._archivo.newFrame()
+        self._tamano = fotograma.size
+        self.fotogramas += 1
+
+    def _escribir_gif(self, fotograma) -> None:
+        """
+        Escribe un fotograma GIF (y la cabecera, con el primero) con las funciones de bajo
+        nivel de Pillow, que codifican un fotograma a la vez.
+        """
+        from PIL import GifImagePlugin, Image
+        if fotograma.mode != "RGB":
+            fotograma = fotograma.convert("RGB")
+        fotograma = fotograma.convert("P", palette=Image.Palette.ADAPTIVE)
+        if self._archivo is None:
+            info = {"duration": self.duracion}
+            if self.bucle is not None:
+                info["loop"] = self.bucle
+            cabecera, _ = GifImagePlugin.getheader(fotograma, info=info)
+            self._archivo = open(self.destino, "wb")
+            self._archivo.write(b"".join(cabecera))
+        for bloque in GifImagePlugin.getdata(fotograma, duration=self.duracion, include_color_table=True):
+            self._archivo.write(bloque)
+
+    def cerrar(self) -> None:
+        """
+        Termina el archivo (el GIF necesita un bloque final) y lo cierra.
+        """
+        if self._archivo is None:
+            return
+        if self.formato == "gif":
+            self._archivo.write(b";")
+        self._archivo.close()
+        self._archivo = None
+
+
+def anticipar(iterable: Iterable[T], capacidad: int = 2) -> Iterator[T]:
+    """
+    Recorre un iterable en un hilo aparte, adelantándose hasta `capacidad` elementos.
+
+    Encadenando etapas con anticipar, la lectura, el procesamiento y la escritura se
+    solapan (la decodificación y codificación de Pillow y las operaciones de NumPy liberan
+    el GIL), y la cola acotada limita los elementos en memoria: si una etapa es más lenta,
+    las anteriores se detienen al llenarse su cola. Las excepciones del hilo se relanzan al
+    consumidor, y al dejar de consumir se detiene el hilo. El hilo se ejecuta en una copia
+    del contexto del consumidor (ver contextvars), por lo que conserva su política de
+    precisión y sus sesiones de perfilado.
+
+    Parámetros:
+        iterable (Iterable): Elementos a producir.
+        capacidad (int): Máximo de elementos producidos y aún no consumidos.
+
+    Retorna:
+        Iterator: Los mismos elementos, en orden.
+    """
+    if capacidad < 1:
+        raise ValueError("La capacidad debe ser positiva")
+    cola: queue.Queue = queue.Queue(maxsize=capacidad)
+    detener = threading.Event()
+
+    def poner(elemento: tuple) -> bool:
+        while not detener.is_set():
+            try:
+                cola.put(elemento, timeout=0.05)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def producir() -> None:
+        iterador = iter(iterable)
+        try:
+            for elemento in iterador:
+                if not poner((True, elemento)):
+                    return
+        except BaseException as e:
+            poner((False, e))
+            return
+        finally:
+            cerrar = getattr(iterador, "close", None)
+            if cerrar is not None:
+                cerrar()
+        poner((False, None))
+
+    hilo = threading.Thread(target=contextvars.copy_context().run, args=(producir,), name="anticipar",
+                            daemon=True)
+    hilo.start()
+    try:
+        while True:
+            valido, valor = cola.get()
+            if not valido:
+                if valor is not None:
+                    raise valor
+                return
+            yield valor
+    finally:
+        detener.set()
+        hilo.join()
+
+
+def procesar_fotogramas(fuente: Fuente, operaciones: Sequence[Sequence], destino: str,
+                        capacidad: int = 4, duracion: int = 100, bucle: Optional[int] = 0,
+                        modo: str = "RGB", progreso: Optional[Callable[[int], None]] = None) -> int:
+    """
+    Lee, procesa y escribe una secuencia de fotogramas en flujo continuo.
+
+    Lectura, procesamiento y escritura se ejecutan en hilos distintos unidos por colas de
+    `capacidad` fotogramas (ver anticipar), de modo que la memoria es constante sea cual sea
+    el número de fotogramas.
+
+    Parámetros:
+        fuente (str | Sequence[str]): Fuente de los fotogramas (ver leer_fotogramas).
+        operaciones (Sequence[Sequence]): Cadena de operaciones, p. ej.
+            [('ajustar', -0.8), ('gris_luminosidad',)] (ver Imagen.aplicar_operaciones).
+        destino (str): Destino de los fotogramas (ver EscritorFotogramas).
+        capacidad (int): Fotogramas en espera entre cada par de etapas.
+        duracion (int): Duración de cada fotograma en milisegundos (GIF).
+        bucle (int | None): Repeticiones del GIF (0 = infinitas; None = sin bucle).
+        modo (str): 'RGB' o 'L'.
+        progreso (Callable[[int], None] | None): Función llamada con el número de fotogramas
+            escritos tras cada uno.
+
+    Retorna:
+        int: Número de fotogramas escritos.
+    """
+    operaciones = [tuple(op) for op in operaciones]
+    escritor = EscritorFotogramas(destino, duracion, bucle)
+    leidos = anticipar(leer_fotogramas(fuente, modo), capacidad)
+    procesados = anticipar((fotograma.aplicar_operaciones(operaciones) for fotograma in leidos), capacidad)
+    try:
+        with escritor:
+            for fotograma in procesados:
+                escritor.escribir(fotograma)
+                if progreso is not None:
+                    progreso(escritor.fotogramas)
+    finally:
+        # Detiene los hilos de inmediato también si una etapa falla.
+        procesados.close()
+        leidos.close()
+    return escritor.fotogramas
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Punto de entrada de línea de comandos para procesar secuencias de fotogramas.
+
+    Ejemplo:
+        python -m utilities_for_graphical_computing.FrameSequence entrada.gif salida.gif \\
+            -o ajustar:-0.8 -o gris_luminosidad:3 --duracion 40
+    """
+    from .BatchRunner import _interpretar_operacion
+    parser = argparse.ArgumentParser(description="Procesa una secuencia de fotogramas en flujo continuo.")
+    parser.add_argument("entrada", help="Archivo con varios fotogramas o patrón glob de archivos numerados")
+    parser.add_argument("salida", help="Archivo .gif/.tif de salida o patrón con '{indice}'")
+    parser.add_argument("-o", "--operacion", action="append", default=[],
+                        help="Operación 'nombre:arg1,arg2' (se puede repetir, se aplican en orden)")
+    parser.add_argument("--capacidad", type=int, default=4, help="Fotogramas en espera entre etapas")
+    parser.add_argument("--duracion", type=int, default=100, help="Duración de cada fotograma (ms, GIF)")
+    args = parser.parse_args(argv)
+
+    operaciones = [_interpretar_operacion(op) for op in args.operacion]
+    total = procesar_fotogramas(args.entrada, operaciones, args.salida, args.capacidad, args.duracion)
+    print(f"Fotogramas escritos: {total}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
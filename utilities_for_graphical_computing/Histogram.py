@@ -0,0 +1,399 @@
+from dataclasses import dataclass
+from math import ceil, gcd
+from typing import Optional
+import numpy as np
+
+# Pares de bytes procesados por bloque en los caminos uint8 (los índices temporales de
+# bincount y take ocupan 8 bytes por par, 2 MiB por bloque).
+BLOQUE_PARES = 1 << 18
+# Tamaño aproximado de los bloques de filas en los recorridos de datos no uint8.
+BLOQUE_BYTES = 1 << 20
+# Por debajo de este número de bytes no compensa construir las tablas de pares (65536 entradas).
+_MINIMO_PARES = 1 << 20
+
+
+@dataclass
+class Estadisticas:
+    """
+    Estadísticas por canal de una imagen, calculadas en una sola pasada sobre los datos.
+
+    Atributos:
+        minimo (np.ndarray): Mínimo de cada canal.
+        maximo (np.ndarray): Máximo de cada canal.
+        media (np.ndarray): Media de cada canal.
+        pixeles (int): Número de valores de cada canal.
+        histograma (np.ndarray | None): Histograma por canal (C x 256) si los datos son uint8
+            (del que se derivan el resto de estadísticas); None para los demás tipos.
+    """
+    minimo: np.ndarray
+    maximo: np.ndarray
+    media: np.ndarray
+    pixeles: int
+    histograma: Optional[np.ndarray] = None
+
+    @property
+    def minimo_global(self) -> float:
+        return float(self.minimo.min()) if self.minimo.size else 0.0
+
+    @property
+    def maximo_global(self) -> float:
+        return float(self.maximo.max()) if self.maximo.size else 0.0
+
+
+def _canales(datos: np.ndarray) -> int:
+    """
+    Número de canales (último eje) de una imagen; 1 para las imágenes H x W.
+    """
+    return 1 if datos.ndim < 3 else datos.shape[-1]
+
+
+def _plano(datos: np.ndarray, canal: int) -> np.ndarray:
+    return datos if datos.ndim < 3 else datos[..., canal]
+
+
+def _solo_lectura(arreglo: np.ndarray) -> np.ndarray:
+    arreglo.flags.writeable = False
+    return arreglo
+
+
+def _periodo(canales: int) -> int:
+    """
+    Número de tipos de par distintos: el par k contiene los canales (2k mod C, (2k + 1) mod C).
+    """
+    return canales // gcd(canales, 2)
+
+
+def histograma_uint8(datos: np.ndarray, bloque_pares: int = BLOQUE_PARES) -> np.ndarray:
+    """
+    Calcula el histograma por canal de una imagen uint8.
+
+    Los bytes consecutivos se cuentan de a pares como valores de 16 bits con un único
+    bincount de 65536 casillas por tipo de par, lo que reduce a la mitad los elementos
+    recorridos; el histograma de cada canal se obtiene sumando las filas y columnas de la
+    tabla conjunta. Los datos se procesan por bloques para que los temporales quepan en caché.
+
+    Parámetros:
+        datos (np.ndarray): Imagen uint8 (H x W o H x W x C).
+        bloque_pares (int): Pares de bytes contados por bloque.
+
+    Retorna:
+        np.ndarray: Histograma int64 de forma (C, 256).
+    """
+    canales = _canales(datos)
+    histograma = np.zeros((canales, 256), dtype=np.int64)
+    if not datos.flags.c_contiguous:
+        for canal in range(canales):
+            histograma[canal] = np.bincount(_plano(datos, canal).reshape(-1), minlength=256)
+        return histograma
+    bytes_ = datos.reshape(-1)
+    n_pares = bytes_.size // 2
+    pares = bytes_[:2 * n_pares].view("<u2")
+    periodo = _periodo(canales)
+    bloque = max(periodo, bloque_pares - bloque_pares % periodo)
+    conjunto = np.zeros((periodo, 1 << 16), dtype=np.int64)
+    for inicio in range(0, n_pares, bloque):
+        segmento = pares[inicio:inicio + bloque]
+        for tipo in range(periodo):
+            conjunto[tipo] += np.bincount(segmento[tipo::periodo], minlength=1 << 16)
+    for tipo in range(periodo):
+        # Filas: byte alto (segundo byte del par); columnas: byte bajo (primero).
+        tabla = conjunto[tipo].reshape(256, 256)
+        histograma[(2 * tipo) % canales] += tabla.sum(axis=0)
+        histograma[(2 * tipo + 1) % canales] += tabla.sum(axis=1)
+    if bytes_.size % 2:
+        histograma[(bytes_.size - 1) % canales, bytes_[-1]] += 1
+    return histograma
+
+
+def aplicar_tablas(datos: np.ndarray, tablas: np.ndarray, out: Optional[np.ndarray] = None,
+                   bloque_pares: int = BLOQUE_PARES) -> np.ndarray:
+    """
+    Aplica a una imagen uint8 una tabla de consulta de 256 entradas por canal (o una común).
+
+    Igual que en histograma_uint8, los bytes se traducen de a pares con tablas de 65536
+    entradas de 16 bits construidas a partir de las de cada canal, lo que reduce a la mitad
+    los accesos indexados. Las imágenes pequeñas o no contiguas se traducen canal a canal.
+
+    Parámetros:
+        datos (np.ndarray): Imagen uint8.
+        tablas (np.ndarray): Tabla uint8 de forma (256,) o (C, 256).
+        out (np.ndarray | None): Arreglo uint8 preasignado para el resultado (puede ser `datos`).
+        bloque_pares (int): Pares de bytes traducidos por bloque.
+
+    Retorna:
+        np.ndarray: Imagen uint8 traducida.
+
+    Raises:
+        ValueError: Si `out` no tiene la forma o el tipo esperados.
+    """
+    canales = _canales(datos)
+    tablas = np.broadcast_to(np.asarray(tablas, dtype=np.uint8), (canales, 256))
+    if out is None:
+        out = np.empty(datos.shape, dtype=np.uint8)
+    elif out.shape != datos.shape or out.dtype != np.uint8:
+        raise ValueError(f"La salida debe ser un arreglo uint8 de forma {datos.shape}")
+    if datos.nbytes < _MINIMO_PARES or not (datos.flags.c_contiguous and out.flags.c_contiguous):
+        if (tablas == tablas[0]).all():
+            return np.take(tablas[0], datos, out=out)
+        for canal in range(canales):
+            np.take(tablas[canal], _plano(datos, canal), out=_plano(out, canal))
+        return out
+    periodo = _periodo(canales)
+    valores = np.arange(1 << 16)
+    tablas_pares = [
+        (tablas[(2 * tipo) % canales][valores & 255].astype(np.uint16)
+         | (tablas[(2 * tipo + 1) % canales][valores >> 8].astype(np.uint16) << 8)).astype("<u2")
+        for tipo in range(periodo)
+    ]
+    entrada, salida = datos.reshape(-1), out.reshape(-1)
+    n_pares = entrada.size // 2
+    pares, pares_salida = entrada[:2 * n_pares].view("<u2"), salida[:2 * n_pares].view("<u2")
+    bloque = max(periodo, bloque_pares - bloque_pares % periodo)
+    for inicio in range(0, n_pares, bloque):
+        segmento, destino = pares[inicio:inicio + bloque], pares_salida[inicio:inicio + bloque]
+        for tipo in range(periodo):
+            np.take(tablas_pares[tipo], segmento[tipo::periodo], out=destino[tipo::periodo])
+    if entrada.size % 2:
+        salida[-1] = tablas[(entrada.size - 1) % canales][entrada[-1]]
+    return out
+
+
+def _filas_por_bloque(datos: np.ndarray, bloque_bytes: int = BLOQUE_BYTES) -> int:
+    return max(1, bloque_bytes // max(1, datos[:1].nbytes))
+
+
+def calcular_estadisticas(datos: np.ndarray) -> Estadisticas:
+    """
+    Calcula mínimo, máximo y media por canal en una sola pasada sobre los datos.
+
+    En uint8 se calcula el histograma (ver histograma_uint8) y el resto de estadísticas se
+    deriva de él; en los demás tipos se recorren bloques de filas que caben en caché.
+
+    Parámetros:
+        datos (np.ndarray): Imagen (H x W o H x W x C).
+
+    Retorna:
+        Estadisticas: Estadísticas por canal (arreglos de solo lectura).
+    """
+    canales = _canales(datos)
+    pixeles = datos.size // canales if canales else 0
+    if datos.dtype == np.uint8:
+        histograma = histograma_uint8(datos)
+        ocupados = histograma > 0
+        if pixeles:
+            minimo = np.argmax(ocupados, axis=1).astype(np.float64)
+            maximo = (255 - np.argmax(ocupados[:, ::-1], axis=1)).astype(np.float64)
+            media = histograma @ np.arange(256, dtype=np.float64) / pixeles
+        else:
+            minimo = maximo = media = np.zeros(canales)
+        return Estadisticas(_solo_lectura(minimo), _solo_lectura(maximo), _solo_lectura(media), pixeles,
+                            _solo_lectura(histograma))
+    minimo, maximo, suma = np.full(canales, np.inf), np.full(canales, -np.inf), np.zeros(canales)
+    if not pixeles:
+        minimo = maximo = np.zeros(canales)
+    filas = _filas_por_bloque(datos)
+    for inicio in range(0, datos.shape[0] if pixeles else 0, filas):
+        bloque = datos[inicio:inicio + filas]
+        for canal in range(canales):
+            plano = _plano(bloque, canal)
+            minimo[canal] = min(minimo[canal], plano.min())
+            maximo[canal] = max(maximo[canal], plano.max())
+            suma[canal] += plano.sum(dtype=np.float64)
+    media = suma / pixeles if pixeles else suma
+    return Estadisticas(_solo_lectura(minimo), _solo_lectura(maximo), _solo_lectura(media), pixeles)
+
+
+def cuantizar(datos: np.ndarray, maximo: float) -> np.ndarray:
+    """
+    Cuantiza los datos a 256 niveles (uint8) sobre el rango [0, maximo].
+
+    Los datos uint8 con maximo 255 se retornan sin copiar.
+    """
+    if datos.dtype == np.uint8 and maximo == 255:
+        return datos
+    niveles = np.multiply(datos, 255.0 / maximo, dtype=np.float32)
+    np.rint(niveles, out=niveles)
+    np.clip(niveles, 0, 255, out=niveles)
+    return niveles.astype(np.uint8)
+
+
+def histograma_cuantizado(datos: np.ndarray, maximo: float) -> np.ndarray:
+    """
+    Histograma por canal (C x 256) de los datos cuantizados a 256 niveles sobre [0, maximo].
+
+    Se cuantiza por bloques de filas, por lo que no se crea una copia completa de la imagen.
+    """
+    histograma = np.zeros((_canales(datos), 256), dtype=np.int64)
+    filas = _filas_por_bloque(datos)
+    for inicio in range(0, datos.shape[0], filas):
+        histograma += histograma_uint8(cuantizar(datos[inicio:inicio + filas], maximo))
+    return histograma
+
+
+def curvas_ecualizacion(histograma: np.ndarray) -> np.ndarray:
+    """
+    Curvas de ecualización (C x 256) con valores en [0, 1] a partir de un histograma por canal.
+
+    Se usa la función de distribución acumulada, desplazada para que el nivel ocupado más
+    oscuro vaya a 0; los canales constantes conservan la identidad.
+    """
+    cdf = np.cumsum(histograma, axis=-1, dtype=np.float64)
+    primero = cdf[np.arange(len(cdf)), np.argmax(histograma > 0, axis=-1)][:, np.newaxis]
+    rango = cdf[:, -1:] - primero
+    identidad = np.arange(256) / 255.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        curvas = np.where(rango > 0, (cdf - primero) / rango, identidad)
+    return np.clip(curvas, 0.0, 1.0)
+
+
+def limites_autocontraste(histograma: np.ndarray, recorte: float = 0.0) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Niveles inferior y superior de cada canal, descartando la fracción `recorte` de valores
+    en cada extremo (con recorte 0, el mínimo y el máximo).
+    """
+    cdf = np.cumsum(histograma, axis=-1)
+    total = cdf[:, -1:]
+    bajo = np.argmax(cdf > recorte * total, axis=-1)
+    alto = np.argmax(cdf >= (1.0 - recorte) * total, axis=-1)
+    return bajo, np.maximum(alto, bajo)
+
+
+def curvas_autocontraste(histograma: np.ndarray, recorte: float = 0.0) -> np.ndarray:
+    """
+    Curvas de estiramiento lineal (C x 256) con valores en [0, 1] que llevan los niveles de
+    limites_autocontraste a 0 y 1; los canales constantes conservan la identidad.
+    """
+    bajo, alto = limites_autocontraste(histograma, recorte)
+    niveles = np.arange(256, dtype=np.float64)
+    constante = alto <= bajo
+    rango = np.where(constante, 1, alto - bajo)
+    estirado = np.clip((niveles - bajo[:, np.newaxis]) / rango[:, np.newaxis], 0.0, 1.0)
+    return np.where(constante[:, np.newaxis], niveles / 255.0, estirado)
+
+
+def a_tablas_uint8(curvas: np.ndarray) -> np.ndarray:
+    """
+    Convierte curvas en [0, 1] en tablas de consulta uint8.
+    """
+    return np.clip(np.rint(curvas * 255.0), 0, 255).astype(np.uint8)
+
+
+def aplicar_curvas(datos: np.ndarray, curvas: np.ndarray, maximo: float) -> np.ndarray:
+    """
+    Aplica curvas de 256 niveles a datos no uint8: se cuantizan sobre [0, maximo] y se
+    traducen con la curva de su canal.
+
+    Retorna:
+        np.ndarray: Resultado float32 en [0, 1].
+    """
+    canales = _canales(datos)
+    curvas = np.broadcast_to(np.asarray(curvas, dtype=np.float32), (canales, 256))
+    salida = np.empty(datos.shape, dtype=np.float32)
+    filas = _filas_por_bloque(datos)
+    for inicio in range(0, datos.shape[0], filas):
+        niveles = cuantizar(datos[inicio:inicio + filas], maximo)
+        destino = salida[inicio:inicio + filas]
+        for canal in range(canales):
+            np.take(curvas[canal], _plano(niveles, canal), out=_plano(destino, canal))
+    return salida
+
+
+def sumar_luminancia(datos: np.ndarray, delta: np.ndarray, maximo: float) -> np.ndarray:
+    """
+    Cambia la luminancia de una imagen RGB sin alterar su crominancia.
+
+    En YCbCr de rango completo, cambiar Y con Cb y Cr fijos equivale a sumar la misma
+    cantidad a R, G y B, por lo que no hace falta convertir la imagen de espacio de color.
+    Se procesa por bloques de filas; los canales a partir del cuarto se conservan.
+
+    Parámetros:
+        datos (np.ndarray): Imagen H x W x C (C >= 3) con valores en [0, maximo].
+        delta (np.ndarray): Cambio de luminancia H x W, en unidades de [0, 1].
+        maximo (float): Valor que corresponde al blanco (255 o 1).
+
+    Retorna:
+        np.ndarray: uint8 si la entrada es uint8; float32 en [0, 1] en otro caso.
+    """
+    uint8 = datos.dtype == np.uint8
+    salida = np.empty(datos.shape, dtype=np.uint8 if uint8 else np.float32)
+    escala = 255.0 if uint8 else 1.0
+    filas = _filas_por_bloque(datos)
+    for inicio in range(0, datos.shape[0], filas):
+        bloque = np.multiply(datos[inicio:inicio + filas], escala / maximo, dtype=np.float32)
+        bloque[..., :3] += delta[inicio:inicio + filas, :, np.newaxis] * escala
+        np.clip(bloque, 0.0, escala, out=bloque)
+        if uint8:
+            np.rint(bloque, out=bloque)
+        salida[inicio:inicio + filas] = bloque
+    return salida
+
+
+def clahe(niveles: np.ndarray, limite: float = 2.0, teselas: tuple[int, int] = (8, 8)) -> np.ndarray:
+    """
+    Ecualización adaptativa de histograma con contraste limitado (CLAHE) de un plano uint8.
+
+    La imagen se divide en una cuadrícula de teselas; el histograma de cada una se recorta a
+    `limite` veces su altura media (el exceso se reparte uniformemente) y se convierte en
+    una curva de ecualización. Cada píxel se traduce interpolando bilinealmente las curvas
+    de las cuatro teselas más cercanas, por bloques de filas.
+
+    Parámetros:
+        niveles (np.ndarray): Plano H x W uint8.
+        limite (float): Límite de recorte relativo (<= 0 desactiva el recorte).
+        teselas (tuple[int, int]): Número de teselas (filas, columnas).
+
+    Retorna:
+        np.ndarray: Plano float32 en [0, 1].
+
+    Raises:
+        ValueError: Si el número de teselas no es positivo.
+    """
+    if min(teselas) < 1:
+        raise ValueError("El número de teselas debe ser positivo")
+    alto, ancho = niveles.shape
+    alto_tesela, ancho_tesela = ceil(alto / min(teselas[0], alto)), ceil(ancho / min(teselas[1], ancho))
+    filas_t, columnas_t = ceil(alto / alto_tesela), ceil(ancho / ancho_tesela)
+
+    # Histogramas de todas las teselas: el índice de cada píxel combina su columna de teselas y su nivel.
+    base_columna = (np.arange(ancho) // ancho_tesela) * 256
+    histogramas = np.zeros((filas_t, columnas_t * 256), dtype=np.int64)
+    filas = max(1, BLOQUE_PARES // ancho)
+    for fila_t in range(filas_t):
+        for inicio in range(fila_t * alto_tesela, min((fila_t + 1) * alto_tesela, alto), filas):
+            fin = min(inicio + filas, (fila_t + 1) * alto_tesela, alto)
+            indices = niveles[inicio:fin] + base_columna
+            histogramas[fila_t] += np.bincount(indices.reshape(-1), minlength=columnas_t * 256)
+    histogramas = histogramas.reshape(filas_t, columnas_t, 256).astype(np.float64)
+    pixeles = histogramas.sum(axis=-1, keepdims=True)
+    if limite > 0:
+        tope = np.maximum(limite * pixeles / 256.0, 1.0)
+        exceso = np.maximum(histogramas - tope, 0.0).sum(axis=-1, keepdims=True)
+        histogramas = np.minimum(histogramas, tope) + exceso / 256.0
+    curvas = (np.cumsum(histogramas, axis=-1) / pixeles).astype(np.float32).reshape(-1)
+
+    def vecinos(n: int, paso: int, cantidad: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Posición de cada píxel respecto de los centros de las teselas.
+        posicion = (np.arange(n) + 0.5) / paso - 0.5
+        anterior = np.clip(np.floor(posicion), 0, cantidad - 1).astype(np.intp)
+        siguiente = np.minimum(anterior + 1, cantidad - 1)
+        peso = np.clip(posicion - anterior, 0.0, 1.0).astype(np.float32)
+        return anterior, siguiente, peso
+
+    y0, y1, peso_y = vecinos(alto, alto_tesela, filas_t)
+    x0, x1, peso_x = vecinos(ancho, ancho_tesela, columnas_t)
+    x0, x1 = x0 * 256, x1 * 256
+    salida = np.empty((alto, ancho), dtype=np.float32)
+    filas = max(1, (BLOQUE_PARES // 4) // ancho)
+    for inicio in range(0, alto, filas):
+        fin = min(inicio + filas, alto)
+        valores = niveles[inicio:fin].astype(np.intp)
+        izquierda, derecha = valores + x0, valores + x1
+        arriba = (y0[inicio:fin] * columnas_t * 256)[:, np.newaxis]
+        abajo = (y1[inicio:fin] * columnas_t * 256)[:, np.newaxis]
+        a0, a1 = curvas[izquierda + arriba], curvas[derecha + arriba]
+        b0, b1 = curvas[izquierda + abajo], curvas[derecha + abajo]
+        a0 += peso_x * (a1 - a0)
+        b0 += peso_x * (b1 - b0)
+        a0 += peso_y[inicio:fin, np.newaxis] * (b0 - a0)
+        salida[inicio:fin] = a0
+    return salida
@@ -0,0 +1,327 @@
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence, Union
+import numpy as np
+
+from . import ColorSpaces, Precision
+from .ImageProcessor import (
+    Imagen,
+    FiltroFactory,
+    _CONVERSIONES,
+    _filtro_caja,
+    _dimensiones_kernel,
+    _capa_rgb,
+    _capa_cmyk,
+    _gris_promedio,
+    _gris_luminosidad,
+    _gris_tonalidad,
+    _expandir_gris,
+    _normalizado,
+    _desnormalizado,
+    _invertido,
+    _fusionar_flujo,
+    _tipo_acumulador,
+    _finalizar_fusion,
+    _MODOS_FUSION,
+)
+
+
+@dataclass
+class ImagenBatch:
+    """
+    Lote de imágenes del mismo tamaño almacenado como un único arreglo contiguo N x H x W x C
+    (o N x H x W para imágenes de escala de grises de un canal).
+
+    Ofrece la misma API encadenable que Imagen, pero cada operación se ejecuta como una sola
+    llamada de NumPy sobre todo el lote, evitando el costo por imagen de Python y de las
+    asignaciones intermedias. Los resultados siguen la política de precisión global (ver
+    Precision), igual que los de Imagen.
+    """
+    datos: np.ndarray
+
+    def __post_init__(self) -> None:
+        if self.datos.ndim not in (3, 4):
+            raise ValueError("El lote debe tener 3 o 4 dimensiones (N x H x W [x C])")
+        self.datos = np.ascontiguousarray(self.datos)
+
+    @classmethod
+    def desde_imagenes(cls, imagenes: Iterable[Imagen]) -> 'ImagenBatch':
+        """
+        Crea un lote a partir de una colección de imágenes del mismo tamaño.
+
+        Parámetros:
+            imagenes (Iterable[Imagen]): Imágenes a agrupar.
+
+        Retorna:
+            ImagenBatch: Lote con una copia contigua de los datos.
+
+        Raises:
+            ValueError: Si la colección está vacía o las imágenes tienen formas diferentes.
+        """
+        datos = [img.datos for img in imagenes]
+        if not datos:
+            raise ValueError("Se requiere al menos una imagen")
+        if len({d.shape for d in datos}) != 1:
+            raise ValueError("Las imágenes deben tener la misma forma")
+        return cls(np.stack(datos))
+
+    def a_imagenes(self) -> list[Imagen]:
+        """
+        Retorna las imágenes del lote como instancias de Imagen.
+
+        Las imágenes son vistas sobre el arreglo del lote (no se copian los datos).
+
+        Retorna:
+            list[Imagen]: Una Imagen por elemento del lote.
+        """
+        return [Imagen(d) for d in self.datos]
+
+    def __len__(self) -> int:
+        return self.datos.shape[0]
+
+    def __getitem__(self, indice: int) -> Imagen:
+        return Imagen(self.datos[indice])
+
+    def _almacenar(self, datos: np.ndarray, blanco: Optional[float] = 1.0) -> np.ndarray:
+        """
+        Guarda un resultado según la política de precisión global (ver Imagen._almacenar);
+        la escala de los datos flotantes se detecta sobre el lote completo.
+        """
+        return Imagen(self.datos)._almacenar(datos, blanco)
+
+    def normalizar(self) -> 'ImagenBatch':
+        """
+        Normaliza todas las imágenes al rango [0, 1] (ver Imagen.normalizar).
+
+        Retorna:
+            ImagenBatch: La instancia actual (para encadenamiento).
+        """
+        self.datos = _normalizado(self.datos, Precision.obtener_precision())
+        return self
+
+    def desnormalizar(self) -> 'ImagenBatch':
+        """
+        Desnormaliza todas las imágenes al rango [0, 255] en uint8 (ver Imagen.desnormalizar).
+
+        Retorna:
+            ImagenBatch: La instancia actual (para encadenamiento).
+        """
+        self.datos = _desnormalizado(self.datos)
+        return self
+
+    def invertir(self) -> 'ImagenBatch':
+        """
+        Invierte los colores de todas las imágenes.
+
+        Retorna:
+            ImagenBatch: La instancia actual (para encadenamiento).
+        """
+        self.datos = _invertido(self.datos, Precision.obtener_precision())
+        return self
+
+    def extraer_capa_rgb(self, indice: int) -> 'ImagenBatch':
+        """
+        Extrae una capa RGB de todas las imágenes (ver Imagen.extraer_capa_rgb).
+
+        Retorna:
+            ImagenBatch: Nuevo lote con la capa especificada.
+        """
+        return ImagenBatch(self._almacenar(_capa_rgb(self.datos, indice), blanco=None))
+
+    def extraer_capa_cmyk(self, indice: int) -> 'ImagenBatch':
+        """
+        Extrae una capa CMYK simulada de todas las imágenes (ver Imagen.extraer_capa_cmyk).
+
+        Retorna:
+            ImagenBatch: Nuevo lote con la capa especificada.
+        """
+        return ImagenBatch(self._almacenar(_capa_cmyk(self.datos, indice), blanco=None))
+
+    def mean_filter(self, kernel_size: Union[int, tuple[int, int]] = 3) -> 'ImagenBatch':
+        """
+        Aplica el filtro de promedio a cada imagen del lote (ver Imagen.mean_filter).
+
+        Retorna:
+            ImagenBatch: La instancia actual (para encadenamiento).
+        """
+        alto, ancho = _dimensiones_kernel(kernel_size)
+        self.datos = self._almacenar(_filtro_caja(self.datos, alto, ancho, ejes=(1, 2)), blanco=None)
+        return self
+
+    def _gris(self, plano_gris, canales: int) -> np.ndarray:
+        """
+        Calcula los planos de grises del lote (o reutiliza los datos si ya son de un canal).
+        """
+        plano = self.datos if self.datos.ndim == 3 else plano_gris(self.datos)
+        return _expandir_gris(self._almacenar(plano, blanco=None), canales)
+
+    def gris_promedio(self, canales: int = 1) -> 'ImagenBatch':
+        """
+        Convierte el lote a escala de grises por promedio de canales (ver Imagen.gris_promedio).
+
+        Retorna:
+            ImagenBatch: Nuevo lote en escala de grises (N x H x W con un canal).
+        """
+        return ImagenBatch(self._gris(_gris_promedio, canales))
+
+    def gris_luminosidad(self, canales: int = 1) -> 'ImagenBatch':
+        """
+        Convierte el lote a escala de grises con la fórmula de luminosidad (ver Imagen.gris_luminosidad).
+
+        Retorna:
+            ImagenBatch: Nuevo lote en escala de grises (N x H x W con un canal).
+        """
+        return ImagenBatch(self._gris(_gris_luminosidad, canales))
+
+    def gris_tonalidad(self, canales: int = 1) -> 'ImagenBatch':
+        """
+        Convierte el lote a escala de grises con el método de tonalidad (ver Imagen.gris_tonalidad).
+
+        Retorna:
+            ImagenBatch: Nuevo lote en escala de grises (N x H x W con un canal).
+        """
+        return ImagenBatch(self._gris(_gris_tonalidad, canales))
+
+    def ajustar(self, factor: float) -> 'ImagenBatch':
+        """
+        Ajusta el contraste o la intensidad de todo el lote (ver Imagen.ajustar).
+
+        Nota:
+            La detección del rango de valores ([0, 1] o [0, 255]) se hace sobre el lote
+            completo, por lo que todas las imágenes deben estar en la misma escala.
+
+        Retorna:
+            ImagenBatch: La instancia actual (para encadenamiento).
+        """
+        filtro = FiltroFactory.obtener_filtro(factor)
+        self.datos = filtro.aplicar(Imagen(self.datos)).datos
+        return self
+
+    def _convertir(self, conversion: str) -> 'ImagenBatch':
+        """
+        Convierte todo el lote con el núcleo de ColorSpaces (ver ColorConverter).
+
+        La escala de las entradas RGB ([0, 1] o [0, 255]) se decide por imagen, igual que al
+        convertir cada imagen por separado: si todas coinciden se usa una sola llamada sobre
+        el lote y, si no, una por imagen sobre la misma salida.
+        """
+        canales, nombre, nucleo, canales_salida, escalar = _CONVERSIONES[conversion]
+        if self.datos.ndim != 4 or self.datos.shape[-1] != canales:
+            raise ValueError(f"Las imágenes deben tener {canales} canales ({nombre})")
+        escalas = np.ones(len(self))
+        if escalar and self.datos[0].size:
+            maximos = self.datos.reshape(len(self), -1).max(axis=1)
+            escalas[maximos > 1] = 1.0 / 255.0
+        salida = np.empty(self.datos.shape[:-1] + (canales_salida,), dtype=np.float32)
+        if np.all(escalas == escalas[0]):
+            ColorSpaces.convertir_por_bloques(self.datos, nucleo, canales_salida, escalas[0], salida)
+        else:
+            for datos, escala, destino in zip(self.datos, escalas, salida):
+                ColorSpaces.convertir_por_bloques(datos, nucleo, canales_salida, escala, destino)
+        # L*a*b* no está en [0, 1]: se conserva en float32 con cualquier política.
+        return ImagenBatch(salida if conversion == "rgb_a_lab" else self._almacenar(salida))
+
+    def rgb_a_cmyk(self) -> 'ImagenBatch':
+        """
+        Convierte todo el lote de RGB a CMYK (ver ColorConverter.rgb_a_cmyk).
+
+        Retorna:
+            ImagenBatch: Nuevo lote con 4 canales en el rango [0, 1].
+        """
+        return self._convertir("rgb_a_cmyk")
+
+    def cmyk_a_rgb(self) -> 'ImagenBatch':
+        """
+        Convierte todo el lote de CMYK a RGB (ver ColorConverter.cmyk_a_rgb).
+
+        Retorna:
+            ImagenBatch: Nuevo lote con 3 canales en el rango [0, 1].
+        """
+        return self._convertir("cmyk_a_rgb")
+
+    def rgb_a_hsv(self) -> 'ImagenBatch':
+        """
+        Convierte todo el lote de RGB a HSV (ver ColorConverter.rgb_a_hsv).
+
+        Retorna:
+            ImagenBatch: Nuevo lote HSV con los tres canales en el rango [0, 1].
+        """
+        return self._convertir("rgb_a_hsv")
+
+    def hsv_a_rgb(self) -> 'ImagenBatch':
+        """
+        Convierte todo el lote de HSV a RGB (ver ColorConverter.hsv_a_rgb).
+
+        Retorna:
+            ImagenBatch: Nuevo lote RGB en el rango [0, 1].
+        """
+        return self._convertir("hsv_a_rgb")
+
+    def rgb_a_ycbcr(self) -> 'ImagenBatch':
+        """
+        Convierte todo el lote de RGB a YCbCr (ver ColorConverter.rgb_a_ycbcr).
+
+        Retorna:
+            ImagenBatch: Nuevo lote YCbCr en el rango [0, 1].
+        """
+        return self._convertir("rgb_a_ycbcr")
+
+    def ycbcr_a_rgb(self) -> 'ImagenBatch':
+        """
+        Convierte todo el lote de YCbCr a RGB (ver ColorConverter.ycbcr_a_rgb).
+
+        Retorna:
+            ImagenBatch: Nuevo lote RGB en el rango [0, 1].
+        """
+        return self._convertir("ycbcr_a_rgb")
+
+    def rgb_a_lab(self) -> 'ImagenBatch':
+        """
+        Convierte todo el lote de RGB a CIE L*a*b* (ver ColorConverter.rgb_a_lab).
+
+        Retorna:
+            ImagenBatch: Nuevo lote Lab en float32 (L en [0, 100]).
+        """
+        return self._convertir("rgb_a_lab")
+
+    def lab_a_rgb(self) -> 'ImagenBatch':
+        """
+        Convierte todo el lote de CIE L*a*b* a RGB (ver ColorConverter.lab_a_rgb).
+
+        Retorna:
+            ImagenBatch: Nuevo lote RGB en el rango [0, 1].
+        """
+        return self._convertir("lab_a_rgb")
+
+    def fusionar(self, pesos: Optional[Sequence[float]] = None, dtype: Optional[np.dtype] = None,
+                 modo: str = "suma") -> Imagen:
+        """
+        Fusiona todas las imágenes del lote en una sola (ver Imagen.fusionar_ecualizado).
+
+        Si los datos ya están en el tipo del acumulador, la suma ponderada se calcula con una
+        única llamada a np.tensordot; en otro caso se acumula imagen por imagen para no crear
+        una copia convertida de todo el lote.
+
+        Parámetros:
+            pesos (Sequence[float] | None): Un factor por imagen (por defecto, todos 1).
+            dtype (np.dtype | None): Tipo del acumulador.
+            modo (str): 'suma', 'saturar' o 'normalizar'.
+
+        Retorna:
+            Imagen: Imagen resultante de la fusión.
+
+        Raises:
+            ValueError: Si el modo no es válido o el número de pesos no coincide con el
+                tamaño del lote.
+        """
+        if modo not in _MODOS_FUSION:
+            raise ValueError(f"Modo de fusión no soportado: {modo}")
+        ponderado = pesos is not None
+        pesos = np.ones(len(self)) if pesos is None else np.asarray(pesos, dtype=np.float64)
+        if pesos.shape != (len(self),):
+            raise ValueError("Debe indicarse un factor por cada imagen del lote")
+        tipo = np.dtype(dtype or _tipo_acumulador(self.datos.dtype, ponderado))
+        if self.datos.dtype == tipo and np.issubdtype(tipo, np.floating):
+            acumulado = np.tensordot(pesos.astype(tipo), self.datos, axes=1)
+            return Imagen(_finalizar_fusion(acumulado, self.datos.dtype, modo, float(pesos.sum()),
+                                            Precision.obtener_precision()))
+        return _fusionar_flujo(zip(self.a_imagenes(), pesos.tolist()), tipo, modo, ponderado)
@@ -0,0 +1,275 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Sequence
+import numpy as np
+
+from . import Precision
+from .ImageProcessor import Imagen
+
+
+@dataclass
+class EstadisticasCache:
+    """
+    Contadores de uso de una CacheImagenes.
+
+    Atributos:
+        aciertos (int): Solicitudes resueltas desde la memoria.
+        aciertos_disco (int): Solicitudes resueltas desde el disco (y promovidas a memoria).
+        fallos (int): Solicitudes que requirieron decodificar o calcular el resultado.
+        desalojos (int): Entradas expulsadas de la memoria por el límite de bytes.
+        entradas (int): Entradas actualmente en memoria.
+        bytes_en_memoria (int): Bytes ocupados por las entradas en memoria.
+    """
+    aciertos: int = 0
+    aciertos_disco: int = 0
+    fallos: int = 0
+    desalojos: int = 0
+    entradas: int = 0
+    bytes_en_memoria: int = 0
+
+    @property
+    def tasa_aciertos(self) -> float:
+        solicitudes = self.aciertos + self.aciertos_disco + self.fallos
+        return (self.aciertos + self.aciertos_disco) / solicitudes if solicitudes else 0.0
+
+
+class CacheImagenes:
+    """
+    Caché de imágenes decodificadas y de resultados de cadenas de operaciones.
+
+    Cada entrada se identifica por su origen (ruta del archivo con su fecha de modificación
+    y tamaño, o un hash del contenido) junto con las opciones de carga y la secuencia de
+    operaciones con sus parámetros (ver Imagen.aplicar_operaciones). Tiene dos niveles:
+
+      - Memoria: LRU limitada por el número total de bytes de los arreglos almacenados.
+      - Disco (opcional): archivos .npy en un directorio, que sobreviven a los desalojos
+        y al reinicio del proceso.
+
+    Las imágenes decodificadas se guardan también por separado, de modo que cadenas
+    distintas sobre el mismo archivo comparten la decodificación. Los resultados de las
+    cadenas dependen de la política de precisión (ver Precision), que forma parte de la
+    clave, y los flotantes se guardan en su tipo de caché (float16 con la política
+    'float16', con la mitad de memoria y de disco). Los arreglos almacenados son de solo
+    lectura y cada solicitud retorna una Imagen nueva que los comparte sin
+    copiarlos; si se modifica, se copia primero (ver Imagen.bifurcar).
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, directorio: Optional[str] = None,
+                 por_contenido: bool = False) -> None:
+        """
+        Parámetros:
+            max_bytes (int): Límite de bytes del nivel en memoria.
+            directorio (str | None): Directorio del nivel en disco (None para desactivarlo).
+            por_contenido (bool): Si es True, los archivos se identifican por el hash de su
+                contenido en lugar de por su ruta y fecha de modificación.
+        """
+        if max_bytes < 0:
+            raise ValueError("El límite de bytes no puede ser negativo")
+        self.max_bytes = max_bytes
+        self.directorio = directorio
+        self.por_contenido = por_contenido
+        self._entradas: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._estadisticas = EstadisticasCache()
+        self._bloqueo = threading.Lock()
+        if directorio is not None:
+            os.makedirs(directorio, exist_ok=True)
+
+    @property
+    def estadisticas(self) -> EstadisticasCache:
+        """Copia de los contadores actuales."""
+        with self._bloqueo:
+            return EstadisticasCache(**vars(self._estadisticas))
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def identificar_archivo(self, ruta: str) -> str:
+        """
+        Retorna el identificador de un archivo: hash SHA-256 de su contenido, o su ruta
+        absoluta con la fecha de modificación y el tamaño (según `por_contenido`).
+        """
+        if self.por_contenido:
+            resumen = hashlib.sha256()
+            with open(ruta, "rb") as archivo:
+                for bloque in iter(lambda: archivo.read(1 << 20), b""):
+                    resumen.update(bloque)
+            return "sha256:" + resumen.hexdigest()
+        info = os.stat(ruta)
+        return f"{os.path.abspath(ruta)}|{info.st_mtime_ns}|{info.st_size}"
+
+    @staticmethod
+    def identificar_arreglo(datos: np.ndarray) -> str:
+        """
+        Retorna un identificador del contenido de un arreglo (hash de sus bytes, forma y tipo).
+        """
+        resumen = hashlib.sha256(np.ascontiguousarray(datos).data)
+        return f"sha256:{resumen.hexdigest()}|{datos.shape}|{datos.dtype.str}"
+
+    @classmethod
+    def _serializar(cls, valor: object) -> object:
+        """
+        Representación exacta de un argumento para la clave: los arreglos se identifican por
+        su contenido (ver identificar_arreglo) y los flotantes por su valor hexadecimal, en
+        lugar de por su repr (que NumPy abrevia y redondea).
+
+        Raises:
+            ValueError: Si el tipo del argumento no puede serializarse de forma exacta.
+        """
+        if isinstance(valor, np.ndarray):
+            return "ndarray", cls.identificar_arreglo(valor)
+        if isinstance(valor, (list, tuple)):
+            return type(valor).__name__, tuple(cls._serializar(elemento) for elemento in valor)
+        if isinstance(valor, (float, np.floating)):
+            return type(valor).__name__, float(valor).hex()
+        if valor is None or isinstance(valor, (bool, int, str, np.integer, np.bool_)):
+            return type(valor).__name__, str(valor)
+        raise ValueError(f"Argumento no admitido en la clave de caché: {type(valor).__name__}")
+
+    @classmethod
+    def _clave(cls, origen: str, operaciones: Sequence[Sequence], opciones: dict,
+               politica: Precision.PoliticaPrecision) -> str:
+        # La decodificación no depende de la política: se comparte entre todas.
+        precision = politica.nombre if operaciones else None
+        texto = repr((origen, sorted((nombre, cls._serializar(valor)) for nombre, valor in opciones.items()),
+                      [(op[0],) + cls._serializar(tuple(op[1:]))[1] for op in operaciones], precision))
+        return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+    def cargar(self, ruta: str, operaciones: Sequence[Sequence] = (), **opciones_carga) -> Imagen:
+        """
+        Carga un archivo (ver Imagen.desde_archivo) y le aplica una cadena de operaciones,
+        reutilizando el resultado si ya está en la caché.
+
+        Parámetros:
+            ruta (str): Ruta al archivo de imagen.
+            operaciones (Sequence[Sequence]): Cadena de operaciones, p. ej. [('ajustar', -0.8)].
+            **opciones_carga: Opciones de Imagen.desde_archivo (tamano, escala, modo).
+
+        Retorna:
+            Imagen: Nueva Imagen que comparte (solo lectura) el arreglo almacenado.
+
+        Raises:
+            ValueError: Si algún argumento no puede formar parte de la clave (ver _serializar).
+        """
+        politica = Precision.obtener_precision()
+        origen = self.identificar_archivo(ruta)
+        clave = self._clave(origen, operaciones, opciones_carga, politica)
+        datos = self._buscar(clave)
+        if datos is None:
+            if operaciones:
+                fuente = self.cargar(ruta, **opciones_carga)
+            else:
+                fuente = Imagen.desde_archivo(ruta, **opciones_carga)
+            datos = self._almacenar(clave, fuente.aplicar_operaciones(operaciones).datos, politica)
+        return Imagen(datos)
+
+    def aplicar(self, imagen: Imagen, operaciones: Sequence[Sequence]) -> Imagen:
+        """
+        Aplica una cadena de operaciones a una imagen en memoria, identificada por su contenido.
+
+        Parámetros:
+            imagen (Imagen): Imagen de entrada (no se modifica).
+            operaciones (Sequence[Sequence]): Cadena de operaciones.
+
+        Retorna:
+            Imagen: Nueva Imagen que comparte (solo lectura) el arreglo almacenado.
+
+        Raises:
+            ValueError: Si algún argumento no puede formar parte de la clave (ver _serializar).
+        """
+        politica = imagen._politica()
+        clave = self._clave(self.identificar_arreglo(imagen.datos), operaciones, {}, politica)
+        datos = self._buscar(clave)
+        if datos is None:
+            # La cadena trabaja sobre una vista privada de solo lectura: las operaciones de
+            # pintado copian antes de escribir y la imagen del llamador no cambia.
+            vista = imagen.datos.view()
+            vista.flags.writeable = False
+            resultado = Imagen(vista, imagen.precision).aplicar_operaciones(operaciones).datos
+            if np.shares_memory(resultado, imagen.datos):
+                # La entrada sigue siendo del llamador; la caché guarda su propia copia.
+                resultado = resultado.copy()
+            datos = self._almacenar(clave, resultado, politica)
+        return Imagen(datos, imagen.precision)
+
+    def _ruta_disco(self, clave: str) -> str:
+        return os.path.join(self.directorio, clave + ".npy")
+
+    def _buscar(self, clave: str) -> Optional[np.ndarray]:
+        """
+        Busca una entrada en memoria y luego en disco, actualizando los contadores.
+        """
+        with self._bloqueo:
+            datos = self._entradas.get(clave)
+            if datos is not None:
+                self._entradas.move_to_end(clave)
+                self._estadisticas.aciertos += 1
+                return datos
+        if self.directorio is not None and os.path.exists(self._ruta_disco(clave)):
+            try:
+                datos = np.load(self._ruta_disco(clave))
+            except (OSError, ValueError):
+                datos = None
+            if datos is not None:
+                datos.flags.writeable = False
+                with self._bloqueo:
+                    self._estadisticas.aciertos_disco += 1
+                    self._insertar(clave, datos)
+                return datos
+        with self._bloqueo:
+            self._estadisticas.fallos += 1
+        return None
+
+    def _almacenar(self, clave: str, datos: np.ndarray, politica: Precision.PoliticaPrecision) -> np.ndarray:
+        """
+        Guarda un resultado (en el tipo de caché de la política) en memoria y, si está activo,
+        en disco. Retorna el arreglo almacenado.
+        """
+        datos = politica.a_cache(np.asarray(datos)).view()
+        datos.flags.writeable = False
+        if self.directorio is not None:
+            # Escritura atómica: otro proceso nunca ve un archivo a medio escribir.
+            descriptor, temporal = tempfile.mkstemp(dir=self.directorio, suffix=".tmp")
+            try:
+                with os.fdopen(descriptor, "wb") as archivo:
+                    np.save(archivo, datos)
+                os.replace(temporal, self._ruta_disco(clave))
+            except OSError:
+                if os.path.exists(temporal):
+                    os.remove(temporal)
+        with self._bloqueo:
+            self._insertar(clave, datos)
+        return datos
+
+    def _insertar(self, clave: str, datos: np.ndarray) -> None:
+        """
+        Inserta una entrada en el nivel de memoria y desaloja las menos usadas (requiere el bloqueo).
+        """
+        if datos.nbytes > self.max_bytes:
+            return
+        anterior = self._entradas.pop(clave, None)
+        if anterior is not None:
+            self._estadisticas.bytes_en_memoria -= anterior.nbytes
+        self._entradas[clave] = datos
+        self._estadisticas.bytes_en_memoria += datos.nbytes
+        while self._estadisticas.bytes_en_memoria > self.max_bytes:
+            _, desalojado = self._entradas.popitem(last=False)
+            self._estadisticas.bytes_en_memoria -= desalojado.nbytes
+            self._estadisticas.desalojos += 1
+        self._estadisticas.entradas = len(self._entradas)
+
+    def limpiar(self, disco: bool = False) -> None:
+        """
+        Vacía el nivel en memoria y, opcionalmente, el nivel en disco. Los contadores se conservan.
+        """
+        with self._bloqueo:
+            self._entradas.clear()
+            self._estadisticas.bytes_en_memoria = 0
+            self._estadisticas.entradas = 0
+        if disco and self.directorio is not None:
+            for nombre in os.listdir(self.directorio):
+                if nombre.endswith(".npy"):
+                    os.remove(os.path.join(self.directorio, nombre))
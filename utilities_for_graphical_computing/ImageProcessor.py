@@ -1,19 +1,351 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
+from functools import cached_property, lru_cache
+from typing import Callable, Iterable, Iterator, Optional, Sequence, Union
 import numpy as np
-from PIL import Image
 
-def _normalizar_datos(datos: np.ndarray) -> np.ndarray:
+from . import ColorSpaces, Drawing, Histogram, Precision, Resampling
+from .Instrumentation import instrumentado
+
+def _curva_contraste(datos_norm: np.ndarray, factor: float, out: np.ndarray = None) -> np.ndarray:
+    """
+    Evalúa la curva de contraste logarítmica sobre datos normalizados en [0, 1].
+
+    Parámetros:
+        datos_norm (np.ndarray): Datos normalizados.
+        factor (float): Proporción (positiva) de la transformación logarítmica.
+        out (np.ndarray): Arreglo de salida opcional (puede ser el mismo que la entrada).
+
+    Retorna:
+        np.ndarray: (1 - factor) * x + factor * c * log10(1 + x), con c = 1 / log10(2).
+    """
+    c = 1.0 / np.log10(2.0)
+    log_img = np.log10(1.0 + datos_norm)
+    log_img *= factor * c
+    out = np.multiply(datos_norm, 1 - factor, out=out)
+    out += log_img
+    return out
+
+
+def _curva_intensidad(datos_norm: np.ndarray, factor: float, out: np.ndarray = None) -> np.ndarray:
+    """
+    Evalúa la curva de intensidad exponencial sobre datos normalizados en [0, 1].
+
+    Parámetros:
+        datos_norm (np.ndarray): Datos normalizados.
+        factor (float): Proporción (positiva) de la transformación exponencial.
+        out (np.ndarray): Arreglo de salida opcional (puede ser el mismo que la entrada).
+
+    Retorna:
+        np.ndarray: (1 - factor) * x + factor * (e^x - 1) / (e - 1).
+    """
+    exp_img = np.exp(datos_norm)
+    exp_img -= 1.0
+    exp_img *= factor / (np.e - 1.0)
+    out = np.multiply(datos_norm, 1 - factor, out=out)
+    out += exp_img
+    return out
+
+
+# Reparte una función sobre el rango [0, n) de un eje: recibe la función, que se llama con
+# sub-rangos (slice) disjuntos que cubren todo el rango, y el tamaño n.
+Repartidor = Callable[[Callable[[slice], None], int], None]
+
+
+def _repartir_serie(funcion: Callable[[slice], None], n: int) -> None:
+    """
+    Repartidor secuencial: procesa todo el rango de una vez.
+    """
+    funcion(slice(0, n))
+
+
+def _filtro_caja(datos: np.ndarray, alto: int, ancho: int, ejes: tuple[int, int] = (0, 1),
+                 repartir: Repartidor = _repartir_serie, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
-    Normaliza el arreglo de imagen a rango [0, 1] si es necesario.
+    Aplica un filtro de caja (promedio) de tamaño alto x ancho sobre dos ejes del arreglo.
+
+    Usa una tabla de áreas sumadas (summed-area table) sobre los datos con padding 'reflect',
+    de modo que el costo por píxel es constante e independiente del tamaño del kernel.
+    Los datos enteros se acumulan en int64 (sumas exactas, resultado truncado como en la
+    versión por píxel) y los flotantes en float64, conservando el tipo de dato original.
+
+    Cada etapa opera sobre líneas independientes (la suma acumulada por filas es
+    independiente entre columnas, la acumulada por columnas entre filas, y las diferencias
+    finales entre píxeles), por lo que `repartir` puede ejecutarlas por bandas en paralelo
+    con un resultado idéntico bit a bit al secuencial.
 
     Parámetros:
-        datos (np.ndarray): Arreglo de imagen.
+        datos (np.ndarray): Arreglo de imagen (H x W, H x W x C o N x H x W x C).
+        alto (int): Alto del kernel (impar).
+        ancho (int): Ancho del kernel (impar).
+        ejes (tuple[int, int]): Ejes de filas y columnas (por defecto, los dos primeros).
+        repartir (Repartidor): Estrategia para repartir cada etapa (por defecto, secuencial).
+        out (np.ndarray | None): Arreglo preasignado para el resultado.
 
     Retorna:
-        np.ndarray: Arreglo normalizado.
+        np.ndarray: Arreglo filtrado con la misma forma y tipo que la entrada.
+    """
+    if alto == 1 and ancho == 1:
+        if out is None:
+            return datos.copy()
+        np.copyto(out, datos)
+        return out
+    eje_y, eje_x = ejes
+    pad = [(0, 0)] * datos.ndim
+    pad[eje_y] = (alto // 2, alto // 2)
+    pad[eje_x] = (ancho // 2, ancho // 2)
+    datos_padded = np.pad(datos, pad, mode="reflect")
+    entero = np.issubdtype(datos.dtype, np.integer)
+    acumulador = np.int64 if entero else np.float64
+    todo = slice(None)
+
+    def indice(filas: slice, columnas: slice) -> tuple:
+        idx = [slice(None)] * datos.ndim
+        idx[eje_y], idx[eje_x] = filas, columnas
+        return tuple(idx)
+
+    # Tabla con una fila y una columna de ceros al inicio para evitar casos de borde.
+    forma = list(datos_padded.shape)
+    forma[eje_y] += 1
+    forma[eje_x] += 1
+    tabla = np.zeros(forma, dtype=acumulador)
+    interior = tabla[indice(slice(1, None), slice(1, None))]
+
+    def acumular_filas(columnas: slice) -> None:
+        np.cumsum(datos_padded[indice(todo, columnas)], axis=eje_y, dtype=acumulador,
+                  out=interior[indice(todo, columnas)])
+
+    def acumular_columnas(filas: slice) -> None:
+        np.cumsum(interior[indice(filas, todo)], axis=eje_x, out=interior[indice(filas, todo)])
+
+    resultado = np.empty(datos.shape, dtype=datos.dtype) if out is None else out
+
+    def diferencias(filas: slice) -> None:
+        abajo = slice(filas.start + alto, filas.stop + alto)
+        suma = tabla[indice(abajo, slice(ancho, None))] - tabla[indice(filas, slice(ancho, None))]
+        suma -= tabla[indice(abajo, slice(None, -ancho))]
+        suma += tabla[indice(filas, slice(None, -ancho))]
+        if entero:
+            suma //= alto * ancho
+        else:
+            suma /= alto * ancho
+        np.copyto(resultado[indice(filas, todo)], suma, casting="unsafe")
+
+    repartir(acumular_filas, interior.shape[eje_x])
+    repartir(acumular_columnas, interior.shape[eje_y])
+    repartir(diferencias, datos.shape[eje_y])
+    return resultado
+
+
+def _dimensiones_kernel(kernel_size: Union[int, tuple[int, int]]) -> tuple[int, int]:
+    """
+    Valida el tamaño de un kernel y lo retorna como (alto, ancho).
+
+    Raises:
+        ValueError: Si alguna dimensión del kernel es par o no positiva.
+    """
+    alto, ancho = (kernel_size, kernel_size) if isinstance(kernel_size, int) else kernel_size
+    if alto % 2 == 0 or ancho % 2 == 0:
+        raise ValueError("El tamaño del kernel debe ser impar")
+    if alto < 1 or ancho < 1:
+        raise ValueError("El tamaño del kernel debe ser positivo")
+    return alto, ancho
+
+
+# Canales RGB que conserva la versión de visualización de cada plano.
+_CANALES_RGB = {"R": (0,), "G": (1,), "B": (2,)}
+_CANALES_CMYK = {"C": (1, 2), "M": (0, 2), "Y": (0, 1), "K": ()}
+
+
+def _capa_canales(datos: np.ndarray, canales: tuple[int, ...]) -> np.ndarray:
+    """
+    Retorna un arreglo con la forma de `datos` que conserva solo los canales indicados (último eje).
+    """
+    capa = np.zeros_like(datos)
+    for canal in canales:
+        capa[..., canal] = datos[..., canal]
+    return capa
+
+
+def _capa_rgb(datos: np.ndarray, indice: int) -> np.ndarray:
+    """
+    Retorna un arreglo con solo la capa RGB indicada (las demás en cero), sobre el último eje.
+    """
+    if datos.ndim < 3 or datos.shape[-1] != 3:
+        raise ValueError("La imagen debe tener 3 canales")
+    if not (0 <= indice <= 2):
+        raise ValueError("El índice debe estar entre 0 y 2")
+    return _capa_canales(datos, _CANALES_RGB["RGB"[indice]])
+
+
+def _capa_cmyk(datos: np.ndarray, indice: int) -> np.ndarray:
+    """
+    Retorna un arreglo con la capa CMYK simulada indicada, sobre el último eje.
+
+    Cyan conserva G y B, magenta conserva R y B, yellow conserva R y G y black es cero.
+    """
+    if datos.ndim < 3 or datos.shape[-1] != 3:
+        raise ValueError("La imagen debe tener 3 canales para RGB")
+    if not (0 <= indice <= 3):
+        raise ValueError("El índice debe estar entre 0 y 3")
+    return _capa_canales(datos, _CANALES_CMYK["CMYK"[indice]])
+
+
+# Pesos de la fórmula de luminosidad (R, G, B).
+_PESOS_LUMINOSIDAD = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def _tipo_gris(tipo: np.dtype) -> np.dtype:
+    """
+    Tipo de los planos de grises: float32, o float64 si los datos ya lo son.
+    """
+    return np.result_type(tipo, np.float32) if np.issubdtype(tipo, np.floating) else np.dtype(np.float32)
+
+
+def _gris_promedio(datos: np.ndarray) -> np.ndarray:
+    """
+    Plano de escala de grises por promedio de canales (último eje).
+    """
+    return np.mean(datos, axis=-1, dtype=_tipo_gris(datos.dtype))
+
+
+def _gris_luminosidad(datos: np.ndarray) -> np.ndarray:
+    """
+    Plano de escala de grises por luminosidad (0.299 R + 0.587 G + 0.114 B).
+
+    Se calcula como un único producto matriz-vector en float32.
+    """
+    if datos.shape[-1] < 3:
+        raise ValueError("La imagen debe tener al menos 3 canales")
+    return np.matmul(datos[..., :3], _PESOS_LUMINOSIDAD.astype(_tipo_gris(datos.dtype)))
+
+
+def _gris_tonalidad(datos: np.ndarray) -> np.ndarray:
+    """
+    Plano de escala de grises por tonalidad ((máximo + mínimo) / 2).
+    """
+    if datos.shape[-1] < 3:
+        raise ValueError("La imagen debe tener al menos 3 canales")
+    gray = np.add(np.max(datos, axis=-1), np.min(datos, axis=-1), dtype=_tipo_gris(datos.dtype))
+    gray *= 0.5
+    return gray
+
+
+def _expandir_gris(plano: np.ndarray, canales: int) -> np.ndarray:
+    """
+    Retorna el plano de grises con `canales` canales idénticos.
+
+    Con un canal se retorna el plano (H x W) tal cual; con más, una vista de difusión de
+    solo lectura (sin copiar los datos) sobre un nuevo último eje.
+    """
+    if canales == 1:
+        return plano
+    if canales < 1:
+        raise ValueError("El número de canales debe ser positivo")
+    return np.broadcast_to(plano[..., np.newaxis], plano.shape + (canales,))
+
+
+def _tamano_decodificado(tamano_original: tuple[int, int], tamano: Optional[tuple[int, int]],
+                         escala: Optional[float]) -> tuple[int, int]:
+    """
+    Calcula el tamaño (ancho, alto) de Pillow al que debe decodificarse una imagen.
+
+    Parámetros:
+        tamano_original (tuple[int, int]): Tamaño (ancho, alto) del archivo.
+        tamano (tuple[int, int] | None): Tamaño máximo (alto, ancho) pedido.
+        escala (float | None): Factor de escala pedido.
+
+    Retorna:
+        tuple[int, int]: Tamaño (ancho, alto) de destino; nunca mayor que el original.
+    """
+    ancho, alto = tamano_original
+    if tamano is not None:
+        escala = min(tamano[0] / alto, tamano[1] / ancho, 1.0)
+    if escala is None or escala >= 1:
+        return ancho, alto
+    return max(1, round(ancho * escala)), max(1, round(alto * escala))
+
+
+def _datos_uint8(datos: np.ndarray) -> np.ndarray:
+    """
+    Datos contiguos listos para codificarse: los flotantes se asumen en [0, 1] y se
+    convierten a uint8 (saturando y redondeando).
+    """
+    if np.issubdtype(datos.dtype, np.floating):
+        datos = np.rint(np.clip(datos, 0.0, 1.0) * 255).astype(np.uint8)
+    return np.ascontiguousarray(datos)
+
+
+def _normalizado(datos: np.ndarray, politica: 'Precision.PoliticaPrecision') -> np.ndarray:
+    """
+    Divide los datos por 255 en float32 y guarda el resultado según la política. En la
+    ruta uint8 los datos uint8 se retornan sin cambios: sus niveles ya representan [0, 1].
+    """
+    if politica.tipo == np.uint8 and datos.dtype == np.uint8:
+        return datos
+    return politica.almacenar(np.divide(datos, np.float32(255.0), dtype=np.float32))
+
+
+def _invertido(datos: np.ndarray, politica: 'Precision.PoliticaPrecision') -> np.ndarray:
+    """
+    Calcula 1 - datos según la política; en la ruta uint8, 255 - datos sobre los niveles.
     """
-    return datos.astype(np.float32) / 255.0 if datos.max() > 1 else datos.astype(np.float32)
+    if politica.tipo == np.uint8 and datos.dtype == np.uint8:
+        return np.subtract(255, datos, dtype=np.uint8)
+    return politica.almacenar(np.subtract(1, datos))
+
+
+def _desnormalizado(datos: np.ndarray) -> np.ndarray:
+    """
+    Lleva los datos a uint8 en [0, 255]: los flotantes se redondean y se saturan (ver
+    _datos_uint8) y los uint8 ya están en ese rango.
+    """
+    if np.issubdtype(datos.dtype, np.floating):
+        return _datos_uint8(datos)
+    if datos.dtype == np.uint8:
+        return datos
+    return (datos * 255).astype(np.uint8)
+
+
+@dataclass
+class Separacion:
+    """
+    Separación de una imagen en planos de color, obtenida en una sola pasada.
+
+    Los planos son arreglos de un solo canal (H x W): vistas sin copia sobre la imagen
+    original (RGB) o sobre un único arreglo compacto calculado para todos los planos (CMYK).
+    Las versiones de visualización de 3 canales solo se construyen al solicitarlas.
+
+    Atributos:
+        fuente (np.ndarray): Imagen RGB de la que se obtuvo la separación.
+        planos (dict[str, np.ndarray]): Plano de cada componente, por nombre.
+        canales (dict[str, tuple[int, ...]]): Canales RGB que conserva cada versión de visualización.
+    """
+    fuente: np.ndarray
+    planos: dict[str, np.ndarray]
+    canales: dict[str, tuple[int, ...]]
+
+    @property
+    def nombres(self) -> list[str]:
+        return list(self.planos)
+
+    def __getitem__(self, nombre: str) -> np.ndarray:
+        return self.planos[nombre]
+
+    def visualizar(self, nombre: str) -> 'Imagen':
+        """
+        Construye la versión de 3 canales de un plano (igual a extraer_capa_rgb/extraer_capa_cmyk).
+
+        Parámetros:
+            nombre (str): Nombre del plano ('R', 'G', 'B' o 'C', 'M', 'Y', 'K').
+
+        Retorna:
+            Imagen: Nueva imagen con los canales del plano y el resto en cero.
+
+        Raises:
+            KeyError: Si el nombre no corresponde a ningún plano.
+        """
+        return Imagen(_capa_canales(self.fuente, self.canales[nombre]))
 
 
 @dataclass
@@ -21,279 +353,1210 @@ class Imagen:
     """
     Clase que representa una imagen y encapsula operaciones sobre ella.
 
-    Permite el encadenamiento de métodos para realizar transformaciones de forma fluida.
-    """
-    datos: np.ndarray
+    Permite el encadenamiento de métodos para realizar transformaciones de forma fluida.
+
+    Modelo de memoria:
+        - Las operaciones aceptan `inplace`: con True actualizan la instancia actual y con
+          False retornan una nueva Imagen sin modificar la actual. Por defecto, las
+          operaciones de transformación (normalizar, invertir, mean_filter, ajustar, ...)
+          son en sitio y las de extracción (gris_*, extraer_capa_*) retornan una nueva.
+        - Las operaciones aceptan `out`: un arreglo preasignado donde se escribe el resultado.
+        - Las operaciones nunca escriben sobre el arreglo de entrada salvo las de pintado
+          (colorear_*, dibujar_*), que aplican copia en escritura: `bifurcar()` crea variantes
+          que comparten el arreglo sin copiarlo, y este solo se copia cuando una de ellas se
+          modifica.
+
+    Precisión:
+        Los resultados flotantes se calculan en float32 y se guardan según la política de
+        precisión (ver Precision): la global (establecer_precision) o la de la imagen, si
+        se indica en `precision`; las imágenes que producen sus operaciones la heredan.
+          - 'float32' (por defecto): resultados float32.
+          - 'float16': resultados float32 e intermedios en caché (niveles de la pirámide,
+            CacheImagenes) en float16, con la mitad de memoria.
+          - 'uint8': los resultados se redondean a niveles uint8 en [0, 255], que
+            representan [0, 1] (normalizar no cambia una imagen uint8 e invertir calcula
+            255 - valor).
+        Los resultados enteros (tablas de consulta y filtros sobre uint8) no dependen de la
+        política, y con `out` el tipo del resultado es el del arreglo preasignado.
+    """
+    datos: np.ndarray
+    precision: Optional[str] = field(default=None, compare=False)
+
+    def __setattr__(self, nombre: str, valor) -> None:
+        # Las estadísticas en caché corresponden a un arreglo concreto: se descartan al reemplazarlo.
+        if nombre == "datos":
+            self.__dict__.pop("_estadisticas", None)
+        object.__setattr__(self, nombre, valor)
+
+    @classmethod
+    @instrumentado
+    def desde_archivo(cls, ruta: str, tamano: Optional[tuple[int, int]] = None, escala: Optional[float] = None,
+                      modo: str = "RGB") -> 'Imagen':
+        """
+        Crea una instancia de Imagen a partir de un archivo.
+
+        Si se pide un tamaño o una escala menor, la imagen se decodifica directamente a
+        resolución reducida: en JPEG se usa el modo borrador de Pillow (escalado de 1/2 a 1/8
+        durante la decodificación) y en el resto de formatos una reducción entera previa al
+        remuestreo final. La conversión de modo solo se hace si el archivo no está ya en el
+        modo pedido, y el búfer decodificado se envuelve sin una copia adicional, por lo que
+        los datos retornados son de solo lectura (se copian al modificarlos, ver bifurcar).
+
+        Parámetros:
+            ruta (str): Ruta al archivo de imagen.
+            tamano (tuple[int, int] | None): Tamaño máximo (alto, ancho); se conserva la
+                proporción y nunca se amplía la imagen.
+            escala (float | None): Factor de escala en (0, 1] (alternativa a `tamano`).
+            modo (str): 'RGB' (H x W x 3) o 'L' (escala de grises de un canal, H x W).
+
+        Retorna:
+            Imagen: Instancia de Imagen.
+
+        Raises:
+            ValueError: Si los parámetros no son válidos o el archivo no se puede cargar.
+        """
+        if modo not in ("RGB", "L"):
+            raise ValueError("El modo debe ser 'RGB' o 'L'")
+        if tamano is not None and escala is not None:
+            raise ValueError("Indique solo uno de 'tamano' o 'escala'")
+        if escala is not None and not 0 < escala <= 1:
+            raise ValueError("La escala debe estar en el rango (0, 1]")
+        if tamano is not None and min(tamano) < 1:
+            raise ValueError("El tamaño debe ser positivo")
+        from PIL import Image
+        try:
+            with Image.open(ruta) as img:
+                destino = _tamano_decodificado(img.size, tamano, escala)
+                if destino != img.size:
+                    img.draft(modo, destino)
+                if img.mode != modo:
+                    img = img.convert(modo)
+                if destino != img.size:
+                    img = img.resize(destino, Image.Resampling.BILINEAR, reducing_gap=2.0)
+                datos = np.asarray(img)
+        except Exception as e:
+            raise ValueError(f"Error al cargar la imagen desde {ruta}: {e}")
+        return cls(datos)
+
+    @classmethod
+    @instrumentado
+    def desde_npy(cls, ruta: str, mmap_mode: Optional[str] = "r") -> 'Imagen':
+        """
+        Crea una instancia de Imagen a partir de un archivo .npy, mapeado en memoria por defecto.
+
+        Con un np.memmap los datos se leen del disco bajo demanda, lo que permite trabajar
+        con imágenes más grandes que la memoria disponible (ver EjecutorTeselas).
+
+        Parámetros:
+            ruta (str): Ruta al archivo .npy.
+            mmap_mode (str | None): Modo de np.load ('r', 'r+', 'c' o None para cargar en memoria).
+
+        Retorna:
+            Imagen: Instancia de Imagen respaldada por el archivo.
+        """
+        try:
+            datos = np.load(ruta, mmap_mode=mmap_mode)
+        except Exception as e:
+            raise ValueError(f"Error al cargar la imagen desde {ruta}: {e}")
+        return cls(datos)
+
+    @instrumentado
+    def guardar(self, ruta: str) -> 'Imagen':
+        """
+        Guarda la imagen en un archivo; el formato se deduce de la extensión.
+
+        Las imágenes flotantes se asumen en el rango [0, 1] y se convierten a uint8
+        (saturando y redondeando) antes de codificarse.
+
+        Parámetros:
+            ruta (str): Ruta del archivo de destino.
+
+        Retorna:
+            Imagen: La instancia actual (para encadenamiento).
+
+        Raises:
+            ValueError: Si la imagen no puede guardarse.
+        """
+        from PIL import Image
+        try:
+            Image.fromarray(_datos_uint8(self.datos)).save(ruta)
+        except Exception as e:
+            raise ValueError(f"Error al guardar la imagen en {ruta}: {e}")
+        return self
+
+    @instrumentado
+    def aplicar_operaciones(self, operaciones: Sequence[Sequence]) -> 'Imagen':
+        """
+        Aplica una secuencia de operaciones descritas como datos.
+
+        Cada operación es una tupla (nombre, *argumentos). El nombre puede ser un método de
+        Imagen (p. ej., ('ajustar', -0.8)) o una conversión de ColorConverter
+        (p. ej., ('rgb_a_cmyk',)). Al ser tuplas simples, las secuencias pueden enviarse a
+        otros procesos o usarse como claves.
+
+        Parámetros:
+            operaciones (Sequence[Sequence]): Operaciones a aplicar, en orden.
+
+        Retorna:
+            Imagen: Imagen resultante de la cadena.
+
+        Raises:
+            ValueError: Si alguna operación no existe.
+        """
+        imagen = self
+        for operacion in operaciones:
+            nombre, *argumentos = operacion
+            if not nombre.startswith("_") and callable(getattr(Imagen, nombre, None)):
+                imagen = getattr(imagen, nombre)(*argumentos)
+            elif not nombre.startswith("_") and callable(getattr(ColorConverter, nombre, None)):
+                imagen = getattr(ColorConverter, nombre)(imagen, *argumentos)
+            else:
+                raise ValueError(f"Operación no reconocida: {nombre}")
+        return imagen
+
+    def bifurcar(self) -> 'Imagen':
+        """
+        Crea una variante de la imagen que comparte sus datos sin copiarlos (copia en escritura).
+
+        Ambas instancias pasan a referenciar vistas de solo lectura del mismo arreglo; la
+        primera operación que necesite escribir sobre él (p. ej., colorear_pixel) hace una
+        copia privada. Las demás operaciones ya producen arreglos nuevos, por lo que bifurcar
+        muchas variantes desde una misma imagen no consume memoria adicional.
+
+        Retorna:
+            Imagen: Nueva instancia que comparte los datos.
+        """
+        compartido = self.datos.view()
+        compartido.flags.writeable = False
+        self.datos = compartido
+        return Imagen(compartido.view(), self.precision)
+
+    def _escribible(self) -> np.ndarray:
+        """
+        Retorna los datos listos para escritura, copiándolos si están compartidos o son de solo lectura.
+        """
+        self.__dict__.pop("_estadisticas", None)
+        if not self.datos.flags.writeable:
+            self.datos = np.array(self.datos)
+        return self.datos
+
+    def _politica(self) -> 'Precision.PoliticaPrecision':
+        """
+        Política de precisión de la imagen: la propia o, si no tiene, la global.
+        """
+        return Precision.obtener_precision(self.precision)
+
+    def _almacenar(self, datos: np.ndarray, blanco: Optional[float] = 1.0) -> np.ndarray:
+        """
+        Guarda un resultado en el tipo de la política de precisión (ver Precision.almacenar).
+
+        Parámetros:
+            datos (np.ndarray): Resultado calculado.
+            blanco (float | None): Valor del blanco en `datos`; None si el resultado está en la
+                misma escala que los datos actuales (solo se consulta en la ruta uint8).
+        """
+        politica = self._politica()
+        if blanco is None:
+            entero = politica.tipo == np.uint8 and np.issubdtype(datos.dtype, np.floating)
+            blanco = self._blanco() if entero else 1.0
+        return politica.almacenar(datos, blanco)
+
+    def _resultado(self, datos: np.ndarray, inplace: bool, out: Optional[np.ndarray] = None,
+                   blanco: Optional[float] = 1.0) -> 'Imagen':
+        """
+        Entrega el resultado de una operación según los parámetros `inplace` y `out`.
+
+        Sin `out`, el resultado se guarda según la política de precisión.
+
+        Parámetros:
+            datos (np.ndarray): Resultado calculado.
+            inplace (bool): Si es True se actualiza la instancia actual; si no, se crea una nueva.
+            out (np.ndarray | None): Arreglo donde debe quedar el resultado.
+            blanco (float | None): Valor del blanco en `datos` (ver _almacenar).
+
+        Retorna:
+            Imagen: La instancia actual o una nueva, según `inplace`.
+        """
+        if out is None:
+            datos = self._almacenar(datos, blanco)
+        elif datos is not out:
+            np.copyto(out, datos, casting="same_kind")
+            datos = out
+        if inplace:
+            self.datos = datos
+            return self
+        return Imagen(datos, self.precision)
+
+    @instrumentado
+    def normalizar(self, inplace: bool = True, out: Optional[np.ndarray] = None) -> 'Imagen':
+        """
+        Normaliza la imagen para que sus valores estén en el rango [0, 1].
+
+        El resultado es float32 (ver la política de precisión); en la ruta uint8 una imagen
+        uint8 no cambia.
+
+        Parámetros:
+            inplace (bool): Si es False, retorna una nueva imagen sin modificar la actual.
+            out (np.ndarray | None): Arreglo flotante preasignado para el resultado.
+
+        Retorna:
+            Imagen: La instancia actual (para encadenamiento) o una nueva, según `inplace`.
+        """
+        if out is not None:
+            return self._resultado(np.divide(self.datos, 255.0, out=out), inplace, out)
+        datos = _normalizado(self.datos, self._politica())
+        return self._resultado(datos if inplace or datos is not self.datos else datos.copy(), inplace)
+
+    @instrumentado
+    def desnormalizar(self, inplace: bool = True, out: Optional[np.ndarray] = None) -> 'Imagen':
+        """
+        Desnormaliza la imagen para que sus valores estén en el rango [0, 255] en uint8.
+
+        Los valores flotantes se redondean al nivel más cercano y se saturan; una imagen
+        uint8 ya está en ese rango y no cambia.
+
+        Parámetros:
+            inplace (bool): Si es False, retorna una nueva imagen sin modificar la actual.
+            out (np.ndarray | None): Arreglo uint8 preasignado para el resultado.
+
+        Retorna:
+            Imagen: La instancia actual (para encadenamiento) o una nueva, según `inplace`.
+        """
+        datos = _desnormalizado(self.datos)
+        if out is None and not inplace and datos is self.datos:
+            datos = datos.copy()
+        return self._resultado(datos, inplace, out)
+
+    @instrumentado
+    def invertir(self, inplace: bool = True, out: Optional[np.ndarray] = None) -> 'Imagen':
+        """
+        Invierte los colores de la imagen.
+
+        Parámetros:
+            inplace (bool): Si es False, retorna una nueva imagen sin modificar la actual.
+            out (np.ndarray | None): Arreglo preasignado para el resultado (puede ser
+                `self.datos` para invertir sin asignar memoria si no está compartido).
+
+        Retorna:
+            Imagen: La instancia actual (para encadenamiento) o una nueva, según `inplace`.
+        """
+        if out is not None:
+            return self._resultado(np.subtract(1, self.datos, out=out), inplace, out)
+        return self._resultado(_invertido(self.datos, self._politica()), inplace)
+
+    def diferido(self, bloque_bytes: int = 1 << 20) -> 'ImagenDiferida':
+        """
+        Inicia una cadena de operaciones en modo diferido (lazy).
+
+        Las operaciones punto a punto encadenadas sobre el resultado (normalizar, invertir,
+        ajustar y desnormalizar) no se ejecutan inmediatamente: se registran y se fusionan en
+        una sola pasada sobre los píxeles cuando se solicita el resultado.
+
+        Parámetros:
+            bloque_bytes (int): Tamaño aproximado de los bloques procesados en cada paso.
+
+        Retorna:
+            ImagenDiferida: Cadena diferida que parte de los datos actuales.
+        """
+        from .LazyPipeline import ImagenDiferida
+        return ImagenDiferida(self.datos, bloque_bytes=bloque_bytes, precision=self.precision)
+
+    @instrumentado
+    def colorear_pixel(self, row: int, col: int, color: list[int], inplace: bool = True) -> 'Imagen':
+        """
+        Colorea un píxel específico de la imagen.
+
+        Si los datos están compartidos (ver bifurcar) se copian antes de escribir.
+
+        Parámetros:
+            row (int): Índice de la fila.
+            col (int): Índice de la columna.
+            color (list[int]): Valores de color (debe coincidir con el número de canales;
+                un solo valor en imágenes de escala de grises de un canal).
+            inplace (bool): Si es False, pinta sobre una variante y deja la actual intacta.
+
+        Retorna:
+            Imagen: La instancia actual (para encadenamiento) o una nueva, según `inplace`.
+
+        Raises:
+            IndexError: Si los índices están fuera de rango.
+            ValueError: Si la longitud de la lista de color es incorrecta.
+        """
+        if row < 0 or row >= self.datos.shape[0] or col < 0 or col >= self.datos.shape[1]:
+            raise IndexError("El índice de píxel está fuera de rango")
+        canales = self.datos.shape[2] if self.datos.ndim == 3 else 1
+        if len(color) != canales:
+            raise ValueError("La longitud de la lista de color no coincide con el número de canales")
+        imagen = self if inplace else self.bifurcar()
+        imagen._escribible()[row, col, ...] = color if self.datos.ndim == 3 else color[0]
+        return imagen
+
+    def _lienzo(self, inplace: bool) -> tuple['Imagen', np.ndarray]:
+        """
+        Imagen sobre la que se pinta (la actual o una variante, según `inplace`) y sus datos
+        listos para escritura.
+        """
+        imagen = self if inplace else self.bifurcar()
+        return imagen, imagen._escribible()
+
+    @instrumentado
+    def colorear_region(self, filas: Drawing.Indice, columnas: Drawing.Indice, color, alfa: float = 1.0,
+                        inplace: bool = True) -> 'Imagen':
+        """
+        Colorea una región rectangular indicada por filas y columnas en una sola asignación.
+
+        Parámetros:
+            filas (int | slice): Índice o rango de filas.
+            columnas (int | slice): Índice o rango de columnas.
+            color: Valores de color (la longitud debe coincidir con el número de canales), o
+                un arreglo difundible sobre la región (p. ej., un color por columna).
+            alfa (float): Opacidad en [0, 1]; con valores menores que 1 el color se mezcla
+                con el contenido actual.
+            inplace (bool): Si es False, pinta sobre una variante y deja la actual intacta.
+
+        Retorna:
+            Imagen: La instancia actual (para encadenamiento) o una nueva, según `inplace`.
+
+        Raises:
+            IndexError: Si un índice entero está fuera de rango.
+            ValueError: Si el color o alfa no son válidos.
+        """
+        Drawing.validar_alfa(alfa)
+        color = Drawing.preparar_color(color, self.datos)
+        imagen, destino = self._lienzo(inplace)
+        Drawing.pintar(destino, (filas, columnas), color, alfa)
+        return imagen
+
+    @instrumentado
+    def colorear_mascara(self, mascara: np.ndarray, color, alfa: float = 1.0, inplace: bool = True) -> 'Imagen':
+        """
+        Colorea los píxeles seleccionados por una máscara H x W.
+
+        Parámetros:
+            mascara (np.ndarray): Máscara booleana, o flotante en [0, 1] con la cobertura de
+                cada píxel (se multiplica por `alfa`; útil para bordes suavizados).
+            color: Valores de color, o un color por píxel seleccionado (N x C).
+            alfa (float): Opacidad en [0, 1].
+            inplace (bool): Si es False, pinta sobre una variante y deja la actual intacta.
+
+        Retorna:
+            Imagen: La instancia actual (para encadenamiento) o una nueva, según `inplace`.
+
+        Raises:
+            ValueError: Si la forma de la máscara, el color o alfa no son válidos.
+        """
+        mascara = np.asarray(mascara)
+        if mascara.shape != self.datos.shape[:2]:
+            raise ValueError("La máscara debe tener el mismo alto y ancho que la imagen")
+        Drawing.validar_alfa(alfa)
+        color = Drawing.preparar_color(color, self.datos)
+        imagen, destino = self._lienzo(inplace)
+        if mascara.dtype == bool:
+            Drawing.pintar(destino, mascara, color, alfa)
+        else:
+            seleccion = mascara > 0
+            Drawing.pintar(destino, seleccion, color, np.minimum(mascara[seleccion], 1.0) * alfa)
+        return imagen
+
+    @instrumentado
+    def colorear_pixeles(self, filas: np.ndarray, columnas: np.ndarray, color, alfa: float = 1.0,
+                         inplace: bool = True) -> 'Imagen':
+        """
+        Colorea los píxeles de una lista de coordenadas (versión vectorizada de colorear_pixel).
+
+        Los índices se validan una sola vez para todo el arreglo. Si una coordenada se
+        repite, prevalece la última (no se acumula la mezcla).
+
+        Parámetros:
+            filas (np.ndarray): Filas de los píxeles.
+            columnas (np.ndarray): Columnas de los píxeles (misma forma que `filas`).
+            color: Valores de color, o un color por píxel (N x C).
+            alfa (float): Opacidad en [0, 1].
+            inplace (bool): Si es False, pinta sobre una variante y deja la actual intacta.
+
+        Retorna:
+            Imagen: La instancia actual (para encadenamiento) o una nueva, según `inplace`.
+
+        Raises:
+            IndexError: Si algún índice está fuera de rango.
+            ValueError: Si las formas, el color o alfa no son válidos.
+        """
+        filas, columnas = np.asarray(filas), np.asarray(columnas)
+        if filas.shape != columnas.shape:
+            raise ValueError("Las filas y columnas deben tener la misma forma")
+        if filas.size and (filas.min() < 0 or filas.max() >= self.datos.shape[0]
+                           or columnas.min() < 0 or columnas.max() >= self.datos.shape[1]):
+            raise IndexError("El índice de píxel está fuera de rango")
+        Drawing.validar_alfa(alfa)
+        color = Drawing.preparar_color(color, self.datos)
+        imagen, destino = self._lienzo(inplace)
+        Drawing.pintar(destino, (filas, columnas), color, alfa)
+        return imagen
+
+    @instrumentado
+    def dibujar_rectangulo(self, fila: int, columna: int, alto: int, ancho: int, color,
+                           grosor: Optional[int] = None, alfa: float = 1.0, inplace: bool = True) -> 'Imagen':
+        """
+        Dibuja un rectángulo relleno o su contorno; la parte que queda fuera se recorta.
+
+        Parámetros:
+            fila (int), columna (int): Esquina superior izquierda.
+            alto (int), ancho (int): Tamaño del rectángulo.
+            color: Valores de color.
+            grosor (int | None): Grosor del contorno en píxeles; None para rellenarlo.
+            alfa (float): Opacidad en [0, 1].
+            inplace (bool): Si es False, pinta sobre una variante y deja la actual intacta.
+
+        Retorna:
+            Imagen: La instancia actual (para encadenamiento) o una nueva, según `inplace`.
+
+        Raises:
+            ValueError: Si el tamaño, el grosor, el color o alfa no son válidos.
+        """
+        if alto < 1 or ancho < 1:
+            raise ValueError("El tamaño debe ser positivo")
+        if grosor is not None and grosor < 1:
+            raise ValueError("El grosor debe ser positivo")
+        Drawing.validar_alfa(alfa)
+        color = Drawing.preparar_color(color, self.datos)
+        imagen, destino = self._lienzo(inplace)
+        for filas, columnas in Drawing.franjas_rectangulo(fila, columna, alto, ancho, grosor):
+            Drawing.pintar(destino, (filas, columnas), color, alfa)
+        return imagen
+
+    @instrumentado
+    def dibujar_poligono(self, vertices, color, alfa: float = 1.0, inplace: bool = True) -> 'Imagen':
+        """
+        Dibuja un polígono relleno (regla par-impar) a partir de sus vértices.
+
+        Se pintan los píxeles cuyo centro queda dentro del polígono. Los tramos interiores
+        de todas las filas se calculan de forma vectorizada (ver Drawing.tramos_poligono) y
+        cada uno se pinta con una sola asignación contigua.
+
+        Parámetros:
+            vertices: Secuencia de N >= 3 vértices (fila, columna), que pueden ser fraccionarios.
+            color: Valores de color.
+            alfa (float): Opacidad en [0, 1].
+            inplace (bool): Si es False, pinta sobre una variante y deja la actual intacta.
+
+        Retorna:
+            Imagen: La instancia actual (para encadenamiento) o una nueva, según `inplace`.
+
+        Raises:
+            ValueError: Si los vértices, el color o alfa no son válidos.
+        """
+        vertices = np.asarray(vertices, dtype=np.float64)
+        if vertices.ndim != 2 or vertices.shape[1] != 2 or len(vertices) < 3:
+            raise ValueError("El polígono debe tener al menos 3 vértices (fila, columna)")
+        Drawing.validar_alfa(alfa)
+        color = Drawing.preparar_color(color, self.datos)
+        imagen, destino = self._lienzo(inplace)
+        filas, inicios, fines = Drawing.tramos_poligono(vertices, *destino.shape[:2])
+        for fila, inicio, fin in zip(filas.tolist(), inicios.tolist(), fines.tolist()):
+            Drawing.pintar(destino, (fila, slice(inicio, fin)), color, alfa)
+        return imagen
+
+    @instrumentado
+    def extraer_capa_rgb(self, indice: int, inplace: bool = False, out: Optional[np.ndarray] = None) -> 'Imagen':
+        """
+        Extrae una capa de la imagen en formato RGB.
+
+        Parámetros:
+            indice (int): Índice de la capa a extraer (0: R, 1: G, 2: B).
+            inplace (bool): Si es True, reemplaza los datos de la instancia actual.
+            out (np.ndarray | None): Arreglo preasignado para el resultado.
+
+        Retorna:
+            Imagen: Nueva imagen con la capa especificada (o la actual, según `inplace`).
+
+        Raises:
+            ValueError: Si la imagen no tiene 3 canales o el índice es inválido.
+        """
+        return self._resultado(_capa_rgb(self.datos, indice), inplace, out, blanco=None)
+
+    @instrumentado
+    def extraer_capa_cmyk(self, indice: int, inplace: bool = False, out: Optional[np.ndarray] = None) -> 'Imagen':
+        """
+        Extrae una capa de la imagen simulando el formato CMYK.
+
+        Nota:
+            Se asume que la imagen original está en formato RGB.
+
+        Parámetros:
+            indice (int): Índice de la capa a extraer (0: cyan, 1: magenta, 2: yellow, 3: black).
+            inplace (bool): Si es True, reemplaza los datos de la instancia actual.
+            out (np.ndarray | None): Arreglo preasignado para el resultado.
+
+        Retorna:
+            Imagen: Nueva imagen con la capa especificada (o la actual, según `inplace`).
+
+        Raises:
+            ValueError: Si la imagen no tiene 3 canales o el índice es inválido.
+        """
+        return self._resultado(_capa_cmyk(self.datos, indice), inplace, out, blanco=None)
+
+    @instrumentado
+    def separar_rgb(self) -> Separacion:
+        """
+        Separa la imagen en sus planos R, G y B en una sola llamada.
+
+        Los planos son vistas sin copia sobre los datos de la imagen.
+
+        Retorna:
+            Separacion: Planos 'R', 'G' y 'B'.
+
+        Raises:
+            ValueError: Si la imagen no tiene 3 canales.
+        """
+        if self.datos.ndim < 3 or self.datos.shape[-1] != 3:
+            raise ValueError("La imagen debe tener 3 canales")
+        planos = {nombre: self.datos[..., canales[0]] for nombre, canales in _CANALES_RGB.items()}
+        return Separacion(self.datos, planos, _CANALES_RGB)
+
+    @instrumentado
+    def separar_cmyk(self) -> Separacion:
+        """
+        Separa la imagen en sus planos C, M, Y y K en una sola pasada.
+
+        Los planos son vistas sobre un único arreglo H x W x 4 con valores en [0, 1]
+        (ver ColorConverter.rgb_a_cmyk). Las versiones de visualización reproducen la
+        simulación de extraer_capa_cmyk.
+
+        Retorna:
+            Separacion: Planos 'C', 'M', 'Y' y 'K'.
+
+        Raises:
+            ValueError: Si la imagen no tiene 3 canales.
+        """
+        if self.datos.ndim < 3 or self.datos.shape[-1] != 3:
+            raise ValueError("La imagen debe tener 3 canales para RGB")
+        cmyk = ColorConverter.rgb_a_cmyk(self).datos
+        planos = {nombre: cmyk[..., i] for i, nombre in enumerate(_CANALES_CMYK)}
+        return Separacion(self.datos, planos, _CANALES_CMYK)
+
+    @instrumentado
+    def mean_filter(self, kernel_size: Union[int, tuple[int, int]] = 3, inplace: bool = True,
+                    out: Optional[np.ndarray] = None) -> 'Imagen':
+        """
+        Aplica un filtro de promedio a la imagen.
+
+        El cálculo es vectorizado mediante una tabla de áreas sumadas, por lo que su costo
+        no depende del tamaño del kernel. Los bordes se tratan con padding 'reflect'.
+
+        Parámetros:
+            kernel_size (int | tuple[int, int]): Tamaño del kernel (debe ser impar). Puede ser
+                un entero (kernel cuadrado) o una tupla (alto, ancho) para kernels rectangulares.
+            inplace (bool): Si es False, retorna una nueva imagen sin modificar la actual.
+            out (np.ndarray | None): Arreglo preasignado para el resultado.
+
+        Retorna:
+            Imagen: La instancia actual (para encadenamiento) o una nueva, según `inplace`.
+
+        Raises:
+            ValueError: Si alguna dimensión del kernel es par o no positiva.
+        """
+        alto, ancho = _dimensiones_kernel(kernel_size)
+        return self._resultado(_filtro_caja(self.datos, alto, ancho), inplace, out, blanco=None)
 
-    @classmethod
-    def desde_archivo(cls, ruta: str) -> 'Imagen':
+    def _gris(self, plano_gris, canales: int, inplace: bool, out: Optional[np.ndarray]) -> 'Imagen':
         """
-        Crea una instancia de Imagen a partir de un archivo.
+        Calcula un plano de grises (o reutiliza los datos si ya son de un canal) y lo expande.
+        """
+        plano = self.datos if self.datos.ndim == 2 else plano_gris(self.datos)
+        if out is None:
+            # Se convierte el plano antes de expandirlo, para no materializar la vista de difusión.
+            plano = self._almacenar(plano, blanco=None)
+        return self._resultado(_expandir_gris(plano, canales), inplace, out)
+
+    @instrumentado
+    def gris_promedio(self, canales: int = 1, inplace: bool = False, out: Optional[np.ndarray] = None) -> 'Imagen':
+        """
+        Convierte la imagen a escala de grises usando el promedio de los canales.
 
         Parámetros:
-            ruta (str): Ruta al archivo de imagen.
+            canales (int): 1 para un plano H x W; con más canales se retorna una vista de
+                difusión de solo lectura H x W x canales (sin copias del plano).
+            inplace (bool): Si es True, reemplaza los datos de la instancia actual.
+            out (np.ndarray | None): Arreglo preasignado para el resultado.
 
         Retorna:
-            Imagen: Instancia de Imagen.
+            Imagen: Nueva imagen en escala de grises, o la actual según `inplace`.
         """
-        try:
-            img = Image.open(ruta).convert("RGB")
-        except Exception as e:
-            raise ValueError(f"Error al cargar la imagen desde {ruta}: {e}")
-        datos = np.array(img)
-        return cls(datos)
+        return self._gris(_gris_promedio, canales, inplace, out)
 
-    def normalizar(self) -> 'Imagen':
+    @instrumentado
+    def gris_luminosidad(self, canales: int = 1, inplace: bool = False, out: Optional[np.ndarray] = None) -> 'Imagen':
         """
-        Normaliza la imagen para que sus valores estén en el rango [0, 1].
+        Convierte la imagen a escala de grises usando la fórmula de luminosidad.
+
+        Parámetros:
+            canales (int): 1 para un plano H x W; con más canales se retorna una vista de
+                difusión de solo lectura H x W x canales (sin copias del plano).
+            inplace (bool): Si es True, reemplaza los datos de la instancia actual.
+            out (np.ndarray | None): Arreglo preasignado para el resultado.
 
         Retorna:
-            Imagen: La instancia actual (para encadenamiento).
+            Imagen: Nueva imagen en escala de grises, o la actual según `inplace`.
+
+        Raises:
+            ValueError: Si la imagen no tiene al menos 3 canales.
         """
-        self.datos = self.datos / 255.0
-        return self
+        return self._gris(_gris_luminosidad, canales, inplace, out)
 
-    def desnormalizar(self) -> 'Imagen':
+    @instrumentado
+    def gris_tonalidad(self, canales: int = 1, inplace: bool = False, out: Optional[np.ndarray] = None) -> 'Imagen':
         """
-        Desnormaliza la imagen para que sus valores estén en el rango [0, 255].
+        Convierte la imagen a escala de grises usando el método de tonalidad.
+
+        Parámetros:
+            canales (int): 1 para un plano H x W; con más canales se retorna una vista de
+                difusión de solo lectura H x W x canales (sin copias del plano).
+            inplace (bool): Si es True, reemplaza los datos de la instancia actual.
+            out (np.ndarray | None): Arreglo preasignado para el resultado.
 
         Retorna:
-            Imagen: La instancia actual (para encadenamiento).
+            Imagen: Nueva imagen en escala de grises, o la actual según `inplace`.
+
+        Raises:
+            ValueError: Si la imagen no tiene al menos 3 canales.
         """
-        self.datos = (self.datos * 255).astype(np.uint8)
-        return self
+        return self._gris(_gris_tonalidad, canales, inplace, out)
 
-    def invertir(self) -> 'Imagen':
+    @instrumentado
+    def a_rgb(self) -> 'Imagen':
         """
-        Invierte los colores de la imagen.
+        Retorna la imagen con 3 canales.
+
+        Una imagen de un canal (H x W) se expande como vista de difusión de solo lectura,
+        sin copiar los datos; si después se modifica, se copia (ver bifurcar). Las imágenes
+        que ya tienen canales se retornan sin cambios.
 
         Retorna:
-            Imagen: La instancia actual (para encadenamiento).
+            Imagen: Nueva imagen de 3 canales, o la actual si ya tiene canales.
         """
-        self.datos = 1 - self.datos
-        return self
+        if self.datos.ndim != 2:
+            return self
+        return Imagen(_expandir_gris(self.datos, 3), self.precision)
 
-    def colorear_pixel(self, row: int, col: int, color: list[int]) -> 'Imagen':
+    @instrumentado
+    def redimensionar(self, tamano: Optional[tuple[int, int]] = None, escala: Optional[float] = None,
+                      metodo: str = "bilineal", inplace: bool = False, out: Optional[np.ndarray] = None) -> 'Imagen':
         """
-        Colorea un píxel específico de la imagen.
+        Cambia el tamaño de la imagen (ver Resampling.redimensionar).
 
         Parámetros:
-            row (int): Índice de la fila.
-            col (int): Índice de la columna.
-            color (list[int]): Valores de color (debe coincidir con el número de canales).
+            tamano (tuple[int, int] | None): Tamaño exacto (alto, ancho) de salida.
+            escala (float | None): Factor de escala (alternativa a `tamano`).
+            metodo (str): 'vecino', 'bilineal', 'area' o 'lanczos'.
+            inplace (bool): Si es True, reemplaza los datos de la instancia actual.
+            out (np.ndarray | None): Arreglo preasignado para el resultado.
 
         Retorna:
-            Imagen: La instancia actual (para encadenamiento).
+            Imagen: Nueva imagen redimensionada (del mismo tipo), o la actual según `inplace`.
 
         Raises:
-            IndexError: Si los índices están fuera de rango.
-            ValueError: Si la longitud de la lista de color es incorrecta.
+            ValueError: Si los parámetros no son válidos.
         """
-        if row < 0 or row >= self.datos.shape[0] or col < 0 or col >= self.datos.shape[1]:
-            raise IndexError("El índice de píxel está fuera de rango")
-        if len(color) != self.datos.shape[2]:
-            raise ValueError("La longitud de la lista de color no coincide con el número de canales")
-        self.datos[row, col, :] = color
-        return self
+        if (tamano is None) == (escala is None):
+            raise ValueError("Indique solo uno de 'tamano' o 'escala'")
+        if escala is not None:
+            if escala <= 0:
+                raise ValueError("La escala debe ser positiva")
+            alto, ancho = self.datos.shape[:2]
+            tamano = (max(1, round(alto * escala)), max(1, round(ancho * escala)))
+        return self._resultado(Resampling.redimensionar(self.datos, *tamano, metodo), inplace, out, blanco=None)
+
+    def _niveles(self) -> list[np.ndarray]:
+        """
+        Niveles de la pirámide calculados hasta ahora (el nivel 0 son los datos).
+        """
+        niveles = self._cache().setdefault("piramide", [])
+        if not niveles or niveles[0] is not self.datos:
+            niveles[:] = [self.datos]
+        return niveles
 
-    def extraer_capa_rgb(self, indice: int) -> 'Imagen':
+    @instrumentado
+    def nivel_piramide(self, nivel: int) -> 'Imagen':
         """
-        Extrae una capa de la imagen en formato RGB.
+        Retorna un nivel de la pirámide de resolución: el nivel n mide 1 / 2**n del original.
+
+        Cada nivel se obtiene promediando bloques de 2 x 2 del anterior (no del original),
+        de modo que construir todos los niveles cuesta aproximadamente un tercio de un
+        recorrido de la imagen. Los niveles se calculan al pedirlos y se guardan junto a los
+        datos, igual que las estadísticas (los flotantes, en el tipo de caché de la política
+        de precisión: float16 con 'float16'). Los datos retornados son de solo lectura: las
+        operaciones en sitio sobre el nivel trabajan sobre una copia (ver bifurcar).
 
         Parámetros:
-            indice (int): Índice de la capa a extraer (0: R, 1: G, 2: B).
+            nivel (int): Nivel pedido (0 es la imagen original); se detiene en 1 x 1.
 
         Retorna:
-            Imagen: Nueva imagen con la capa especificada.
+            Imagen: Nueva imagen con los datos del nivel.
 
         Raises:
-            ValueError: Si la imagen no tiene 3 canales o el índice es inválido.
+            ValueError: Si el nivel es negativo.
         """
-        if self.datos.shape[2] != 3:
-            raise ValueError("La imagen debe tener 3 canales")
-        if not (0 <= indice <= 2):
-            raise ValueError("El índice debe estar entre 0 y 2")
-        capa = np.zeros_like(self.datos)
-        capa[:, :, indice] = self.datos[:, :, indice]
-        return Imagen(capa)
+        if nivel < 0:
+            raise ValueError("El nivel debe ser mayor o igual a 0")
+        niveles = self._niveles()
+        while len(niveles) <= nivel and max(niveles[-1].shape[:2]) > 1:
+            reducido = self._politica().a_cache(Resampling.reducir_mitad(niveles[-1]))
+            reducido.flags.writeable = False
+            niveles.append(reducido)
+        datos = niveles[min(nivel, len(niveles) - 1)].view()
+        datos.flags.writeable = False
+        return Imagen(datos, self.precision)
+
+    def piramide(self, niveles: Optional[int] = None) -> list['Imagen']:
+        """
+        Retorna los niveles de la pirámide, del original (nivel 0) al más pequeño.
 
-    def extraer_capa_cmyk(self, indice: int) -> 'Imagen':
+        Parámetros:
+            niveles (int | None): Número de niveles; por defecto, hasta llegar a 1 x 1.
+
+        Retorna:
+            list[Imagen]: Niveles de la pirámide (ver nivel_piramide).
         """
-        Extrae una capa de la imagen simulando el formato CMYK.
+        if niveles is None:
+            niveles = max(self.datos.shape[:2]).bit_length()
+        return [self.nivel_piramide(nivel) for nivel in range(niveles)]
 
-        Nota:
-            Se asume que la imagen original está en formato RGB.
+    @instrumentado
+    def vista_previa(self, tamano: tuple[int, int], metodo: str = "area") -> 'Imagen':
+        """
+        Retorna una versión reducida para previsualizar, calculada desde la pirámide.
+
+        Se parte del nivel más pequeño que no sea menor que el tamaño pedido y solo se
+        remuestrea ese nivel, por lo que las previsualizaciones sucesivas (y las operaciones
+        encadenadas después, como mean_filter o gris_*) trabajan sobre pocos datos:
+
+            imagen.vista_previa((256, 256)).mean_filter(3).gris_luminosidad()
 
         Parámetros:
-            indice (int): Índice de la capa a extraer (0: cyan, 1: magenta, 2: yellow, 3: black).
+            tamano (tuple[int, int]): Tamaño máximo (alto, ancho); se conserva la proporción
+                y nunca se amplía la imagen.
+            metodo (str): Método del remuestreo final (ver redimensionar).
 
         Retorna:
-            Imagen: Nueva imagen con la capa especificada.
+            Imagen: Nueva imagen reducida (la original si ya cabe en el tamaño pedido).
 
         Raises:
-            ValueError: Si la imagen no tiene 3 canales o el índice es inválido.
+            ValueError: Si el tamaño no es positivo.
         """
-        if self.datos.shape[2] != 3:
-            raise ValueError("La imagen debe tener 3 canales para RGB")
-        if not (0 <= indice <= 3):
-            raise ValueError("El índice debe estar entre 0 y 3")
-        capa = np.zeros_like(self.datos)
-        if indice == 0:  # cyan: conservar G y B
-            capa[:, :, 1] = self.datos[:, :, 1]
-            capa[:, :, 2] = self.datos[:, :, 2]
-        elif indice == 1:  # magenta: conservar R y B
-            capa[:, :, 0] = self.datos[:, :, 0]
-            capa[:, :, 2] = self.datos[:, :, 2]
-        elif indice == 2:  # yellow: conservar R y G
-            capa[:, :, 0] = self.datos[:, :, 0]
-            capa[:, :, 1] = self.datos[:, :, 1]
-        elif indice == 3:  # black: retorna matriz de ceros
-            pass
-        return Imagen(capa)
-
-    def mean_filter(self, kernel_size: int = 3) -> 'Imagen':
+        if min(tamano) < 1:
+            raise ValueError("El tamaño debe ser positivo")
+        alto, ancho = self.datos.shape[:2]
+        ancho_destino, alto_destino = _tamano_decodificado((ancho, alto), tamano, None)
+        nivel = 0
+        while (alto >> (nivel + 1)) >= alto_destino and (ancho >> (nivel + 1)) >= ancho_destino:
+            nivel += 1
+        previa = self.nivel_piramide(nivel)
+        if previa.datos.shape[:2] == (alto_destino, ancho_destino):
+            return previa
+        return previa.redimensionar((alto_destino, ancho_destino), metodo=metodo, inplace=True)
+
+    @instrumentado
+    def ajustar(self, factor: float, inplace: bool = True, out: Optional[np.ndarray] = None) -> 'Imagen':
         """
-        Aplica un filtro de promedio a la imagen.
+        Ajusta la imagen aplicando un filtro basado en el factor:
+          - factor < 0: Realza el contraste.
+          - factor > 0: Realza la intensidad.
+          - factor == 0: No se aplica transformación.
 
         Parámetros:
-            kernel_size (int): Tamaño del kernel (debe ser impar).
+            factor (float): Valor en el rango [-1, 1].
+            inplace (bool): Si es False, retorna una nueva imagen sin modificar la actual.
+            out (np.ndarray | None): Arreglo preasignado para el resultado.
 
         Retorna:
-            Imagen: La instancia actual (para encadenamiento).
+            Imagen: La imagen ajustada.
+        """
+        filtro = FiltroFactory.obtener_filtro(factor)
+        # Los filtros reemplazan los datos de la imagen recibida sin escribir sobre ellos,
+        # por lo que basta con una envoltura que comparta el arreglo.
+        resultado = filtro.aplicar(self._envoltura())
+        return self._resultado(resultado.datos, inplace, out, blanco=None)
 
-        Raises:
-            ValueError: Si el tamaño del kernel es par.
+    def _envoltura(self) -> 'Imagen':
         """
-        if kernel_size % 2 == 0:
-            raise ValueError("El tamaño del kernel debe ser impar")
-        pad_size = kernel_size // 2
-        datos_padded = np.pad(self.datos, ((pad_size, pad_size), (pad_size, pad_size), (0, 0)), mode="reflect")
-        filtered = np.zeros_like(self.datos)
-        for i in range(self.datos.shape[0]):
-            for j in range(self.datos.shape[1]):
-                for k in range(self.datos.shape[2]):
-                    filtered[i, j, k] = np.mean(datos_padded[i:i + kernel_size, j:j + kernel_size, k])
-        self.datos = filtered
-        return self
+        Nueva instancia que comparte el arreglo y las estadísticas en caché (para operaciones
+        que reemplazan los datos sin escribir sobre ellos).
+        """
+        envoltura = Imagen(self.datos, self.precision)
+        envoltura.__dict__["_estadisticas"] = self._cache()
+        return envoltura
 
-    def gris_promedio(self) -> 'Imagen':
+    def _cache(self) -> dict:
         """
-        Convierte la imagen a escala de grises usando el promedio de los canales.
+        Datos derivados en caché del arreglo actual ('maximo', 'estadisticas', 'histograma'
+        y los niveles de 'piramide').
 
-        Retorna:
-            Imagen: Nueva imagen en escala de grises (3 canales).
+        Se descartan al reemplazar `datos` y al escribir sobre ellos mediante las operaciones
+        de la imagen. Si el arreglo se modifica directamente desde fuera, deben descartarse
+        reasignándolo (p. ej., `imagen.datos = imagen.datos`).
         """
-        gray = np.mean(self.datos, axis=2)
-        gray_3ch = np.stack((gray, gray, gray), axis=-1)
-        return Imagen(gray_3ch)
+        return self.__dict__.setdefault("_estadisticas", {})
 
-    def gris_luminosidad(self) -> 'Imagen':
+    def _maximo(self, calcular: Callable[[np.ndarray], float] = np.max) -> float:
         """
-        Convierte la imagen a escala de grises usando la fórmula de luminosidad.
+        Máximo de los datos para detectar su rango ([0, 1] o [0, 255]).
+
+        Se toma de las estadísticas si ya están calculadas; si no, se calcula una sola vez
+        con `calcular` y se guarda, de modo que las operaciones siguientes no vuelven a
+        recorrer el arreglo.
+        """
+        cache = self._cache()
+        if "estadisticas" in cache:
+            return cache["estadisticas"].maximo_global
+        if "maximo" not in cache:
+            cache["maximo"] = float(calcular(self.datos)) if self.datos.size else 0.0
+        return cache["maximo"]
+
+    def _blanco(self) -> float:
+        """
+        Valor que corresponde al blanco: 255 en uint8 o si el máximo supera 1; 1 en otro caso.
+        """
+        return 255.0 if self.datos.dtype == np.uint8 or self._maximo() > 1 else 1.0
+
+    @instrumentado
+    def estadisticas(self) -> Histogram.Estadisticas:
+        """
+        Retorna el mínimo, el máximo y la media de cada canal (y su histograma en uint8).
+
+        Se calculan en una sola pasada (en uint8, con el histograma por pares de bytes de
+        Histogram.histograma_uint8) y se guardan junto a los datos: las llamadas siguientes,
+        y la detección de rango de las demás operaciones, no vuelven a recorrer el arreglo.
 
         Retorna:
-            Imagen: Nueva imagen en escala de grises (3 canales).
+            Estadisticas: Estadísticas por canal (arreglos de solo lectura).
+        """
+        cache = self._cache()
+        if "estadisticas" not in cache:
+            cache["estadisticas"] = Histogram.calcular_estadisticas(self.datos)
+        return cache["estadisticas"]
 
-        Raises:
-            ValueError: Si la imagen no tiene al menos 3 canales.
+    @instrumentado
+    def histograma(self) -> np.ndarray:
+        """
+        Retorna el histograma de 256 niveles de cada canal (guardado junto a los datos).
+
+        En uint8 es exacto; en los demás tipos los valores se cuantizan a 256 niveles sobre
+        [0, 1] o [0, 255] según el rango de la imagen.
+
+        Retorna:
+            np.ndarray: Histograma int64 de solo lectura de forma (C, 256), con C = 1 para H x W.
+        """
+        if self.datos.dtype == np.uint8:
+            return self.estadisticas().histograma
+        cache = self._cache()
+        if "histograma" not in cache:
+            histograma = Histogram.histograma_cuantizado(self.datos, self._blanco())
+            histograma.flags.writeable = False
+            cache["histograma"] = histograma
+        return cache["histograma"]
+
+    def _aplicar_curvas(self, curvas: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+        """
+        Aplica curvas de 256 niveles por canal: como tablas de consulta en uint8 (escribiendo
+        directamente en `out`) o sobre los datos cuantizados en los demás tipos.
         """
-        if self.datos.shape[2] < 3:
-            raise ValueError("La imagen debe tener al menos 3 canales")
-        R = self.datos[:, :, 0]
-        G = self.datos[:, :, 1]
-        B = self.datos[:, :, 2]
-        gray = 0.299 * R + 0.587 * G + 0.114 * B
-        gray_3ch = np.stack((gray, gray, gray), axis=-1)
-        return Imagen(gray_3ch)
+        if self.datos.dtype == np.uint8:
+            return Histogram.aplicar_tablas(self.datos, Histogram.a_tablas_uint8(curvas), out=out)
+        return Histogram.aplicar_curvas(self.datos, curvas, self._blanco())
 
-    def gris_tonalidad(self) -> 'Imagen':
+    def _por_niveles(self, transformar: Callable[[np.ndarray], np.ndarray], por_canal: bool, inplace: bool,
+                     out: Optional[np.ndarray]) -> 'Imagen':
         """
-        Convierte la imagen a escala de grises usando el método de tonalidad.
+        Aplica una transformación de planos de 256 niveles (uint8 H x W -> float32 en [0, 1])
+        a cada canal o, en imágenes RGB con por_canal=False, solo a la luminancia.
+        """
+        datos, blanco = self.datos, self._blanco()
+        if datos.ndim == 3 and datos.shape[-1] >= 3 and not por_canal:
+            luminancia = _gris_luminosidad(datos)
+            delta = transformar(Histogram.cuantizar(luminancia, blanco))
+            delta -= luminancia / blanco
+            return self._resultado(Histogram.sumar_luminancia(datos, delta, blanco), inplace, out)
+        resultado = np.empty(datos.shape, dtype=np.uint8 if datos.dtype == np.uint8 else np.float32)
+        for canal in range(1 if datos.ndim < 3 else datos.shape[-1]):
+            plano = transformar(Histogram.cuantizar(datos if datos.ndim < 3 else datos[..., canal], blanco))
+            if datos.dtype == np.uint8:
+                np.rint(plano * 255.0, out=plano)
+            (resultado if datos.ndim < 3 else resultado[..., canal])[...] = plano
+        return self._resultado(resultado, inplace, out)
+
+    @instrumentado
+    def autocontraste(self, recorte: float = 0.0, por_canal: bool = False, inplace: bool = True,
+                      out: Optional[np.ndarray] = None) -> 'Imagen':
+        """
+        Estira linealmente los valores para que ocupen todo el rango (auto-niveles).
+
+        Los límites se toman de las estadísticas en caché; en uint8 el estiramiento se
+        aplica como tabla de consulta, con una sola pasada de lectura y una de escritura.
+
+        Parámetros:
+            recorte (float): Fracción de valores en [0, 0.5) que se satura en cada extremo
+                (p. ej., 0.01 ignora el 1 % más oscuro y el 1 % más claro).
+            por_canal (bool): Si es True cada canal se estira por separado (corrige
+                dominantes de color); si no, todos con los mismos límites (conserva el tono).
+            inplace (bool): Si es False, retorna una nueva imagen sin modificar la actual.
+            out (np.ndarray | None): Arreglo preasignado para el resultado.
 
         Retorna:
-            Imagen: Nueva imagen en escala de grises (3 canales).
+            Imagen: Imagen estirada (uint8 si la entrada es uint8; float32 en [0, 1] en otro caso).
 
         Raises:
-            ValueError: Si la imagen no tiene al menos 3 canales.
+            ValueError: Si el recorte está fuera de rango.
+        """
+        if not 0 <= recorte < 0.5:
+            raise ValueError("El recorte debe estar en el rango [0, 0.5)")
+        histograma = self.histograma() if self.datos.dtype == np.uint8 or recorte > 0 else None
+        if histograma is not None:
+            if not por_canal:
+                histograma = histograma.sum(axis=0, keepdims=True)
+            curvas = Histogram.curvas_autocontraste(histograma, recorte)
+            return self._resultado(self._aplicar_curvas(curvas, out), inplace, out)
+        # Flotantes sin recorte: estiramiento exacto entre el mínimo y el máximo.
+        estadisticas = self.estadisticas()
+        bajo, alto = estadisticas.minimo, estadisticas.maximo
+        if not por_canal:
+            bajo, alto = np.full_like(bajo, estadisticas.minimo_global), np.full_like(alto, estadisticas.maximo_global)
+        constante = alto <= bajo
+        bajo = np.where(constante, 0.0, bajo).astype(np.float32)
+        escala = np.where(constante, 1.0 / self._blanco(), 1.0 / np.where(constante, 1.0, alto - bajo))
+        if self.datos.ndim < 3:
+            bajo, escala = bajo[0], escala[0]
+        resultado = np.subtract(self.datos, bajo, dtype=np.float32)
+        resultado *= escala.astype(np.float32)
+        np.clip(resultado, 0.0, 1.0, out=resultado)
+        return self._resultado(resultado, inplace, out)
+
+    @instrumentado
+    def ecualizar(self, por_canal: bool = False, inplace: bool = True, out: Optional[np.ndarray] = None) -> 'Imagen':
         """
-        if self.datos.shape[2] < 3:
-            raise ValueError("La imagen debe tener al menos 3 canales")
-        max_val = np.max(self.datos, axis=2)
-        min_val = np.min(self.datos, axis=2)
-        gray = (max_val + min_val) / 2.0
-        gray_3ch = np.stack((gray, gray, gray), axis=-1)
-        return Imagen(gray_3ch)
+        Ecualiza el histograma para repartir los valores uniformemente en todo el rango.
 
-    def ajustar(self, factor: float) -> 'Imagen':
+        Parámetros:
+            por_canal (bool): Si es True se ecualiza cada canal por separado; si no, en las
+                imágenes RGB solo se ecualiza la luminancia (sin alterar los colores).
+            inplace (bool): Si es False, retorna una nueva imagen sin modificar la actual.
+            out (np.ndarray | None): Arreglo preasignado para el resultado.
+
+        Retorna:
+            Imagen: Imagen ecualizada (uint8 si la entrada es uint8; float32 en [0, 1] en otro caso).
         """
-        Ajusta la imagen aplicando un filtro basado en el factor:
-          - factor < 0: Realza el contraste.
-          - factor > 0: Realza la intensidad.
-          - factor == 0: No se aplica transformación.
+        if self.datos.ndim == 3 and self.datos.shape[-1] >= 3 and not por_canal:
+            def transformar(niveles: np.ndarray) -> np.ndarray:
+                curva = Histogram.curvas_ecualizacion(Histogram.histograma_uint8(niveles))[0]
+                return curva.astype(np.float32)[niveles]
+            return self._por_niveles(transformar, False, inplace, out)
+        curvas = Histogram.curvas_ecualizacion(self.histograma())
+        return self._resultado(self._aplicar_curvas(curvas, out), inplace, out)
+
+    @instrumentado
+    def clahe(self, limite: float = 2.0, teselas: tuple[int, int] = (8, 8), por_canal: bool = False,
+              inplace: bool = True, out: Optional[np.ndarray] = None) -> 'Imagen':
+        """
+        Ecualización adaptativa con contraste limitado (CLAHE): ecualiza por regiones,
+        limitando la amplificación del ruido (ver Histogram.clahe).
 
         Parámetros:
-            factor (float): Valor en el rango [-1, 1].
+            limite (float): Límite de recorte de los histogramas locales, relativo a su altura
+                media (<= 0 desactiva el recorte).
+            teselas (tuple[int, int]): Número de regiones (filas, columnas).
+            por_canal (bool): Si es True se procesa cada canal; si no, en las imágenes RGB
+                solo la luminancia.
+            inplace (bool): Si es False, retorna una nueva imagen sin modificar la actual.
+            out (np.ndarray | None): Arreglo preasignado para el resultado.
 
         Retorna:
-            Imagen: La imagen ajustada.
+            Imagen: Imagen resultante (uint8 si la entrada es uint8; float32 en [0, 1] en otro caso).
         """
-        filtro = FiltroFactory.obtener_filtro(factor)
-        return filtro.aplicar(self)
+        return self._por_niveles(lambda niveles: Histogram.clahe(niveles, limite, teselas), por_canal, inplace, out)
 
     @staticmethod
-    def fusionar(imagenes: list['Imagen']) -> 'Imagen':
+    @instrumentado
+    def fusionar(imagenes: Iterable['Imagen'], dtype: Optional[np.dtype] = None, modo: str = "suma") -> 'Imagen':
         """
         Fusiona varias imágenes sumando sus valores pixel a pixel.
 
+        Las imágenes se consumen una a una (se acepta cualquier iterable, incluidos los
+        generadores) y se suman en un único acumulador de tipo más amplio, por lo que la
+        memoria no depende del número de imágenes y los datos uint8 no se desbordan.
+
         Parámetros:
-            imagenes (list[Imagen]): Lista de imágenes a fusionar.
+            imagenes (Iterable[Imagen]): Imágenes a fusionar.
+            dtype (np.dtype | None): Tipo del acumulador; por defecto int64 para datos enteros
+                y float32 en otro caso.
+            modo (str): 'suma' (retorna el acumulador), 'saturar' (recorta al rango del tipo
+                de entrada) o 'normalizar' (promedia). Con datos enteros el resultado de estos
+                dos modos es del tipo de la primera imagen; con flotantes, el de la política de
+                precisión de la primera imagen.
 
         Retorna:
             Imagen: Imagen resultante de la fusión.
 
         Raises:
-            ValueError: Si las imágenes tienen tamaños diferentes.
+            ValueError: Si las imágenes tienen tamaños diferentes, no hay imágenes o el modo no es válido.
         """
-        if len({img.datos.shape[:2] for img in imagenes}) != 1:
-            raise ValueError("Las imágenes deben tener el mismo tamaño (filas y columnas)")
-        datos_fusion = np.zeros_like(imagenes[0].datos)
-        for img in imagenes:
-            datos_fusion += img.datos
-        return Imagen(datos_fusion)
+        return _fusionar_flujo(((img, 1) for img in imagenes), dtype, modo, ponderado=False)
 
     @staticmethod
-    def fusionar_ecualizado(imagenes: list[tuple['Imagen', int]]) -> 'Imagen':
+    @instrumentado
+    def fusionar_ecualizado(imagenes: Iterable[tuple['Imagen', float]], dtype: Optional[np.dtype] = None,
+                            modo: str = "suma") -> 'Imagen':
         """
         Fusiona imágenes aplicando un factor de ecualización a cada una.
 
+        Igual que fusionar, consume el iterable en una sola pasada con un único acumulador.
+
         Parámetros:
-            imagenes (list[tuple[Imagen, int]]): Lista de tuplas (Imagen, factor).
+            imagenes (Iterable[tuple[Imagen, float]]): Tuplas (Imagen, factor).
+            dtype (np.dtype | None): Tipo del acumulador; por defecto float32.
+            modo (str): 'suma', 'saturar' o 'normalizar' (divide por la suma de los factores).
 
         Retorna:
             Imagen: Imagen resultante de la fusión.
 
         Raises:
-            ValueError: Si las imágenes tienen tamaños diferentes.
+            ValueError: Si las imágenes tienen tamaños diferentes, no hay imágenes o el modo no es válido.
         """
-        if len({img.datos.shape[:2] for img, _ in imagenes}) != 1:
+        return _fusionar_flujo(iter(imagenes), dtype, modo, ponderado=True)
+
+
+def _tipo_acumulador(tipo_entrada: np.dtype, ponderado: bool) -> np.dtype:
+    """
+    Tipo de acumulador por defecto: int64 para sumas enteras; float32 si no.
+    """
+    if np.issubdtype(tipo_entrada, np.integer) and not ponderado:
+        return np.dtype(np.int64)
+    return np.dtype(np.float32)
+
+
+# Modos de salida de una fusión (ver Imagen.fusionar).
+_MODOS_FUSION = ("suma", "saturar", "normalizar")
+
+
+def _finalizar_fusion(acumulado: np.ndarray, tipo_entrada: np.dtype, modo: str, total_pesos: float,
+                      politica: 'Precision.PoliticaPrecision') -> np.ndarray:
+    """
+    Convierte el acumulador de una fusión según el modo de salida.
+
+    Parámetros:
+        acumulado (np.ndarray): Suma (ponderada) de las imágenes.
+        tipo_entrada (np.dtype): Tipo de dato de las imágenes fusionadas.
+        modo (str): 'suma', 'saturar' o 'normalizar'.
+        total_pesos (float): Suma de los pesos (para 'normalizar').
+        politica (PoliticaPrecision): Política con la que se guarda un resultado flotante.
+
+    Retorna:
+        np.ndarray: Resultado de la fusión.
+
+    Raises:
+        ValueError: Si el modo no es válido.
+    """
+    if modo not in _MODOS_FUSION:
+        raise ValueError(f"Modo de fusión no soportado: {modo}")
+    if modo == "suma":
+        return acumulado
+    if modo == "normalizar":
+        if total_pesos == 0:
+            raise ValueError("La suma de los factores debe ser distinta de cero para normalizar")
+        if np.issubdtype(acumulado.dtype, np.integer):
+            acumulado = acumulado.astype(np.float32)
+        acumulado /= total_pesos
+    if np.issubdtype(tipo_entrada, np.integer):
+        info = np.iinfo(tipo_entrada)
+        if not np.issubdtype(acumulado.dtype, np.integer):
+            np.rint(acumulado, out=acumulado)
+        return np.clip(acumulado, info.min, info.max).astype(tipo_entrada)
+    if modo == "saturar":
+        np.clip(acumulado, 0.0, 1.0, out=acumulado)
+    return politica.almacenar(acumulado)
+
+
+def _fusionar_flujo(pares: Iterator[tuple['Imagen', float]], dtype: Optional[np.dtype], modo: str,
+                    ponderado: bool) -> 'Imagen':
+    """
+    Motor de fusión en una sola pasada sobre un iterable de pares (imagen, peso).
+    """
+    if modo not in _MODOS_FUSION:
+        raise ValueError(f"Modo de fusión no soportado: {modo}")
+    acumulado = temporal = tipo_entrada = primera = None
+    total_pesos = 0.0
+    for img, peso in pares:
+        datos = img.datos
+        if acumulado is None:
+            tipo_entrada, primera = datos.dtype, img
+            acumulado = np.zeros(datos.shape, dtype=dtype or _tipo_acumulador(tipo_entrada, ponderado))
+        elif datos.shape[:2] != acumulado.shape[:2]:
             raise ValueError("Las imágenes deben tener el mismo tamaño (filas y columnas)")
-        datos_fusion = np.zeros_like(imagenes[0][0].datos)
-        for img, factor in imagenes:
-            datos_fusion += img.datos * factor
-        return Imagen(datos_fusion)
+        if peso == 1:
+            np.add(acumulado, datos, out=acumulado, casting="unsafe")
+        else:
+            if temporal is None:
+                temporal = np.empty_like(acumulado)
+            np.multiply(datos, peso, out=temporal, casting="unsafe")
+            acumulado += temporal
+        total_pesos += peso
+    if acumulado is None:
+        raise ValueError("Se requiere al menos una imagen para fusionar")
+    resultado = _finalizar_fusion(acumulado, tipo_entrada, modo, total_pesos, primera._politica())
+    return Imagen(resultado, primera.precision)
+
+
+# Conversiones de ColorConverter: nombre -> (canales de entrada, espacio de entrada, núcleo,
+# canales de salida, si la entrada se normaliza a [0, 1] cuando su máximo es mayor que 1).
+_CONVERSIONES = {
+    "rgb_a_cmyk": (3, "RGB", ColorSpaces.rgb_a_cmyk, 4, True),
+    "cmyk_a_rgb": (4, "CMYK", ColorSpaces.cmyk_a_rgb, 3, False),
+    "rgb_a_hsv": (3, "RGB", ColorSpaces.rgb_a_hsv, 3, True),
+    "hsv_a_rgb": (3, "HSV", ColorSpaces.hsv_a_rgb, 3, False),
+    "rgb_a_ycbcr": (3, "RGB", ColorSpaces.rgb_a_ycbcr, 3, True),
+    "ycbcr_a_rgb": (3, "YCbCr", ColorSpaces.ycbcr_a_rgb, 3, False),
+    "rgb_a_lab": (3, "RGB", ColorSpaces.rgb_a_lab, 3, True),
+    "lab_a_rgb": (3, "Lab", ColorSpaces.lab_a_rgb, 3, False),
+}
 
 
 class ColorConverter:
     """
     Clase para conversiones entre espacios de color.
+
+    Todas las conversiones se calculan en float32 por bloques de píxeles (ver
+    ColorSpaces.convertir_por_bloques): los temporales tienen el tamaño de un bloque y el
+    resultado se escribe directamente en el arreglo de salida, que puede preasignarse con
+    el parámetro `out` para reutilizarlo entre llamadas. Las entradas RGB se normalizan a
+    [0, 1] si su máximo es mayor que 1; el resto de espacios se esperan en su rango propio.
+    Sin `out`, el resultado se guarda según la política de precisión de la imagen (salvo
+    Lab, cuyo rango no es [0, 1] y queda en float32).
     """
     @staticmethod
-    def rgb_a_cmyk(imagen: Imagen) -> Imagen:
+    def _convertir(imagen: Imagen, conversion: str, out: Optional[np.ndarray], bloque_bytes: int) -> Imagen:
+        """
+        Valida el número de canales y ejecuta el núcleo de conversión por bloques.
+        """
+        canales, nombre, nucleo, canales_salida, escalar = _CONVERSIONES[conversion]
+        datos = imagen.datos
+        if datos.ndim < 3 or datos.shape[-1] != canales:
+            raise ValueError(f"La imagen debe tener {canales} canales ({nombre})")
+        escala = 1.0 / 255.0 if escalar and imagen._maximo() > 1 else 1.0
+        resultado = ColorSpaces.convertir_por_bloques(datos, nucleo, canales_salida, escala, out, bloque_bytes)
+        # L*a*b* no está en [0, 1]: se conserva en float32 con cualquier política.
+        if out is None and conversion != "rgb_a_lab":
+            resultado = imagen._almacenar(resultado)
+        return Imagen(resultado, imagen.precision)
+
+    @staticmethod
+    @instrumentado
+    def rgb_a_cmyk(imagen: Imagen, out: Optional[np.ndarray] = None,
+                   bloque_bytes: int = ColorSpaces.BLOQUE_BYTES) -> Imagen:
         """
         Convierte una imagen de RGB a CMYK.
 
         Parámetros:
             imagen (Imagen): Imagen en formato RGB.
+            out (np.ndarray | None): Arreglo float32 preasignado para el resultado.
+            bloque_bytes (int): Tamaño aproximado de los bloques de procesamiento.
 
         Retorna:
             Imagen: Imagen en formato CMYK con valores en el rango [0, 1].
@@ -301,27 +1564,19 @@ class ColorConverter:
         Raises:
             ValueError: Si la imagen no tiene 3 canales.
         """
-        datos = imagen.datos
-        if datos.shape[-1] != 3:
-            raise ValueError("La imagen debe tener 3 canales (RGB)")
-        datos_norm = _normalizar_datos(datos)
-        R = datos_norm[..., 0]
-        G = datos_norm[..., 1]
-        B = datos_norm[..., 2]
-        K = 1 - np.max(datos_norm, axis=-1)
-        C = np.where(K == 1, 0, (1 - R - K) / (1 - K))
-        M = np.where(K == 1, 0, (1 - G - K) / (1 - K))
-        Y = np.where(K == 1, 0, (1 - B - K) / (1 - K))
-        cmyk = np.stack((C, M, Y, K), axis=-1)
-        return Imagen(cmyk)
+        return ColorConverter._convertir(imagen, "rgb_a_cmyk", out, bloque_bytes)
 
     @staticmethod
-    def cmyk_a_rgb(imagen: Imagen) -> Imagen:
+    @instrumentado
+    def cmyk_a_rgb(imagen: Imagen, out: Optional[np.ndarray] = None,
+                   bloque_bytes: int = ColorSpaces.BLOQUE_BYTES) -> Imagen:
         """
         Convierte una imagen de CMYK a RGB.
 
         Parámetros:
             imagen (Imagen): Imagen en formato CMYK.
+            out (np.ndarray | None): Arreglo float32 preasignado para el resultado.
+            bloque_bytes (int): Tamaño aproximado de los bloques de procesamiento.
 
         Retorna:
             Imagen: Imagen en formato RGB con valores en el rango [0, 1].
@@ -329,18 +1584,113 @@ class ColorConverter:
         Raises:
             ValueError: Si la imagen no tiene 4 canales.
         """
-        datos = imagen.datos
-        if datos.shape[-1] != 4:
-            raise ValueError("La imagen debe tener 4 canales (CMYK)")
-        C = datos[..., 0]
-        M = datos[..., 1]
-        Y = datos[..., 2]
-        K = datos[..., 3]
-        R = (1 - C) * (1 - K)
-        G = (1 - M) * (1 - K)
-        B = (1 - Y) * (1 - K)
-        rgb = np.stack((R, G, B), axis=-1)
-        return Imagen(rgb)
+        return ColorConverter._convertir(imagen, "cmyk_a_rgb", out, bloque_bytes)
+
+    @staticmethod
+    @instrumentado
+    def rgb_a_hsv(imagen: Imagen, out: Optional[np.ndarray] = None,
+                  bloque_bytes: int = ColorSpaces.BLOQUE_BYTES) -> Imagen:
+        """
+        Convierte una imagen de RGB a HSV.
+
+        Parámetros:
+            imagen (Imagen): Imagen en formato RGB.
+            out (np.ndarray | None): Arreglo float32 preasignado para el resultado.
+            bloque_bytes (int): Tamaño aproximado de los bloques de procesamiento.
+
+        Retorna:
+            Imagen: Imagen HSV con tono, saturación y valor en el rango [0, 1].
+
+        Raises:
+            ValueError: Si la imagen no tiene 3 canales.
+        """
+        return ColorConverter._convertir(imagen, "rgb_a_hsv", out, bloque_bytes)
+
+    @staticmethod
+    @instrumentado
+    def hsv_a_rgb(imagen: Imagen, out: Optional[np.ndarray] = None,
+                  bloque_bytes: int = ColorSpaces.BLOQUE_BYTES) -> Imagen:
+        """
+        Convierte una imagen de HSV (canales en [0, 1]) a RGB.
+
+        Retorna:
+            Imagen: Imagen en formato RGB con valores en el rango [0, 1].
+
+        Raises:
+            ValueError: Si la imagen no tiene 3 canales.
+        """
+        return ColorConverter._convertir(imagen, "hsv_a_rgb", out, bloque_bytes)
+
+    @staticmethod
+    @instrumentado
+    def rgb_a_ycbcr(imagen: Imagen, out: Optional[np.ndarray] = None,
+                    bloque_bytes: int = ColorSpaces.BLOQUE_BYTES) -> Imagen:
+        """
+        Convierte una imagen de RGB a YCbCr (BT.601 de rango completo, como en JPEG).
+
+        Parámetros:
+            imagen (Imagen): Imagen en formato RGB.
+            out (np.ndarray | None): Arreglo float32 preasignado para el resultado.
+            bloque_bytes (int): Tamaño aproximado de los bloques de procesamiento.
+
+        Retorna:
+            Imagen: Imagen YCbCr con valores en el rango [0, 1] (crominancia centrada en 0.5).
+
+        Raises:
+            ValueError: Si la imagen no tiene 3 canales.
+        """
+        return ColorConverter._convertir(imagen, "rgb_a_ycbcr", out, bloque_bytes)
+
+    @staticmethod
+    @instrumentado
+    def ycbcr_a_rgb(imagen: Imagen, out: Optional[np.ndarray] = None,
+                    bloque_bytes: int = ColorSpaces.BLOQUE_BYTES) -> Imagen:
+        """
+        Convierte una imagen de YCbCr (BT.601 de rango completo, en [0, 1]) a RGB.
+
+        Retorna:
+            Imagen: Imagen en formato RGB con valores recortados al rango [0, 1].
+
+        Raises:
+            ValueError: Si la imagen no tiene 3 canales.
+        """
+        return ColorConverter._convertir(imagen, "ycbcr_a_rgb", out, bloque_bytes)
+
+    @staticmethod
+    @instrumentado
+    def rgb_a_lab(imagen: Imagen, out: Optional[np.ndarray] = None,
+                  bloque_bytes: int = ColorSpaces.BLOQUE_BYTES) -> Imagen:
+        """
+        Convierte una imagen sRGB a CIE L*a*b* (iluminante D65).
+
+        Parámetros:
+            imagen (Imagen): Imagen en formato RGB (sRGB).
+            out (np.ndarray | None): Arreglo float32 preasignado para el resultado.
+            bloque_bytes (int): Tamaño aproximado de los bloques de procesamiento.
+
+        Retorna:
+            Imagen: Imagen Lab con L en [0, 100] y a, b aproximadamente en [-128, 127].
+
+        Raises:
+            ValueError: Si la imagen no tiene 3 canales.
+        """
+        return ColorConverter._convertir(imagen, "rgb_a_lab", out, bloque_bytes)
+
+    @staticmethod
+    @instrumentado
+    def lab_a_rgb(imagen: Imagen, out: Optional[np.ndarray] = None,
+                  bloque_bytes: int = ColorSpaces.BLOQUE_BYTES) -> Imagen:
+        """
+        Convierte una imagen CIE L*a*b* (iluminante D65) a sRGB.
+
+        Retorna:
+            Imagen: Imagen en formato RGB con valores recortados al rango [0, 1]
+            (los colores fuera de la gama sRGB se saturan).
+
+        Raises:
+            ValueError: Si la imagen no tiene 3 canales.
+        """
+        return ColorConverter._convertir(imagen, "lab_a_rgb", out, bloque_bytes)
 
 
 class FiltroStrategy(ABC):
@@ -367,12 +1717,75 @@ class FiltroIdentity(FiltroStrategy):
     """
     def aplicar(self, imagen: Imagen) -> Imagen:
         """
-        Retorna una copia de la imagen sin modificaciones.
+        Retorna una copia de la imagen sin modificaciones (en el tipo de su política de precisión).
+        """
+        datos = imagen._almacenar(imagen.datos, blanco=None)
+        return Imagen(datos.copy() if datos is imagen.datos else datos, imagen.precision)
+
+
+class FiltroCurvaTonal(FiltroStrategy):
+    """
+    Clase base para filtros punto a punto definidos por una curva tonal sobre [0, 1].
+
+    Para imágenes uint8 la curva se evalúa una sola vez sobre los 256 valores posibles y se
+    aplica como tabla de consulta (un único indexado que permanece en uint8). Para imágenes
+    flotantes se normalizan los datos, se evalúa la curva directamente en float32 y el
+    resultado se guarda según la política de precisión de la imagen.
+    """
+    @abstractmethod
+    def curva(self, datos_norm: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """
+        Evalúa la curva sobre datos normalizados en [0, 1].
+
+        Parámetros:
+            datos_norm (np.ndarray): Datos normalizados.
+            out (np.ndarray): Arreglo de salida opcional (puede ser el mismo que la entrada).
+
+        Retorna:
+            np.ndarray: Datos transformados.
+        """
+        pass
+
+    @cached_property
+    def tabla_uint8(self) -> np.ndarray:
+        """
+        Tabla de consulta de 256 entradas (uint8) de la curva, calculada una sola vez.
+        """
+        valores = self.curva(np.arange(256, dtype=np.float64) / 255.0)
+        return np.clip(np.rint(valores * 255.0), 0, 255).astype(np.uint8)
+
+    def aplicar(self, imagen: Imagen) -> Imagen:
+        """
+        Aplica la curva tonal a la imagen.
+
+        Retorna:
+            Imagen: Imagen transformada (uint8 si la entrada es uint8; en otro caso, float32
+            o el tipo de la política de precisión).
+        """
+        if imagen.datos.dtype == np.uint8:
+            imagen.datos = Histogram.aplicar_tablas(imagen.datos, self.tabla_uint8)
+            return imagen
+        imagen.datos = imagen._almacenar(self._aplicar_flotante(imagen.datos, imagen._maximo() > 1))
+        return imagen
+
+    def _aplicar_flotante(self, datos: np.ndarray, escalar: bool) -> np.ndarray:
+        """
+        Evalúa la curva sobre datos no uint8 con una decisión de escala ya tomada.
+
+        Parámetros:
+            datos (np.ndarray): Datos de la imagen (o de una parte de ella).
+            escalar (bool): Si es True se dividen por 255 (máximo de la imagen completa > 1).
+
+        Retorna:
+            np.ndarray: Resultado float32.
         """
-        return Imagen(imagen.datos.copy())
+        datos_norm = datos.astype(np.float32)
+        if escalar:
+            datos_norm /= 255.0
+        return self.curva(datos_norm, out=datos_norm)
 
 
-class FiltroContraste(FiltroStrategy):
+class FiltroContraste(FiltroCurvaTonal):
     """
     Filtro para realzar el contraste utilizando transformación logarítmica.
 
@@ -383,22 +1796,14 @@ class FiltroContraste(FiltroStrategy):
             raise ValueError("El factor de contraste debe ser negativo")
         self.factor = abs(factor)
 
-    def aplicar(self, imagen: Imagen) -> Imagen:
+    def curva(self, datos_norm: np.ndarray, out: np.ndarray = None) -> np.ndarray:
         """
-        Aplica la transformación de contraste a la imagen.
-
-        Retorna:
-            Imagen: Imagen con contraste ajustado.
+        Aplica la transformación de contraste logarítmica.
         """
-        datos_norm = _normalizar_datos(imagen.datos)
-        c = 1.0 / np.log10(2.0)
-        log_img = c * np.log10(1.0 + datos_norm)
-        resultado = (1 - self.factor) * datos_norm + self.factor * log_img
-        imagen.datos = resultado
-        return imagen
+        return _curva_contraste(datos_norm, self.factor, out=out)
 
 
-class FiltroIntensidad(FiltroStrategy):
+class FiltroIntensidad(FiltroCurvaTonal):
     """
     Filtro para realzar la intensidad utilizando transformación exponencial.
 
@@ -409,18 +1814,29 @@ class FiltroIntensidad(FiltroStrategy):
             raise ValueError("El factor de intensidad debe ser positivo")
         self.factor = factor
 
-    def aplicar(self, imagen: Imagen) -> Imagen:
+    def curva(self, datos_norm: np.ndarray, out: np.ndarray = None) -> np.ndarray:
         """
-        Aplica la transformación de intensidad a la imagen.
+        Aplica la transformación de intensidad exponencial.
+        """
+        return _curva_intensidad(datos_norm, self.factor, out=out)
 
-        Retorna:
-            Imagen: Imagen con intensidad ajustada.
+
+class FiltroGamma(FiltroCurvaTonal):
+    """
+    Filtro de corrección gamma: x ** gamma sobre datos normalizados.
+
+    Valores de gamma menores que 1 aclaran la imagen y mayores que 1 la oscurecen.
+    """
+    def __init__(self, gamma: float) -> None:
+        if gamma <= 0:
+            raise ValueError("El valor de gamma debe ser positivo")
+        self.gamma = gamma
+
+    def curva(self, datos_norm: np.ndarray, out: np.ndarray = None) -> np.ndarray:
         """
-        datos_norm = _normalizar_datos(imagen.datos)
-        exp_img = (np.exp(datos_norm) - 1.0) / (np.e - 1.0)
-        resultado = (1 - self.factor) * datos_norm + self.factor * exp_img
-        imagen.datos = resultado
-        return imagen
+        Aplica la corrección gamma.
+        """
+        return np.power(datos_norm, self.gamma, out=out)
 
 
 class FiltroFactory:
@@ -430,10 +1846,14 @@ class FiltroFactory:
     Permite seleccionar la estrategia adecuada (contraste, intensidad o identidad).
     """
     @staticmethod
+    @lru_cache(maxsize=256)
     def obtener_filtro(factor: float) -> FiltroStrategy:
         """
         Retorna la estrategia de filtrado adecuada basada en el factor.
 
+        Las estrategias se guardan en caché por factor, de modo que las tablas de consulta
+        de las curvas tonales se calculan una sola vez por factor.
+
         Parámetros:
             factor (float): Factor de ajuste en el rango [-1, 1].
 
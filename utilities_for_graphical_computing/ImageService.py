@@ -0,0 +1,483 @@
+import asyncio
+import hashlib
+import io
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Optional, Sequence, Union
+import numpy as np
+
+from . import Precision
+from .ImageProcessor import Imagen, _datos_uint8
+
+# Operaciones cuyo resultado en ImagenBatch es idéntico al de aplicarlas imagen por imagen
+# (las conversiones de color deciden la escala de cada imagen por separado). Las demás
+# (p. ej., ajustar, que detecta el rango sobre todo el lote) se agrupan igualmente en una
+# sola tarea, pero se aplican a cada imagen por separado.
+_OPERACIONES_LOTE = frozenset({
+    "normalizar", "invertir", "mean_filter", "gris_promedio", "gris_luminosidad",
+    "gris_tonalidad", "extraer_capa_rgb", "extraer_capa_cmyk", "rgb_a_cmyk", "cmyk_a_rgb",
+    "rgb_a_hsv", "hsv_a_rgb", "rgb_a_ycbcr", "ycbcr_a_rgb", "rgb_a_lab", "lab_a_rgb",
+})
+
+# Operaciones que acepta el servicio: solo transformaciones puras de la imagen. Las demás
+# operaciones de aplicar_operaciones (guardar, desde_npy, ...) acceden al sistema de archivos
+# y no deben quedar al alcance de los clientes.
+_OPERACIONES_PERMITIDAS = _OPERACIONES_LOTE | frozenset({
+    "desnormalizar", "ajustar", "redimensionar", "nivel_piramide", "vista_previa", "a_rgb",
+    "autocontraste", "ecualizar", "clahe", "colorear_pixel", "colorear_region", "colorear_mascara",
+    "colorear_pixeles", "dibujar_rectangulo", "dibujar_poligono",
+})
+
+# Ventana de latencias recientes usada para los percentiles.
+_VENTANA_LATENCIAS = 1024
+
+
+def _clave_argumento(valor: object) -> object:
+    """
+    Representación hashable y exacta de un argumento de operación, para agrupar solicitudes:
+    las listas y tuplas se convierten en tuplas y los arreglos se identifican por su forma,
+    tipo y el hash de sus bytes.
+
+    Raises:
+        ValueError: Si el argumento no puede usarse como clave.
+    """
+    if isinstance(valor, np.ndarray):
+        resumen = hashlib.sha256(np.ascontiguousarray(valor).data).hexdigest()
+        return "ndarray", valor.shape, valor.dtype.str, resumen
+    if isinstance(valor, (list, tuple)):
+        return type(valor).__name__, tuple(_clave_argumento(elemento) for elemento in valor)
+    try:
+        hash(valor)
+    except TypeError:
+        raise ValueError(f"Argumento de operación no admitido: {type(valor).__name__}")
+    # El tipo distingue valores iguales de tipos distintos (p. ej., 1, 1.0 y True).
+    return type(valor).__name__, valor
+
+
+def _decodificar(datos: bytes, modo: str) -> Imagen:
+    return Imagen.desde_archivo(io.BytesIO(datos), modo=modo)
+
+
+def _codificar(imagen: Imagen, formato: str) -> bytes:
+    from PIL import Image
+    salida = io.BytesIO()
+    Image.fromarray(_datos_uint8(imagen.datos)).save(salida, format=formato)
+    return salida.getvalue()
+
+
+def _procesar_grupo(fuentes: list[bytes], operaciones: tuple, modo: str, formato: str,
+                    precision: str) -> list[tuple[bool, Union[bytes, str]]]:
+    """
+    Decodifica, procesa y codifica un grupo de imágenes del mismo tamaño con la misma cadena
+    de operaciones y política de precisión (se ejecuta en un trabajador).
+
+    Retorna:
+        list[tuple[bool, bytes | str]]: Por imagen, (True, resultado codificado) o
+        (False, mensaje de error); el fallo de una imagen no afecta a las demás.
+    """
+    with Precision.usar_precision(precision):
+        return _procesar_fuentes(fuentes, operaciones, modo, formato)
+
+
+def _procesar_fuentes(fuentes: list[bytes], operaciones: tuple, modo: str,
+                      formato: str) -> list[tuple[bool, Union[bytes, str]]]:
+    """
+    Cuerpo de _procesar_grupo (con la política de precisión ya establecida).
+    """
+    from .ImageBatch import ImagenBatch
+    if len(fuentes) > 1 and all(operacion[0] in _OPERACIONES_LOTE for operacion in operaciones):
+        try:
+            lote = ImagenBatch.desde_imagenes(_decodificar(fuente, modo) for fuente in fuentes)
+            for nombre, *argumentos in operaciones:
+                lote = getattr(lote, nombre)(*argumentos)
+            return [(True, _codificar(imagen, formato)) for imagen in lote.a_imagenes()]
+        except Exception:
+            # Se repite imagen por imagen para asignar cada error a su solicitud.
+            pass
+    resultados = []
+    for fuente in fuentes:
+        try:
+            imagen = _decodificar(fuente, modo).aplicar_operaciones(operaciones)
+            resultados.append((True, _codificar(imagen, formato)))
+        except Exception as e:
+            resultados.append((False, f"{type(e).__name__}: {e}"))
+    return resultados
+
+
+@dataclass
+class EstadisticasServicio:
+    """
+    Contadores de un ServicioImagenes.
+
+    Atributos:
+        recibidos (int): Solicitudes admitidas en la cola.
+        completados (int): Solicitudes terminadas con éxito.
+        fallidos (int): Solicitudes terminadas con error.
+        rechazados (int): Solicitudes no admitidas por estar la cola llena durante todo el plazo.
+        expirados (int): Solicitudes admitidas cuyo plazo venció antes de obtener el resultado.
+        lotes (int): Tareas enviadas a los trabajadores.
+        imagenes_por_lote (float): Tamaño medio de los lotes.
+        en_cola (int): Solicitudes esperando a formar un lote.
+        en_vuelo (int): Lotes en ejecución.
+        latencia_media (float): Latencia media (s) desde la admisión hasta el resultado.
+        latencia_p50 (float), latencia_p95 (float), latencia_max (float): Percentiles y máximo
+            de las latencias recientes (s).
+        rendimiento (float): Solicitudes completadas por segundo desde el inicio.
+    """
+    recibidos: int
+    completados: int
+    fallidos: int
+    rechazados: int
+    expirados: int
+    lotes: int
+    imagenes_por_lote: float
+    en_cola: int
+    en_vuelo: int
+    latencia_media: float
+    latencia_p50: float
+    latencia_p95: float
+    latencia_max: float
+    rendimiento: float
+
+    def a_dict(self) -> dict:
+        """Representación serializable (p. ej., para JSON o un endpoint de métricas)."""
+        return asdict(self)
+
+
+@dataclass
+class _Solicitud:
+    datos: bytes
+    operaciones: tuple
+    clave: tuple
+    futuro: asyncio.Future
+    admitida: float
+
+
+_FIN = object()
+
+
+class ServicioImagenes:
+    """
+    Servicio asyncio que procesa imágenes en un grupo de trabajadores sin bloquear el bucle
+    de eventos.
+
+    Cada solicitud (bytes de la imagen y cadena de operaciones, ver Imagen.aplicar_operaciones)
+    entra en una cola acotada. Un despachador agrupa las solicitudes compatibles (mismo
+    tamaño, modo, operaciones y formato de salida) en lotes de hasta `max_lote` imágenes,
+    esperando como mucho `espera_lote` segundos a que se completen, y envía cada lote como
+    una sola tarea a los trabajadores; las cadenas compatibles con ImagenBatch se ejecutan
+    como una sola operación de NumPy sobre el lote. Como máximo hay un lote en ejecución por
+    trabajador: si los trabajadores no dan abasto, la cola se llena y las nuevas solicitudes
+    esperan a que haya sitio (contrapresión), hasta agotar su plazo.
+
+    Uso:
+        async with ServicioImagenes(trabajadores=4) as servicio:
+            png = await servicio.procesar(datos_jpeg, [("ajustar", -0.8)])
+    """
+
+    def __init__(self, trabajadores: Optional[int] = None, max_lote: int = 8, espera_lote: float = 0.005,
+                 max_cola: int = 64, tiempo_espera: Optional[float] = 30.0, formato: str = "png",
+                 ejecutor: Optional[Executor] = None) -> None:
+        """
+        Parámetros:
+            trabajadores (int | None): Número de procesos (por defecto, uno por núcleo).
+            max_lote (int): Máximo de imágenes por lote.
+            espera_lote (float): Tiempo máximo (s) que una solicitud espera a otras compatibles.
+            max_cola (int): Máximo de solicitudes admitidas y aún no enviadas a un trabajador.
+            tiempo_espera (float | None): Plazo por defecto de cada solicitud (s); None sin plazo.
+            formato (str): Formato de salida por defecto (nombre de Pillow, p. ej. 'png', 'jpeg').
+            ejecutor (Executor | None): Ejecutor propio (p. ej., un ThreadPoolExecutor para
+                pruebas en el mismo proceso); por defecto, un ProcessPoolExecutor.
+
+        Raises:
+            ValueError: Si los parámetros no son válidos.
+        """
+        if max_lote < 1 or max_cola < 1:
+            raise ValueError("max_lote y max_cola deben ser positivos")
+        self.trabajadores = trabajadores or os.cpu_count() or 1
+        self.max_lote = max_lote
+        self.espera_lote = espera_lote
+        self.max_cola = max_cola
+        self.tiempo_espera = tiempo_espera
+        self.formato = formato
+        self._ejecutor = ejecutor
+        self._ejecutor_propio = ejecutor is None
+        self._cola: Optional[asyncio.Queue] = None
+        self._despachador: Optional[asyncio.Task] = None
+        self._lotes_en_vuelo: set[asyncio.Task] = set()
+        self._cupos: Optional[asyncio.Semaphore] = None
+        self._contadores = dict.fromkeys(("recibidos", "completados", "fallidos", "rechazados",
+                                          "expirados", "lotes", "imagenes_en_lotes"), 0)
+        self._latencias: deque[float] = deque(maxlen=_VENTANA_LATENCIAS)
+        self._suma_latencias = 0.0
+        self._inicio = time.perf_counter()
+
+    async def __aenter__(self) -> 'ServicioImagenes':
+        await self.iniciar()
+        return self
+
+    async def __aexit__(self, *excepcion) -> None:
+        await self.detener()
+
+    async def iniciar(self) -> None:
+        """
+        Crea la cola, el grupo de trabajadores y el despachador (en el bucle de eventos actual).
+        """
+        if self._despachador is not None:
+            return
+        if self._ejecutor is None:
+            self._ejecutor = ProcessPoolExecutor(max_workers=self.trabajadores)
+        self._cola = asyncio.Queue(maxsize=self.max_cola)
+        self._cupos = asyncio.Semaphore(self.trabajadores)
+        self._inicio = time.perf_counter()
+        self._despachador = asyncio.create_task(self._despachar())
+
+    async def detener(self) -> None:
+        """
+        Deja de admitir solicitudes, termina las pendientes y libera los trabajadores.
+        """
+        if self._despachador is None:
+            return
+        await self._cola.put(_FIN)
+        await self._despachador
+        if self._lotes_en_vuelo:
+            await asyncio.gather(*self._lotes_en_vuelo)
+        self._despachador = None
+        if self._ejecutor_propio:
+            self._ejecutor.shutdown()
+            self._ejecutor = None
+
+    def _clave(self, datos: bytes, operaciones: tuple, modo: str, formato: str) -> tuple:
+        """
+        Clave de compatibilidad de una solicitud. Solo se lee la cabecera de la imagen
+        (Pillow no decodifica los píxeles al abrirla), por lo que es barata en el bucle de eventos.
+        Incluye la política de precisión del contexto de quien llama, que se aplica en el trabajador.
+
+        Raises:
+            ValueError: Si los datos no son una imagen o algún argumento no puede usarse como clave.
+        """
+        from PIL import Image
+        try:
+            with Image.open(io.BytesIO(datos)) as imagen:
+                tamano = imagen.size
+        except Exception as e:
+            raise ValueError(f"Los datos no son una imagen válida: {e}")
+        operaciones = tuple((operacion[0],) + tuple(_clave_argumento(arg) for arg in operacion[1:])
+                            for operacion in operaciones)
+        return tamano, modo, operaciones, formato, Precision.obtener_precision().nombre
+
+    async def procesar(self, datos: bytes, operaciones: Sequence[Sequence] = (), formato: Optional[str] = None,
+                       modo: str = "RGB", tiempo_espera: Optional[float] = None) -> bytes:
+        """
+        Procesa una imagen y retorna el resultado codificado.
+
+        Parámetros:
+            datos (bytes): Imagen codificada (JPEG, PNG, ...).
+            operaciones (Sequence[Sequence]): Cadena de operaciones, p. ej. [('ajustar', -0.8)].
+            formato (str | None): Formato de salida (por defecto, el del servicio).
+            modo (str): 'RGB' o 'L' (modo en que se decodifica la imagen).
+            tiempo_espera (float | None): Plazo (s) para la admisión y el procesamiento; por
+                defecto, el del servicio.
+
+        Retorna:
+            bytes: Imagen resultante codificada.
+
+        Raises:
+            ValueError: Si los datos o alguna operación no son válidos (las operaciones no
+                permitidas se rechazan antes de entrar en la cola).
+            TimeoutError: Si la cola sigue llena o el resultado no llega dentro del plazo.
+            RuntimeError: Si el servicio no está iniciado.
+        """
+        if self._despachador is None:
+            raise RuntimeError("El servicio no está iniciado")
+        operaciones = tuple(tuple(operacion) for operacion in operaciones)
+        for operacion in operaciones:
+            if not operacion or operacion[0] not in _OPERACIONES_PERMITIDAS:
+                nombre = operacion[0] if operacion else None
+                raise ValueError(f"Operación no permitida: {nombre!r}")
+        clave = self._clave(datos, operaciones, modo, formato or self.formato)
+        plazo = self.tiempo_espera if tiempo_espera is None else tiempo_espera
+        limite = None if plazo is None else time.perf_counter() + plazo
+        solicitud = _Solicitud(datos, operaciones, clave, asyncio.get_running_loop().create_future(), 0.0)
+        try:
+            await asyncio.wait_for(self._cola.put(solicitud), plazo)
+        except asyncio.TimeoutError:
+            self._contadores["rechazados"] += 1
+            raise TimeoutError(f"Cola llena: la solicitud no fue admitida en {plazo} s")
+        solicitud.admitida = time.perf_counter()
+        self._contadores["recibidos"] += 1
+        restante = None if limite is None else max(0.0, limite - time.perf_counter())
+        try:
+            return await asyncio.wait_for(asyncio.shield(solicitud.futuro), restante)
+        except asyncio.TimeoutError:
+            # Si aún no se envió a un trabajador, el despachador la descarta.
+            solicitud.futuro.cancel()
+            self._contadores["expirados"] += 1
+            raise TimeoutError(f"La solicitud no terminó en {plazo} s")
+
+    async def _despachar(self) -> None:
+        """
+        Agrupa las solicitudes de la cola por clave y envía cada grupo cuando se llena o
+        cuando su solicitud más antigua lleva `espera_lote` segundos esperando.
+        """
+        grupos: dict[tuple, list[_Solicitud]] = {}
+        terminar = False
+        while not terminar or grupos:
+            if not terminar:
+                espera = None
+                if grupos:
+                    antigua = min(grupo[0].admitida for grupo in grupos.values())
+                    espera = max(0.0, antigua + self.espera_lote - time.perf_counter())
+                try:
+                    solicitud = await asyncio.wait_for(self._cola.get(), espera)
+                except asyncio.TimeoutError:
+                    solicitud = None
+                # Se toman sin esperar las demás solicitudes ya encoladas.
+                while solicitud is not None:
+                    if solicitud is _FIN:
+                        terminar = True
+                        break
+                    try:
+                        grupos.setdefault(solicitud.clave, []).append(solicitud)
+                    except Exception as e:
+                        # Una solicitud defectuosa falla sola; el despachador sigue atendiendo.
+                        self._fallar([solicitud], e)
+                    solicitud = None if self._cola.empty() else self._cola.get_nowait()
+            ahora = time.perf_counter()
+            for clave in list(grupos):
+                grupo = grupos[clave]
+                if terminar or len(grupo) >= self.max_lote or grupo[0].admitida + self.espera_lote <= ahora:
+                    lote, resto = grupo[:self.max_lote], grupo[self.max_lote:]
+                    if resto:
+                        grupos[clave] = resto
+                    else:
+                        del grupos[clave]
+                    # Un lote en ejecución por trabajador: mientras no haya cupo no se vacía la
+                    # cola, y la contrapresión llega a quienes envían solicitudes.
+                    await self._cupos.acquire()
+                    try:
+                        tarea = asyncio.create_task(self._ejecutar(lote))
+                    except Exception as e:
+                        self._cupos.release()
+                        self._fallar(lote, e)
+                        continue
+                    self._lotes_en_vuelo.add(tarea)
+                    tarea.add_done_callback(self._lotes_en_vuelo.discard)
+
+    def _fallar(self, solicitudes: list[_Solicitud], error: Exception) -> None:
+        """
+        Termina con error las solicitudes indicadas que aún esperan su resultado.
+        """
+        for solicitud in solicitudes:
+            if not solicitud.futuro.done():
+                self._contadores["fallidos"] += 1
+                solicitud.futuro.set_exception(RuntimeError(f"Error del despachador: {type(error).__name__}: {error}"))
+
+    async def _ejecutar(self, lote: list[_Solicitud]) -> None:
+        """
+        Ejecuta un lote en los trabajadores y entrega cada resultado a su solicitud.
+        """
+        try:
+            lote = [solicitud for solicitud in lote if not solicitud.futuro.done()]
+            if not lote:
+                return
+            self._contadores["lotes"] += 1
+            self._contadores["imagenes_en_lotes"] += len(lote)
+            (_, modo, _, formato, precision) = lote[0].clave
+            operaciones = lote[0].operaciones
+            loop = asyncio.get_running_loop()
+            try:
+                resultados = await loop.run_in_executor(self._ejecutor, _procesar_grupo,
+                                                        [solicitud.datos for solicitud in lote],
+                                                        operaciones, modo, formato, precision)
+            except Exception as e:
+                resultados = [(False, f"{type(e).__name__}: {e}")] * len(lote)
+            ahora = time.perf_counter()
+            for solicitud, (exito, valor) in zip(lote, resultados):
+                if solicitud.futuro.done():
+                    continue
+                if exito:
+                    solicitud.futuro.set_result(valor)
+                    self._contadores["completados"] += 1
+                    latencia = ahora - solicitud.admitida
+                    self._latencias.append(latencia)
+                    self._suma_latencias += latencia
+                else:
+                    solicitud.futuro.set_exception(ValueError(valor))
+                    self._contadores["fallidos"] += 1
+        finally:
+            self._cupos.release()
+
+    def estadisticas(self) -> EstadisticasServicio:
+        """
+        Retorna una instantánea de los contadores de latencia y rendimiento.
+        """
+        contadores = self._contadores
+        latencias = np.array(self._latencias) if self._latencias else np.zeros(1)
+        transcurrido = max(time.perf_counter() - self._inicio, 1e-9)
+        return EstadisticasServicio(
+            recibidos=contadores["recibidos"],
+            completados=contadores["completados"],
+            fallidos=contadores["fallidos"],
+            rechazados=contadores["rechazados"],
+            expirados=contadores["expirados"],
+            lotes=contadores["lotes"],
+            imagenes_por_lote=contadores["imagenes_en_lotes"] / max(contadores["lotes"], 1),
+            en_cola=0 if self._cola is None else self._cola.qsize(),
+            en_vuelo=len(self._lotes_en_vuelo),
+            latencia_media=self._suma_latencias / max(contadores["completados"], 1),
+            latencia_p50=float(np.percentile(latencias, 50)),
+            latencia_p95=float(np.percentile(latencias, 95)),
+            latencia_max=float(latencias.max()),
+            rendimiento=contadores["completados"] / transcurrido,
+        )
+
+
+class ClienteLocal:
+    """
+    Cliente en el mismo proceso de un ServicioImagenes, para pruebas y para usar el servicio
+    sin una capa de red: acepta y retorna instancias de Imagen.
+
+        async with ServicioImagenes(ejecutor=ThreadPoolExecutor(2)) as servicio:
+            cliente = ClienteLocal(servicio)
+            resultados = await cliente.procesar_varias(imagenes, [("gris_luminosidad",)])
+    """
+
+    def __init__(self, servicio: ServicioImagenes) -> None:
+        self.servicio = servicio
+
+    async def procesar(self, imagen: Union[Imagen, bytes], operaciones: Sequence[Sequence] = (),
+                       tiempo_espera: Optional[float] = None) -> Imagen:
+        """
+        Envía una imagen (se codifica en PNG, sin pérdida) y retorna el resultado decodificado.
+
+        Parámetros:
+            imagen (Imagen | bytes): Imagen a procesar, o imagen ya codificada.
+            operaciones (Sequence[Sequence]): Cadena de operaciones.
+            tiempo_espera (float | None): Plazo de la solicitud (s).
+
+        Retorna:
+            Imagen: Resultado (uint8, como lo entrega el formato PNG).
+        """
+        datos = imagen if isinstance(imagen, bytes) else _codificar(imagen, "png")
+        modo = "L" if isinstance(imagen, Imagen) and imagen.datos.ndim == 2 else "RGB"
+        resultado = await self.servicio.procesar(datos, operaciones, formato="png", modo=modo,
+                                                 tiempo_espera=tiempo_espera)
+        return Imagen.desde_archivo(io.BytesIO(resultado), modo="L" if _es_gris(resultado) else "RGB")
+
+    async def procesar_varias(self, imagenes: Sequence[Union[Imagen, bytes]], operaciones: Sequence[Sequence] = (),
+                              tiempo_espera: Optional[float] = None) -> list[Imagen]:
+        """
+        Envía varias imágenes a la vez (el servicio puede agruparlas en lotes) y retorna los
+        resultados en el mismo orden.
+        """
+        return list(await asyncio.gather(*(self.procesar(imagen, operaciones, tiempo_espera) for imagen in imagenes)))
+
+
+def _es_gris(datos: bytes) -> bool:
+    from PIL import Image
+    with Image.open(io.BytesIO(datos)) as imagen:
+        return imagen.mode in ("L", "I;16", "I", "F", "1")
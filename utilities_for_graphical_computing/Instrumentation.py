@@ -0,0 +1,267 @@
+import functools
+import logging
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, asdict
+from typing import Callable, Iterator, Optional
+import numpy as np
+
+# Bandera global consultada por cada operación instrumentada. Mientras sea False, el único
+# costo de la instrumentación es esa consulta.
+_ACTIVO = False
+
+_bloqueo = threading.Lock()
+_activas = 0
+_callbacks: list[Callable[['RegistroOperacion'], None]] = []
+_memoria = 0
+_tracemalloc_propio = False
+_local = threading.local()
+_registro = logging.getLogger(__name__)
+
+# Sesiones de perfilado del contexto actual: (informe, callback, memoria). Cada hilo y cada
+# tarea de asyncio tiene su propio contexto, por lo que una sesión solo recibe las
+# operaciones de la cadena que la abrió.
+_sesiones: ContextVar[tuple] = ContextVar("sesiones_perfilado", default=())
+
+
+@dataclass
+class RegistroOperacion:
+    """
+    Medición de una llamada a una operación instrumentada.
+
+    Atributos:
+        nombre (str): Nombre calificado de la operación (p. ej., 'Imagen.mean_filter').
+        duracion (float): Tiempo de reloj en segundos.
+        forma_entrada (tuple | None): Forma de los datos de entrada (None si no aplica).
+        tipo_entrada (str | None): Tipo de dato de entrada.
+        forma_salida (tuple | None): Forma de los datos de salida.
+        tipo_salida (str | None): Tipo de dato de salida.
+        bytes_salida (int): Bytes del arreglo de salida si es nuevo (0 si comparte memoria con la entrada).
+        memoria_pico (int | None): Memoria pico asignada durante la operación (solo con memoria=True).
+        profundidad (int): Nivel de anidamiento (0 para las operaciones llamadas directamente).
+    """
+    nombre: str
+    duracion: float
+    forma_entrada: Optional[tuple]
+    tipo_entrada: Optional[str]
+    forma_salida: Optional[tuple]
+    tipo_salida: Optional[str]
+    bytes_salida: int
+    memoria_pico: Optional[int]
+    profundidad: int
+
+
+@dataclass
+class Informe:
+    """
+    Registros de las operaciones ejecutadas durante una sesión de perfilado.
+    """
+    registros: list[RegistroOperacion] = field(default_factory=list)
+
+    @property
+    def tiempo_total(self) -> float:
+        """Tiempo total de las operaciones de primer nivel (sin contar las anidadas dos veces)."""
+        return sum(r.duracion for r in self.registros if r.profundidad == 0)
+
+    def resumen(self) -> dict[str, dict]:
+        """
+        Agrega los registros por operación.
+
+        Retorna:
+            dict[str, dict]: Por nombre: llamadas, tiempo_total, tiempo_medio, bytes_salida y
+            memoria_pico (máxima, o None si no se midió).
+        """
+        resumen: dict[str, dict] = {}
+        for registro in self.registros:
+            entrada = resumen.setdefault(registro.nombre, {
+                "llamadas": 0, "tiempo_total": 0.0, "bytes_salida": 0, "memoria_pico": None,
+            })
+            entrada["llamadas"] += 1
+            entrada["tiempo_total"] += registro.duracion
+            entrada["bytes_salida"] += registro.bytes_salida
+            if registro.memoria_pico is not None:
+                entrada["memoria_pico"] = max(entrada["memoria_pico"] or 0, registro.memoria_pico)
+        for entrada in resumen.values():
+            entrada["tiempo_medio"] = entrada["tiempo_total"] / entrada["llamadas"]
+        return resumen
+
+    def a_dict(self) -> dict:
+        """Representación serializable (p. ej., para JSON) del informe."""
+        return {"tiempo_total": self.tiempo_total, "resumen": self.resumen(),
+                "registros": [asdict(r) for r in self.registros]}
+
+    def __str__(self) -> str:
+        lineas = [f"{'operación':<34}{'llamadas':>9}{'total (ms)':>12}{'medio (ms)':>12}{'salida (MiB)':>14}"]
+        orden = sorted(self.resumen().items(), key=lambda par: -par[1]["tiempo_total"])
+        for nombre, entrada in orden:
+            lineas.append(f"{nombre:<34}{entrada['llamadas']:>9}{entrada['tiempo_total'] * 1e3:>12.2f}"
+                          f"{entrada['tiempo_medio'] * 1e3:>12.3f}{entrada['bytes_salida'] / 2**20:>14.2f}")
+        lineas.append(f"Tiempo total: {self.tiempo_total * 1e3:.2f} ms")
+        return "\n".join(lineas)
+
+
+def _actualizar_estado() -> None:
+    """
+    Recalcula la bandera global (requiere el bloqueo).
+    """
+    global _ACTIVO
+    _ACTIVO = bool(_activas or _callbacks)
+
+
+def agregar_callback(callback: Callable[[RegistroOperacion], None]) -> None:
+    """
+    Registra una función que recibe cada RegistroOperacion (p. ej., para exportar métricas).
+
+    A diferencia de las sesiones de perfilar, los callbacks globales reciben las operaciones
+    de todos los hilos y tareas. Mientras haya alguno registrado la instrumentación
+    permanece activa. Las excepciones que lancen se registran con logging y no afectan a la
+    operación medida.
+    """
+    with _bloqueo:
+        _callbacks.append(callback)
+        _actualizar_estado()
+
+
+def eliminar_callback(callback: Callable[[RegistroOperacion], None]) -> None:
+    """
+    Elimina un callback registrado con agregar_callback.
+    """
+    with _bloqueo:
+        _callbacks.remove(callback)
+        _actualizar_estado()
+
+
+@contextmanager
+def perfilar(callback: Optional[Callable[[RegistroOperacion], None]] = None,
+             memoria: bool = False) -> Iterator[Informe]:
+    """
+    Activa la instrumentación dentro de un bloque `with` y retorna el informe de la sesión.
+
+    La sesión solo registra las operaciones de su propio contexto (el hilo o la tarea de
+    asyncio que la abrió, ver contextvars): las cadenas que se ejecutan a la vez en otros
+    hilos o tareas no se mezclan en el informe, y tampoco las que se delegan a otros hilos
+    (p. ej., las bandas de EjecutorParalelo). Las sesiones pueden anidarse; cada una recibe
+    los registros producidos mientras está activa.
+
+    Parámetros:
+        callback (Callable | None): Función adicional llamada con cada registro de la sesión
+            (sus excepciones se registran con logging y no afectan a la operación).
+        memoria (bool): Si es True, mide la memoria pico de cada operación con tracemalloc
+            (tiene un costo apreciable; por defecto solo se registran los bytes de salida).
+
+    Ejemplo:
+        with perfilar() as informe:
+            Imagen.desde_archivo("paris.jpg").normalizar().mean_filter(5).ajustar(-0.8)
+        print(informe)
+    """
+    global _activas, _memoria, _tracemalloc_propio
+    informe = Informe()
+    ficha = _sesiones.set(_sesiones.get() + ((informe, callback, memoria),))
+    with _bloqueo:
+        _activas += 1
+        if memoria:
+            _memoria += 1
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _tracemalloc_propio = True
+        _actualizar_estado()
+    try:
+        yield informe
+    finally:
+        _sesiones.reset(ficha)
+        with _bloqueo:
+            _activas -= 1
+            if memoria:
+                _memoria -= 1
+                if _memoria == 0 and _tracemalloc_propio:
+                    tracemalloc.stop()
+                    _tracemalloc_propio = False
+            _actualizar_estado()
+
+
+def _arreglo(objeto: object) -> Optional[np.ndarray]:
+    """
+    Retorna el arreglo de datos de una Imagen (o similar), o None.
+    """
+    datos = getattr(objeto, "datos", None) if not isinstance(objeto, np.ndarray) else objeto
+    return datos if isinstance(datos, np.ndarray) else None
+
+
+def _medir(nombre: str, funcion: Callable, args: tuple, kwargs: dict):
+    """
+    Ejecuta una operación midiéndola y entrega el registro a las sesiones y callbacks activos.
+    """
+    sesiones = _sesiones.get()
+    with _bloqueo:
+        callbacks = list(_callbacks)
+    if not sesiones and not callbacks:
+        # Solo hay sesiones en otros contextos.
+        return funcion(*args, **kwargs)
+    entrada = _arreglo(args[0]) if args else None
+    profundidad = getattr(_local, "profundidad", 0)
+    medir_memoria = _memoria > 0 and (any(memoria for _, _, memoria in sesiones) or bool(callbacks))
+    if medir_memoria:
+        # Cada operación reinicia el pico de tracemalloc; el pico alcanzado hasta ese momento
+        # se conserva en la pila para que la operación que la contiene no lo pierda.
+        picos = _local.__dict__.setdefault("picos", [])
+        actual, pico_previo = tracemalloc.get_traced_memory()
+        if picos:
+            picos[-1] = max(picos[-1], pico_previo)
+        picos.append(0)
+        tracemalloc.reset_peak()
+    _local.profundidad = profundidad + 1
+    inicio = time.perf_counter()
+    try:
+        resultado = funcion(*args, **kwargs)
+    finally:
+        duracion = time.perf_counter() - inicio
+        _local.profundidad = profundidad
+        if medir_memoria:
+            absoluto = max(tracemalloc.get_traced_memory()[1], picos.pop())
+            if picos:
+                picos[-1] = max(picos[-1], absoluto)
+    pico = max(0, absoluto - actual) if medir_memoria else None
+    salida = _arreglo(resultado)
+    nueva = salida is not None and (entrada is None or not np.may_share_memory(salida, entrada))
+    registro = RegistroOperacion(
+        nombre=nombre,
+        duracion=duracion,
+        forma_entrada=None if entrada is None else entrada.shape,
+        tipo_entrada=None if entrada is None else str(entrada.dtype),
+        forma_salida=None if salida is None else salida.shape,
+        tipo_salida=None if salida is None else str(salida.dtype),
+        bytes_salida=salida.nbytes if nueva else 0,
+        memoria_pico=pico,
+        profundidad=profundidad,
+    )
+    for informe, callback, _ in sesiones:
+        informe.registros.append(registro)
+        if callback is not None:
+            callbacks.append(callback)
+    for callback in callbacks:
+        try:
+            callback(registro)
+        except Exception:
+            # Un callback defectuoso no debe hacer fallar la operación ni perder su resultado.
+            _registro.exception("Error en el callback de instrumentación %r", callback)
+    return resultado
+
+
+def instrumentado(funcion: Callable) -> Callable:
+    """
+    Decorador que registra las llamadas a una operación cuando la instrumentación está activa.
+
+    El primer argumento posicional (la Imagen en los métodos y en las conversiones de
+    ColorConverter) se usa como entrada, y el valor retornado como salida.
+    """
+    nombre = funcion.__qualname__
+
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        if not _ACTIVO:
+            return funcion(*args, **kwargs)
+        return _medir(nombre, funcion, args, kwargs)
+    return envoltura
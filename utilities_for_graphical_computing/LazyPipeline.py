@@ -0,0 +1,268 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+import numpy as np
+
+from . import Precision
+from .ImageProcessor import Imagen, _curva_contraste, _curva_intensidad
+
+# Un paso resuelto: función que transforma en sitio un bloque float32.
+PasoResuelto = Callable[[np.ndarray], None]
+
+_UINT8 = np.dtype(np.uint8)
+_FLOAT32 = np.dtype(np.float32)
+
+
+class _Paso(ABC):
+    """
+    Operación punto a punto registrada en una cadena diferida.
+
+    Cada paso se "resuelve" antes de evaluar la cadena: recibe los valores extremos
+    (mínimo y máximo) y el tipo de dato que tendrían los datos al llegar a él en modo
+    inmediato, junto con la política de precisión, y retorna la función que se aplicará
+    a cada bloque junto con el tipo de dato resultante. Todas las operaciones son
+    monótonas, por lo que los extremos pueden propagarse aplicando el mismo paso a un
+    arreglo de dos elementos.
+    """
+    requiere_extremos = False
+
+    @abstractmethod
+    def resolver(self, extremos: Optional[np.ndarray], tipo: np.dtype,
+                 politica: Precision.PoliticaPrecision) -> tuple[PasoResuelto, np.dtype]:
+        """
+        Resuelve el paso para los extremos y el tipo de dato de entrada.
+
+        Retorna:
+            tuple[PasoResuelto, np.dtype]: Función que transforma cada bloque en sitio y
+            tipo de dato del resultado.
+        """
+        pass
+
+
+def _sin_cambios(bloque: np.ndarray) -> None:
+    pass
+
+
+def _a_niveles(bloque: np.ndarray, blanco: float = 1.0) -> None:
+    """
+    Lleva un bloque a niveles uint8 (redondeados y saturados) en sitio; `blanco` es el valor
+    que corresponde a 255 (1 para datos en [0, 1], 255 para datos en [0, 255]).
+    """
+    np.multiply(bloque, 255.0 / blanco, out=bloque)
+    np.rint(bloque, out=bloque)
+    np.clip(bloque, 0, 255, out=bloque)
+
+
+class _Normalizar(_Paso):
+    def resolver(self, extremos: Optional[np.ndarray], tipo: np.dtype,
+                 politica: Precision.PoliticaPrecision) -> tuple[PasoResuelto, np.dtype]:
+        # En la ruta uint8 los niveles ya representan [0, 1] (ver Imagen.normalizar).
+        if politica.tipo == _UINT8 and tipo == _UINT8:
+            return _sin_cambios, _UINT8
+        factor = np.float32(1.0 / 255.0)
+        return (lambda bloque: np.multiply(bloque, factor, out=bloque)), _FLOAT32
+
+
+class _Invertir(_Paso):
+    def resolver(self, extremos: Optional[np.ndarray], tipo: np.dtype,
+                 politica: Precision.PoliticaPrecision) -> tuple[PasoResuelto, np.dtype]:
+        if tipo != _UINT8:
+            return (lambda bloque: np.subtract(1, bloque, out=bloque)), tipo
+        if politica.tipo == _UINT8:
+            return (lambda bloque: np.subtract(255, bloque, out=bloque)), tipo
+
+        def paso(bloque: np.ndarray) -> None:
+            # Igual que Imagen.invertir sobre uint8 fuera de la ruta entera: 1 - valor módulo 256.
+            np.subtract(1, bloque, out=bloque)
+            np.mod(bloque, 256, out=bloque)
+        return paso, tipo
+
+
+class _Desnormalizar(_Paso):
+    def resolver(self, extremos: Optional[np.ndarray], tipo: np.dtype,
+                 politica: Precision.PoliticaPrecision) -> tuple[PasoResuelto, np.dtype]:
+        # Igual que Imagen.desnormalizar: los uint8 no cambian y los flotantes se redondean.
+        return (_sin_cambios if tipo == _UINT8 else _a_niveles), _UINT8
+
+
+class _Identidad(_Paso):
+    """
+    Ajuste con factor 0 (ver FiltroIdentity): no transforma los valores, pero con la política
+    'uint8' guarda los datos flotantes como niveles, conservando su escala (ver
+    Imagen._almacenar).
+    """
+    def resolver(self, extremos: Optional[np.ndarray], tipo: np.dtype,
+                 politica: Precision.PoliticaPrecision) -> tuple[PasoResuelto, np.dtype]:
+        if politica.tipo != _UINT8 or tipo == _UINT8:
+            return _sin_cambios, tipo
+        blanco = 255.0 if extremos[1] > 1 else 1.0
+        return (lambda bloque: _a_niveles(bloque, blanco)), _UINT8
+
+
+class _Curva(_Paso):
+    """
+    Ajuste de contraste o intensidad (ver FiltroContraste y FiltroIntensidad).
+
+    Igual que en el modo inmediato, los datos uint8 se transforman y permanecen en
+    [0, 255] (tabla de consulta redondeada); los flotantes se dividen por 255 solo si su
+    máximo es mayor que 1, obtenido de los extremos propagados sin recorrer la imagen.
+    """
+    requiere_extremos = True
+
+    def __init__(self, curva: Callable, factor: float) -> None:
+        self.curva = curva
+        self.factor = factor
+
+    def resolver(self, extremos: Optional[np.ndarray], tipo: np.dtype,
+                 politica: Precision.PoliticaPrecision) -> tuple[PasoResuelto, np.dtype]:
+        entero = tipo == _UINT8
+        escalar = entero or extremos[1] > 1
+        curva, factor = self.curva, self.factor
+
+        def paso(bloque: np.ndarray) -> None:
+            if escalar:
+                np.divide(bloque, 255.0, out=bloque)
+            curva(bloque, factor, out=bloque)
+            if entero:
+                np.multiply(bloque, 255.0, out=bloque)
+                np.rint(bloque, out=bloque)
+                np.clip(bloque, 0, 255, out=bloque)
+        return paso, (_UINT8 if entero else _FLOAT32)
+
+
+class ImagenDiferida:
+    """
+    Cadena diferida de operaciones punto a punto sobre una imagen.
+
+    Los métodos encadenables (normalizar, invertir, ajustar, desnormalizar) solo registran
+    la operación. Al solicitar el resultado (evaluar() o el atributo 'datos'), la cadena se
+    fusiona y se ejecuta en una única pasada:
+
+      - Si la fuente es uint8, la cadena completa se evalúa sobre los 256 valores posibles
+        y se aplica como tabla de consulta (un solo indexado).
+      - En otro caso, la imagen se recorre por bloques de filas de tamaño acotado y cada
+        bloque atraviesa todas las operaciones en un búfer float32 reutilizado.
+
+    El cálculo se realiza en float32; el tipo del resultado sigue las mismas reglas que
+    el modo inmediato (uint8 tras desnormalizar, o tras ajustar una imagen uint8, y
+    float32 tras normalizar o ajustar datos flotantes), incluida la política de precisión:
+    con la política 'uint8', cada resultado flotante se redondea a niveles uint8 tras su
+    operación, igual que en el modo inmediato. Cualquier otro método de Imagen materializa
+    la cadena y se delega a la Imagen resultante.
+    """
+
+    def __init__(self, fuente: np.ndarray, bloque_bytes: int = 1 << 20, precision: Optional[str] = None) -> None:
+        self._fuente = fuente
+        self._pasos: list[_Paso] = []
+        self.bloque_bytes = bloque_bytes
+        self.precision = precision
+
+    def normalizar(self) -> 'ImagenDiferida':
+        """Registra la normalización al rango [0, 1] (división por 255)."""
+        self._pasos.append(_Normalizar())
+        return self
+
+    def desnormalizar(self) -> 'ImagenDiferida':
+        """Registra la desnormalización al rango [0, 255] en uint8 (con redondeo)."""
+        self._pasos.append(_Desnormalizar())
+        return self
+
+    def invertir(self) -> 'ImagenDiferida':
+        """Registra la inversión de colores (1 - valor)."""
+        self._pasos.append(_Invertir())
+        return self
+
+    def ajustar(self, factor: float) -> 'ImagenDiferida':
+        """
+        Registra un ajuste de contraste (factor < 0) o de intensidad (factor > 0).
+
+        Un factor igual a 0 no transforma los valores (solo aplica la política de precisión).
+
+        Raises:
+            ValueError: Si no se reconoce una estrategia para el factor (p. ej., NaN), igual
+                que en Imagen.ajustar (ver FiltroFactory).
+        """
+        if factor == 0:
+            self._pasos.append(_Identidad())
+        elif factor < 0:
+            self._pasos.append(_Curva(_curva_contraste, abs(factor)))
+        elif factor > 0:
+            self._pasos.append(_Curva(_curva_intensidad, factor))
+        else:
+            raise ValueError("Factor no reconocido para el filtrado")
+        return self
+
+    def _resolver(self) -> tuple[list[PasoResuelto], np.dtype]:
+        """
+        Resuelve los pasos propagando el tipo de dato y, cuando algún paso los requiere,
+        los extremos de la fuente.
+
+        Retorna:
+            tuple[list[PasoResuelto], np.dtype]: Plan de ejecución y tipo del resultado.
+        """
+        politica = Precision.obtener_precision(self.precision)
+        tipo = self._fuente.dtype
+        entero = politica.tipo == _UINT8
+        extremos = None
+        if any(paso.requiere_extremos for paso in self._pasos) or (entero and tipo != _UINT8):
+            extremos = np.array([self._fuente.min(), self._fuente.max()] if self._fuente.size else [0, 0],
+                                dtype=np.float32)
+        plan = []
+        for paso in self._pasos:
+            funcion, tipo = paso.resolver(extremos, tipo, politica)
+            pasos = [funcion]
+            if entero and tipo != _UINT8:
+                # Igual que el modo inmediato: cada resultado flotante se guarda como niveles.
+                pasos.append(_a_niveles)
+                tipo = _UINT8
+            for funcion in pasos:
+                if extremos is not None:
+                    funcion(extremos)
+                    extremos.sort()
+                plan.append(funcion)
+        if tipo != _UINT8:
+            # Cadena sin pasos sobre datos flotantes: el resultado se guarda como el de
+            # FiltroIdentity (float32, o niveles en la escala de la fuente con 'uint8').
+            funcion, tipo = _Identidad().resolver(extremos, _FLOAT32, politica)
+            plan.append(funcion)
+        return plan, tipo
+
+    def evaluar(self) -> Imagen:
+        """
+        Ejecuta la cadena fusionada y retorna una nueva Imagen con el resultado.
+
+        Retorna:
+            Imagen: Imagen resultante de aplicar todas las operaciones registradas.
+        """
+        plan, tipo = self._resolver()
+        fuente = self._fuente
+
+        if fuente.dtype == np.uint8:
+            tabla = np.arange(256, dtype=np.float32)
+            for funcion in plan:
+                funcion(tabla)
+            return Imagen(tabla.astype(tipo)[fuente], self.precision)
+
+        salida = np.empty(fuente.shape, dtype=tipo)
+        if fuente.ndim == 0 or fuente.size == 0:
+            return Imagen(salida, self.precision)
+        bytes_fila = max(1, fuente[0].size * 4)
+        filas = max(1, self.bloque_bytes // bytes_fila)
+        bufer = np.empty((min(filas, fuente.shape[0]),) + fuente.shape[1:], dtype=np.float32)
+        for inicio in range(0, fuente.shape[0], filas):
+            bloque = bufer[:min(filas, fuente.shape[0] - inicio)]
+            np.copyto(bloque, fuente[inicio:inicio + len(bloque)], casting="unsafe")
+            for funcion in plan:
+                funcion(bloque)
+            np.copyto(salida[inicio:inicio + len(bloque)], bloque, casting="unsafe")
+        return Imagen(salida, self.precision)
+
+    @property
+    def datos(self) -> np.ndarray:
+        """Arreglo resultante de evaluar la cadena."""
+        return self.evaluar().datos
+
+    def __getattr__(self, nombre: str):
+        # Cualquier operación no fusionable materializa la cadena y continúa en modo inmediato.
+        if nombre.startswith("_"):
+            raise AttributeError(nombre)
+        return getattr(self.evaluar(), nombre)
@@ -0,0 +1,288 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Sequence, Union
+import numpy as np
+
+from . import ColorSpaces
+from .ImageProcessor import (
+    Imagen,
+    FiltroStrategy,
+    FiltroFactory,
+    FiltroCurvaTonal,
+    FiltroIdentity,
+    _CONVERSIONES,
+    _filtro_caja,
+    _dimensiones_kernel,
+)
+from .Convolution import FiltroConvolucion, FiltroBordes, factorizar_kernel, elegir_metodo
+from .TiledExecutor import _bordes_locales, _halo_operacion
+from .Histogram import aplicar_tablas
+
+
+def _usa_fft(filtro: FiltroStrategy) -> bool:
+    """
+    Indica si algún kernel del filtro se convolucionaría por FFT (resultado dependiente del tamaño).
+    """
+    if isinstance(filtro, FiltroConvolucion):
+        kernels, metodo = [filtro.kernel], filtro.metodo
+    else:
+        kernels, metodo = [filtro.kernel_x, filtro.kernel_y], "auto"
+    if metodo != "auto":
+        return metodo == "fft"
+    return any(elegir_metodo(k, factorizar_kernel(k) is not None) == "fft" for k in kernels)
+
+
+class EjecutorParalelo:
+    """
+    Ejecutor que reparte las operaciones de una imagen entre varios núcleos.
+
+    La imagen se divide en bandas de filas que se procesan en un grupo de hilos (las
+    operaciones de NumPy liberan el GIL) y cada banda escribe directamente en su región de
+    un arreglo de salida preasignado. El resultado es idéntico bit a bit al de la operación
+    secuencial equivalente:
+
+      - mean_filter reparte cada etapa de la tabla de áreas sumadas por líneas independientes.
+      - Las convoluciones directas y separables se calculan por bandas con un halo igual al
+        radio del kernel; las que usan FFT dependen del tamaño de la transformada, por lo que
+        se reparten por canales. Las de modo de borde no local ('wrap', 'mean', 'median',
+        ...) leen el eje completo y se aplican de forma secuencial.
+      - Las curvas tonales (ajustar, FiltroGamma) y las conversiones de color son punto a
+        punto; la decisión de escala que depende del máximo de la imagen se toma una sola
+        vez sobre la imagen completa.
+
+    Las estrategias de filtro no reconocidas se aplican de forma secuencial.
+    """
+
+    def __init__(self, trabajadores: Optional[int] = None, filas_minimas: int = 64) -> None:
+        """
+        Parámetros:
+            trabajadores (int | None): Número de hilos (por defecto, uno por núcleo).
+            filas_minimas (int): Alto mínimo de cada banda, para que el costo de repartir
+                no supere al del cálculo en imágenes pequeñas.
+        """
+        self.trabajadores = trabajadores or os.cpu_count() or 1
+        self.filas_minimas = max(1, filas_minimas)
+        self._pool = ThreadPoolExecutor(max_workers=self.trabajadores)
+
+    def cerrar(self) -> None:
+        """Libera los hilos del ejecutor."""
+        self._pool.shutdown()
+
+    def __enter__(self) -> 'EjecutorParalelo':
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+    def bandas(self, n: int) -> list[slice]:
+        """
+        Divide el rango [0, n) en bandas contiguas (hasta dos por trabajador para equilibrar la carga).
+        """
+        cantidad = max(1, min(2 * self.trabajadores, n // self.filas_minimas))
+        limites = np.linspace(0, n, cantidad + 1).round().astype(int)
+        return [slice(a, b) for a, b in zip(limites[:-1], limites[1:]) if b > a]
+
+    def repartir(self, funcion: Callable[[slice], object], n: int) -> list:
+        """
+        Ejecuta funcion(banda) para cada banda de [0, n) en el grupo de hilos y espera a todas.
+
+        Retorna:
+            list: Resultados de cada banda, en orden.
+
+        Raises:
+            Exception: La primera excepción producida por alguna banda.
+        """
+        bandas = self.bandas(n)
+        if len(bandas) == 1:
+            return [funcion(bandas[0])]
+        return list(self._pool.map(funcion, bandas))
+
+    @staticmethod
+    def _salida(out: Optional[np.ndarray], forma: tuple, dtype: np.dtype) -> np.ndarray:
+        """
+        Crea o valida el arreglo de salida.
+        """
+        if out is None:
+            return np.empty(forma, dtype=dtype)
+        if out.shape != forma or out.dtype != dtype:
+            raise ValueError(f"La salida debe tener forma {forma} y tipo {np.dtype(dtype)}")
+        return out
+
+    def _maximo(self, datos: np.ndarray) -> float:
+        """
+        Máximo de la imagen calculado por bandas (exacto, igual al secuencial).
+        """
+        return max(self.repartir(lambda filas: datos[filas].max(), datos.shape[0]))
+
+    def _por_bandas(self, datos: np.ndarray, funcion: Callable[[np.ndarray], np.ndarray], halo: int,
+                    salida: np.ndarray) -> None:
+        """
+        Aplica `funcion` a cada banda de filas extendida con `halo` filas vecinas y escribe
+        la región interior en la salida.
+        """
+        alto = datos.shape[0]
+
+        def procesar(filas: slice) -> None:
+            y0, y1 = max(filas.start - halo, 0), min(filas.stop + halo, alto)
+            resultado = funcion(datos[y0:y1])
+            salida[filas] = resultado[filas.start - y0:filas.stop - y0]
+        self.repartir(procesar, alto)
+
+    def mean_filter(self, imagen: Imagen, kernel_size: Union[int, tuple[int, int]] = 3,
+                    out: Optional[np.ndarray] = None) -> Imagen:
+        """
+        Filtro de promedio en paralelo (idéntico a Imagen.mean_filter).
+
+        Parámetros:
+            imagen (Imagen): Imagen de entrada (no se modifica).
+            kernel_size (int | tuple[int, int]): Tamaño impar del kernel.
+            out (np.ndarray | None): Arreglo preasignado para el resultado.
+
+        Retorna:
+            Imagen: Nueva imagen filtrada.
+        """
+        alto, ancho = _dimensiones_kernel(kernel_size)
+        salida = self._salida(out, imagen.datos.shape, imagen.datos.dtype)
+        resultado = _filtro_caja(imagen.datos, alto, ancho, repartir=self.repartir, out=salida)
+        return self._politica(imagen, resultado, out, blanco=None)
+
+    def convertir(self, imagen: Imagen, conversion: str, out: Optional[np.ndarray] = None,
+                  bloque_bytes: int = ColorSpaces.BLOQUE_BYTES) -> Imagen:
+        """
+        Conversión de color en paralelo (idéntica a la de ColorConverter).
+
+        Parámetros:
+            imagen (Imagen): Imagen de entrada.
+            conversion (str): Nombre del método de ColorConverter, p. ej. 'rgb_a_cmyk'.
+            out (np.ndarray | None): Arreglo float32 C-contiguo preasignado para el resultado.
+            bloque_bytes (int): Tamaño de los bloques de cada banda.
+
+        Retorna:
+            Imagen: Imagen convertida (float32).
+
+        Raises:
+            ValueError: Si la conversión no existe o la imagen no tiene los canales esperados.
+        """
+        if conversion not in _CONVERSIONES:
+            raise ValueError(f"Conversión no reconocida: {conversion}")
+        canales, nombre, nucleo, canales_salida, escalar = _CONVERSIONES[conversion]
+        datos = imagen.datos
+        if datos.ndim < 3 or datos.shape[-1] != canales:
+            raise ValueError(f"La imagen debe tener {canales} canales ({nombre})")
+        escala = 1.0 / 255.0 if escalar and imagen._maximo(self._maximo) > 1 else 1.0
+        salida = self._salida(out, datos.shape[:-1] + (canales_salida,), np.dtype(np.float32))
+        if not salida.flags.c_contiguous:
+            raise ValueError("La salida debe ser C-contigua")
+
+        def procesar(filas: slice) -> None:
+            ColorSpaces.convertir_por_bloques(datos[filas], nucleo, canales_salida, escala, salida[filas], bloque_bytes)
+        self.repartir(procesar, datos.shape[0])
+        if conversion == "rgb_a_lab":
+            return Imagen(salida, imagen.precision)
+        return self._politica(imagen, salida, out)
+
+    def aplicar(self, imagen: Imagen, filtro: FiltroStrategy, out: Optional[np.ndarray] = None) -> Imagen:
+        """
+        Aplica una estrategia de filtro en paralelo (idéntica a filtro.aplicar).
+
+        Parámetros:
+            imagen (Imagen): Imagen de entrada (no se modifica).
+            filtro (FiltroStrategy): Curva tonal, convolución, detección de bordes u otra
+                estrategia (estas últimas se aplican de forma secuencial).
+            out (np.ndarray | None): Arreglo preasignado para el resultado.
+
+        Retorna:
+            Imagen: Nueva imagen filtrada.
+        """
+        datos = imagen.datos
+        if isinstance(filtro, FiltroIdentity):
+            return FiltroIdentity().aplicar(imagen) if out is None else Imagen(self._copiar(datos, out), imagen.precision)
+        if isinstance(filtro, FiltroCurvaTonal):
+            return self._aplicar_curva(imagen, filtro, out)
+        if isinstance(filtro, (FiltroConvolucion, FiltroBordes)) and datos.ndim >= 2:
+            tipo = datos.dtype
+            salida = self._salida(out, datos.shape, tipo)
+
+            def funcion(parte: np.ndarray) -> np.ndarray:
+                # Las bandas no aplican la política: la escala se decide sobre la imagen completa.
+                return filtro.aplicar(Imagen(parte, "float32")).datos
+            if not _bordes_locales(filtro):
+                salida[...] = funcion(datos)
+            elif not _usa_fft(filtro):
+                self._por_bandas(datos, funcion, _halo_operacion(filtro), salida)
+            elif datos.ndim == 3:
+                # La FFT depende del tamaño de la transformada: se reparte por canales.
+                def procesar(canal: int) -> None:
+                    salida[..., canal] = funcion(datos[..., canal])
+                list(self._pool.map(procesar, range(datos.shape[2])))
+            else:
+                salida[...] = funcion(datos)
+            return self._politica(imagen, salida, out, blanco=None)
+        resultado = filtro.aplicar(Imagen(datos, imagen.precision)).datos
+        return Imagen(resultado, imagen.precision) if out is None else Imagen(self._copiar(resultado, out))
+
+    def _aplicar_curva(self, imagen: Imagen, filtro: FiltroCurvaTonal, out: Optional[np.ndarray]) -> Imagen:
+        """
+        Aplica una curva tonal por bandas, con la decisión de escala tomada sobre la imagen
+        completa (o sobre sus estadísticas en caché).
+        """
+        datos = imagen.datos
+        if datos.dtype == np.uint8:
+            tabla = filtro.tabla_uint8
+            salida = self._salida(out, datos.shape, np.dtype(np.uint8))
+            self.repartir(lambda filas: aplicar_tablas(datos[filas], tabla, out=salida[filas]), datos.shape[0])
+            return Imagen(salida, imagen.precision)
+        escalar = imagen._maximo(self._maximo) > 1
+        salida = self._salida(out, datos.shape, np.dtype(np.float32))
+        self._por_bandas(datos, lambda parte: filtro._aplicar_flotante(parte, escalar), 0, salida)
+        return self._politica(imagen, salida, out)
+
+    @staticmethod
+    def _politica(imagen: Imagen, salida: np.ndarray, out: Optional[np.ndarray],
+                  blanco: Optional[float] = 1.0) -> Imagen:
+        """
+        Entrega el resultado como lo haría la operación secuencial: sin `out`, guardado según
+        la política de precisión de la imagen (ver Imagen._almacenar).
+        """
+        if out is None:
+            salida = imagen._almacenar(salida, blanco)
+        return Imagen(salida, imagen.precision)
+
+    def _copiar(self, datos: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """
+        Copia los datos en la salida por bandas.
+        """
+        if out.shape != datos.shape:
+            raise ValueError(f"La salida debe tener forma {datos.shape}")
+        self.repartir(lambda filas: np.copyto(out[filas], datos[filas], casting="same_kind"), datos.shape[0])
+        return out
+
+    def ejecutar(self, imagen: Imagen, operaciones: Sequence[Sequence]) -> Imagen:
+        """
+        Ejecuta una cadena de operaciones (ver Imagen.aplicar_operaciones) usando las
+        versiones paralelas de mean_filter, ajustar y las conversiones de color; el resto
+        de pasos se ejecuta de forma secuencial.
+
+        Parámetros:
+            imagen (Imagen): Imagen de entrada (no se modifica).
+            operaciones (Sequence[Sequence]): Cadena de operaciones.
+
+        Retorna:
+            Imagen: Imagen resultante, idéntica a la de aplicar_operaciones.
+        """
+        # Vista privada de solo lectura: los pasos en sitio copian antes de escribir y la
+        # imagen del llamador no cambia.
+        vista = imagen.datos.view()
+        vista.flags.writeable = False
+        actual = Imagen(vista, imagen.precision)
+        for operacion in operaciones:
+            nombre, *argumentos = operacion
+            if nombre == "mean_filter":
+                actual = self.mean_filter(actual, *argumentos[:1])
+            elif nombre == "ajustar":
+                actual = self.aplicar(actual, FiltroFactory.obtener_filtro(argumentos[0]))
+            elif nombre in _CONVERSIONES:
+                actual = self.convertir(actual, nombre, *argumentos)
+            else:
+                actual = actual.aplicar_operaciones([operacion])
+        return actual
@@ -0,0 +1,133 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+import numpy as np
+
+
+@dataclass(frozen=True)
+class PoliticaPrecision:
+    """
+    Política de precisión: tipo de dato en que se guardan los resultados flotantes de las
+    operaciones y los intermedios en caché.
+
+    Todas las operaciones calculan en float32; la política solo decide cómo se guarda el
+    resultado. Los resultados enteros (tablas de consulta y filtros sobre uint8) no cambian.
+
+    Atributos:
+        nombre (str): 'float32', 'float16' o 'uint8'.
+        tipo (np.dtype): Tipo de los resultados flotantes (float32, o uint8 en la ruta entera).
+        tipo_cache (np.dtype): Tipo de los intermedios flotantes en caché (niveles de la
+            pirámide y resultados de CacheImagenes).
+        cota (float): Error absoluto máximo de cada resultado respecto al cálculo exacto,
+            en la escala [0, 1]. Los errores de operaciones encadenadas se suman.
+        cota_cache (float): Error relativo máximo que añade guardar un intermedio en caché.
+    """
+    nombre: str
+    tipo: np.dtype
+    tipo_cache: np.dtype
+    cota: float
+    cota_cache: float
+
+    def almacenar(self, datos: np.ndarray, blanco: float = 1.0) -> np.ndarray:
+        """
+        Convierte un resultado al tipo de la política (los datos enteros no se modifican).
+
+        En la ruta uint8 los valores se llevan a [0, 255] (255 corresponde a `blanco`), se
+        redondean y se saturan.
+
+        Parámetros:
+            datos (np.ndarray): Resultado de una operación.
+            blanco (float): Valor que corresponde al blanco en `datos` (1 o 255).
+
+        Retorna:
+            np.ndarray: Datos en el tipo de la política (sin copia si ya lo están).
+        """
+        if not np.issubdtype(datos.dtype, np.floating):
+            return datos
+        if self.tipo == np.uint8:
+            escalado = np.multiply(datos, np.float32(255.0 / blanco), dtype=np.float32)
+            np.clip(escalado, 0.0, 255.0, out=escalado)
+            np.rint(escalado, out=escalado)
+            return escalado.astype(np.uint8)
+        return datos.astype(self.tipo, copy=False)
+
+    def a_cache(self, datos: np.ndarray) -> np.ndarray:
+        """
+        Convierte un intermedio flotante al tipo de la caché (los datos enteros no se modifican).
+        """
+        if not np.issubdtype(datos.dtype, np.floating):
+            return datos
+        return datos.astype(self.tipo_cache, copy=False)
+
+
+# Cotas (escala [0, 1]):
+#   - float32: el cálculo en float32 de las curvas tonales, las conversiones de color y los
+#     filtros queda por debajo de 1e-6 (unas decenas de ulp de float32 en [0, 1]).
+#   - float16: los resultados son float32; los intermedios en caché se redondean a 11 bits
+#     de mantisa (error relativo <= 2**-11, es decir, <= 2.5e-4 en [0, 1]: menos de 1/16
+#     de un nivel de uint8).
+#   - uint8: redondeo al nivel más cercano (0.5 / 255) más el cálculo en float32; mean_filter
+#     sobre uint8 trunca la media como la versión por píxel, por lo que su cota es 1 / 255.
+PRECISIONES = {
+    "float32": PoliticaPrecision("float32", np.dtype(np.float32), np.dtype(np.float32), 1e-6, 0.0),
+    "float16": PoliticaPrecision("float16", np.dtype(np.float32), np.dtype(np.float16), 1e-6, 2.0 ** -11),
+    "uint8": PoliticaPrecision("uint8", np.dtype(np.uint8), np.dtype(np.float32), 1.0 / 255.0, 0.0),
+}
+
+# Política por defecto del contexto actual. Cada hilo y cada tarea de asyncio tiene su propio
+# contexto: establecerla en uno no afecta a las cadenas que se ejecutan a la vez en otros.
+_actual: ContextVar[str] = ContextVar("precision", default="float32")
+
+
+def obtener_precision(nombre: Optional[str] = None) -> PoliticaPrecision:
+    """
+    Retorna una política por nombre, o la del contexto actual si `nombre` es None.
+
+    Raises:
+        ValueError: Si el nombre no corresponde a ninguna política.
+    """
+    politica = PRECISIONES.get(_actual.get() if nombre is None else nombre)
+    if politica is None:
+        raise ValueError(f"Precisión no soportada: {nombre!r} (use una de {', '.join(PRECISIONES)})")
+    return politica
+
+
+def establecer_precision(nombre: str) -> str:
+    """
+    Establece la política de precisión por defecto (la de las imágenes sin precisión propia)
+    en el contexto actual.
+
+    El valor es propio de cada hilo y de cada tarea de asyncio (ver contextvars): los hilos
+    nuevos parten de 'float32', y las tareas heredan el valor del contexto que las crea.
+
+    Parámetros:
+        nombre (str): 'float32' (por defecto), 'float16' o 'uint8'.
+
+    Retorna:
+        str: Nombre de la política anterior.
+
+    Raises:
+        ValueError: Si el nombre no corresponde a ninguna política.
+    """
+    obtener_precision(nombre)
+    anterior = _actual.get()
+    _actual.set(nombre)
+    return anterior
+
+
+@contextmanager
+def usar_precision(nombre: str) -> Iterator[PoliticaPrecision]:
+    """
+    Establece la política del contexto actual dentro de un bloque `with` y restaura la
+    anterior al salir.
+
+    Raises:
+        ValueError: Si el nombre no corresponde a ninguna política.
+    """
+    politica = obtener_precision(nombre)
+    ficha = _actual.set(nombre)
+    try:
+        yield politica
+    finally:
+        _actual.reset(ficha)
@@ -0,0 +1,192 @@
+from functools import lru_cache
+from math import ceil
+import numpy as np
+
+# Tamaño aproximado de los arreglos intermedios de cada bloque de filas de salida.
+BLOQUE_BYTES = 1 << 20
+# Radio (en píxeles de entrada, a escala 1) del núcleo de cada método de remuestreo.
+_RADIOS = {"bilineal": 1.0, "lanczos": 3.0}
+METODOS = ("vecino", "bilineal", "area", "lanczos")
+
+
+def _nucleo(metodo: str, x: np.ndarray) -> np.ndarray:
+    """
+    Evalúa el núcleo de interpolación en las distancias `x` (en píxeles de entrada).
+    """
+    if metodo == "bilineal":
+        return np.maximum(0.0, 1.0 - np.abs(x))
+    # Lanczos de 3 lóbulos: sinc(x) * sinc(x / 3) en |x| < 3.
+    return np.where(np.abs(x) < 3.0, np.sinc(x) * np.sinc(x / 3.0), 0.0)
+
+
+@lru_cache(maxsize=64)
+def _pesos(entrada: int, salida: int, metodo: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Índices y pesos del remuestreo de un eje de `entrada` a `salida` muestras.
+
+    Cada muestra de salida es la suma ponderada de `T` muestras de entrada (las mismas
+    posiciones relativas para todas), por lo que una pasada se reduce a T lecturas
+    vectorizadas. Al reducir, el núcleo se ensancha en proporción a la escala para
+    promediar todas las muestras que cubre (sin aliasing). Los pesos que caen fuera de
+    la imagen se descartan y el resto se renormaliza.
+
+    Retorna:
+        tuple[np.ndarray, np.ndarray]: Índices (salida x T) y pesos float64 (salida x T),
+        ambos de solo lectura.
+    """
+    escala = entrada / salida
+    if metodo == "area":
+        # Fracción de cada píxel de entrada que cubre el intervalo de cada píxel de salida.
+        inicio = np.arange(salida) * escala
+        indices = np.floor(inicio).astype(np.intp)[:, None] + np.arange(ceil(escala) + 1)
+        pesos = np.minimum(inicio[:, None] + escala, indices + 1) - np.maximum(inicio[:, None], indices)
+        pesos = np.clip(pesos, 0.0, None)
+    else:
+        ampliacion = max(escala, 1.0)
+        soporte = _RADIOS[metodo] * ampliacion
+        centros = (np.arange(salida) + 0.5) * escala
+        indices = np.floor(centros - soporte + 0.5).astype(np.intp)[:, None] + np.arange(ceil(soporte) * 2 + 1)
+        pesos = _nucleo(metodo, (indices + 0.5 - centros[:, None]) / ampliacion)
+    pesos[(indices < 0) | (indices >= entrada)] = 0.0
+    usados = np.flatnonzero(pesos.any(axis=0))
+    indices = np.clip(indices[:, usados[0]:usados[-1] + 1], 0, entrada - 1)
+    pesos = pesos[:, usados[0]:usados[-1] + 1]
+    pesos /= pesos.sum(axis=1, keepdims=True)
+    indices.flags.writeable = False
+    pesos.flags.writeable = False
+    return indices, pesos
+
+
+def _indices_vecino(entrada: int, salida: int) -> np.ndarray:
+    """
+    Índice de la muestra de entrada más cercana al centro de cada muestra de salida.
+    """
+    return np.minimum(((np.arange(salida) + 0.5) * (entrada / salida)).astype(np.intp), entrada - 1)
+
+
+def _pasada(datos: np.ndarray, eje: int, indices: np.ndarray, pesos: np.ndarray, tipo: np.dtype) -> np.ndarray:
+    """
+    Remuestrea un eje como suma ponderada de lecturas desplazadas (una por tap del núcleo).
+    """
+    salida = indices.shape[0]
+    pesos = pesos.astype(tipo).reshape((salida, -1) + (1,) * (datos.ndim - 1 - eje))
+    forma = datos.shape[:eje] + (salida,) + datos.shape[eje + 1:]
+    acumulado = np.zeros(forma, dtype=tipo)
+    temporal = np.empty(forma, dtype=tipo)
+    for tap in range(indices.shape[1]):
+        np.multiply(np.take(datos, indices[:, tap], axis=eje), pesos[:, tap], out=temporal)
+        acumulado += temporal
+    return acumulado
+
+
+def _promedio_entero(datos: np.ndarray, alto: int, ancho: int, tipo: np.dtype) -> np.ndarray:
+    """
+    Promedio de bloques cuando el tamaño de entrada es múltiplo exacto del de salida.
+
+    Primero se suman las filas de cada bloque (lecturas de filas contiguas) y después las
+    columnas, en lugar de una reducción sobre ejes intercalados, que es mucho más lenta.
+    """
+    factor_alto, factor_ancho = datos.shape[0] // alto, datos.shape[1] // ancho
+    suma = datos[0::factor_alto].astype(tipo)
+    for fila in range(1, factor_alto):
+        suma += datos[fila::factor_alto]
+    grupos = suma.reshape((alto, ancho, factor_ancho) + datos.shape[2:])
+    resultado = grupos[:, :, 0].copy()
+    for columna in range(1, factor_ancho):
+        resultado += grupos[:, :, columna]
+    resultado *= tipo.type(1.0 / (factor_alto * factor_ancho))
+    return resultado
+
+
+def _redondear(resultado: np.ndarray, tipo_original: np.dtype) -> np.ndarray:
+    """
+    Redondea y satura el resultado flotante si la entrada es entera (la conversión de tipo
+    se hace al escribirlo en la salida).
+    """
+    if np.issubdtype(tipo_original, np.integer):
+        limites = np.iinfo(tipo_original)
+        np.rint(resultado, out=resultado)
+        np.clip(resultado, limites.min, limites.max, out=resultado)
+    return resultado
+
+
+def redimensionar(datos: np.ndarray, alto: int, ancho: int, metodo: str = "bilineal") -> np.ndarray:
+    """
+    Cambia el tamaño de una imagen (H x W o H x W x C) con pasadas separables vectorizadas.
+
+    La salida se calcula por bloques de filas: para cada bloque se leen solo las filas de
+    entrada que lo afectan y las dos pasadas (primero la del eje que más se reduce) se
+    hacen sobre arreglos intermedios que caben en caché. Los cálculos se hacen en float32
+    (float64 si la entrada es float64) y el resultado conserva el tipo de la entrada.
+
+    Parámetros:
+        datos (np.ndarray): Imagen de entrada.
+        alto (int): Alto de salida.
+        ancho (int): Ancho de salida.
+        metodo (str): 'vecino' (vecino más cercano), 'bilineal' (triangular, con
+            antialiasing al reducir), 'area' (promedio del área cubierta por cada píxel de
+            salida; el adecuado para miniaturas) o 'lanczos' (3 lóbulos, más nítido).
+
+    Retorna:
+        np.ndarray: Imagen de tamaño alto x ancho, del mismo tipo que la entrada.
+
+    Raises:
+        ValueError: Si el método no es válido, el tamaño no es positivo o los datos no son una imagen.
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"Método de remuestreo no válido: {metodo!r} (use uno de {', '.join(METODOS)})")
+    if alto < 1 or ancho < 1:
+        raise ValueError("El tamaño debe ser positivo")
+    if datos.ndim not in (2, 3) or 0 in datos.shape[:2]:
+        raise ValueError("Los datos deben ser una imagen H x W o H x W x C no vacía")
+    alto_entrada, ancho_entrada = datos.shape[:2]
+    if (alto, ancho) == (alto_entrada, ancho_entrada):
+        return datos.copy()
+    if metodo == "vecino":
+        filas = _indices_vecino(alto_entrada, alto)
+        columnas = _indices_vecino(ancho_entrada, ancho)
+        return np.take(np.take(datos, filas, axis=0), columnas, axis=1)
+    tipo = np.dtype(np.float64 if datos.dtype == np.float64 else np.float32)
+    salida = np.empty((alto, ancho) + datos.shape[2:], dtype=datos.dtype)
+    bytes_fila = max(ancho_entrada, ancho) * (datos.size // (alto_entrada * ancho_entrada)) * tipo.itemsize
+    bloque = max(1, BLOQUE_BYTES // bytes_fila)
+    if metodo == "area" and alto_entrada % alto == 0 and ancho_entrada % ancho == 0:
+        factor = alto_entrada // alto
+        for inicio in range(0, alto, bloque):
+            fin = min(inicio + bloque, alto)
+            local = _promedio_entero(datos[inicio * factor:fin * factor], fin - inicio, ancho, tipo)
+            salida[inicio:fin] = _redondear(local, datos.dtype)
+        return salida
+    filas = _pesos(alto_entrada, alto, metodo) if alto != alto_entrada else None
+    columnas = _pesos(ancho_entrada, ancho, metodo) if ancho != ancho_entrada else None
+    filas_primero = alto / alto_entrada <= ancho / ancho_entrada
+    for inicio in range(0, alto, bloque):
+        fin = min(inicio + bloque, alto)
+        if filas is None:
+            local = _pasada(datos[inicio:fin], 1, *columnas, tipo)
+        else:
+            indices, pesos = filas[0][inicio:fin], filas[1][inicio:fin]
+            # Los índices crecen por fila y por tap: el bloque depende de un rango contiguo.
+            primera, ultima = indices[0, 0], indices[-1, -1]
+            local = datos[primera:ultima + 1]
+            if columnas is not None and not filas_primero:
+                local = _pasada(local, 1, *columnas, tipo)
+            local = _pasada(local, 0, indices - primera, pesos, tipo)
+            if columnas is not None and filas_primero:
+                local = _pasada(local, 1, *columnas, tipo)
+        salida[inicio:fin] = _redondear(local, datos.dtype)
+    return salida
+
+
+def reducir_mitad(datos: np.ndarray) -> np.ndarray:
+    """
+    Reduce una imagen a la mitad de su tamaño promediando bloques de 2 x 2 (un nivel de
+    pirámide). Con dimensiones impares el promedio cubre el área equivalente.
+
+    Parámetros:
+        datos (np.ndarray): Imagen de entrada.
+
+    Retorna:
+        np.ndarray: Imagen de (H // 2) x (W // 2), al menos 1 x 1.
+    """
+    return redimensionar(datos, max(1, datos.shape[0] // 2), max(1, datos.shape[1] // 2), "area")
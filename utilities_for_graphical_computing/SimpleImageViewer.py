@@ -1,76 +1,308 @@
-import matplotlib.pyplot as plt
+import importlib.util
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import numpy as np
-from typing import Dict, Union, Any
+from PIL import Image, ImageDraw, ImageFont
+from typing import Dict, Optional, Union, Any
+
+from .ImageProcessor import Imagen
+
+# Alto reservado para el título sobre cada celda de una hoja de contactos y margen
+# alrededor de cada miniatura (en píxeles).
+_TITLE_HEIGHT = 16
+_TILE_MARGIN = 2
+
+
+def _grid(n_images: int, columns: Optional[int] = None) -> tuple[int, int]:
+    """
+    Calcula las filas y columnas de una cuadrícula para n imágenes (lo más cuadrada posible).
+    """
+    n_images = max(1, n_images)
+    columns = min(columns or math.ceil(math.sqrt(n_images)), n_images)
+    return math.ceil(n_images / columns), columns
+
+
+def _to_uint8(image_array: np.ndarray) -> np.ndarray:
+    """
+    Convierte un arreglo a uint8 para su visualización.
+
+    Los enteros se recortan a [0, 255]; los flotantes se interpretan en [0, 1] o, si su máximo
+    supera 1, en [0, 255] (el mismo criterio que show() aplica a las imágenes de un canal).
+    """
+    if image_array.dtype == np.uint8:
+        return image_array
+    if image_array.dtype.kind in 'ui':
+        return np.clip(image_array, 0, 255).astype(np.uint8)
+    factor = 1.0 if image_array.size and image_array.max() > 1 else 255.0
+    return np.clip(image_array * factor + 0.5, 0, 255).astype(np.uint8)
+
+
+@lru_cache(maxsize=None)
+def _title_font() -> ImageFont.ImageFont:
+    """
+    Fuente de los títulos de las hojas de contactos: la DejaVu Sans que incluye matplotlib
+    (con acentos, localizada sin importar matplotlib), o la fuente por defecto de Pillow.
+    """
+    spec = importlib.util.find_spec('matplotlib')
+    if spec is not None and spec.submodule_search_locations:
+        path = os.path.join(spec.submodule_search_locations[0], 'mpl-data', 'fonts', 'ttf', 'DejaVuSans.ttf')
+        try:
+            return ImageFont.truetype(path, 11)
+        except OSError:
+            pass
+    return ImageFont.load_default()
+
+
+def _fit_title(title: str, width: int, font: ImageFont.ImageFont) -> str:
+    """
+    Recorta un título para que no invada las celdas vecinas.
+    """
+    if font.getlength(title) <= width:
+        return title
+    while title and font.getlength(title + '…') > width:
+        title = title[:-1]
+    return title + '…'
+
+
+def _thumbnail(image_array: np.ndarray, tile_size: int) -> Image.Image:
+    """
+    Reduce una imagen para que quepa en una celda de tile_size x tile_size conservando la proporción.
+
+    La reducción se hace con Pillow: primero una reducción entera por promedio de bloques y
+    luego un remuestreo bilineal, por lo que nunca se dibuja la imagen a resolución completa.
+
+    Retorna:
+        Image.Image: Miniatura en modo RGB (las imágenes de 4 canales se tratan como RGBA,
+        igual que en imshow, y se descarta el canal alfa).
+    """
+    if image_array.dtype != np.uint8:
+        # Los arreglos que hay que convertir se submuestrean antes por saltos, dejando al
+        # menos un factor 2 para la reducción por bloques, y no se convierten completos.
+        step = int(max(image_array.shape[:2], default=0) / tile_size / 2)
+        if step > 1:
+            image_array = image_array[::step, ::step]
+    image_array = _to_uint8(image_array)
+    if image_array.ndim == 3 and image_array.shape[2] == 1:
+        image_array = image_array[..., 0]
+    if image_array.ndim not in (2, 3) or (image_array.ndim == 3 and image_array.shape[2] not in (3, 4)):
+        raise ValueError(f"No se puede mostrar una imagen de forma {image_array.shape}")
+    image = Image.fromarray(np.ascontiguousarray(image_array))
+    image.thumbnail((tile_size, tile_size), Image.Resampling.BILINEAR, reducing_gap=2.0)
+    return image.convert('RGB') if image.mode != 'RGB' else image
+
 
 class SimpleImageViewer:
     """
     Clase sencilla para mostrar múltiples imágenes en una o varias figuras.
-    
-    Las imágenes se muestran en una cuadrícula fija de 2x2 por figura, lo que asegura un tamaño
-    estándar y suficiente separación entre ellas y sus títulos. Se acepta tanto arreglos NumPy
-    como instancias de la clase Imagen (o similares que tengan el atributo 'datos').
+
+    Las imágenes se muestran en una cuadrícula de `images_per_figure` celdas por figura (2x2
+    por defecto), lo que asegura un tamaño estándar y suficiente separación entre ellas y sus
+    títulos. Se acepta tanto arreglos NumPy como instancias de la clase Imagen (o similares
+    que tengan el atributo 'datos') y rutas de archivos de imagen.
+
+    Además de mostrarlas de forma interactiva, las imágenes pueden guardarse sin pantalla como
+    hojas de contactos (ver save_contact_sheets). matplotlib solo se importa al usar un método
+    que lo necesita.
     """
-    
+
     def __init__(self, images_dict: Dict[str, Union[np.ndarray, Any]]) -> None:
         """
         Inicializa la clase con un diccionario de imágenes.
-        
+
         Parámetros:
-            images_dict (Dict[str, Union[np.ndarray, Imagen]]): Diccionario en el que las claves
-            son títulos y los valores son imágenes.
+            images_dict (Dict[str, Union[np.ndarray, Imagen, str]]): Diccionario en el que las
+            claves son títulos y los valores son imágenes o rutas de archivos.
         """
         self.images_dict = images_dict
-    
+
     @staticmethod
-    def _get_image_array(image: Union[np.ndarray, Any]) -> np.ndarray:
+    def _get_image_array(image: Union[np.ndarray, Any], max_size: Optional[int] = None) -> np.ndarray:
         """
         Extrae el arreglo de imagen de un objeto.
-        
+
         Si el objeto tiene el atributo 'datos', se asume que es una instancia de la clase Imagen
-        y se retorna dicho atributo; de lo contrario, se asume que ya es un arreglo NumPy.
-        
+        y se retorna dicho atributo; si es una ruta, se carga el archivo (decodificándolo
+        directamente a resolución reducida si se indica `max_size`); de lo contrario, se
+        asume que ya es un arreglo NumPy.
+
         Parámetros:
-            image (Union[np.ndarray, Imagen]): Imagen a procesar.
-        
+            image (Union[np.ndarray, Imagen, str]): Imagen a procesar.
+            max_size (int | None): Lado máximo con el que se cargan los archivos.
+
         Retorna:
             np.ndarray: Arreglo de la imagen.
         """
         if hasattr(image, 'datos'):
             return image.datos
+        if isinstance(image, (str, os.PathLike)):
+            size = None if max_size is None else (max_size, max_size)
+            return Imagen.desde_archivo(os.fspath(image), tamano=size).datos
         return image
-    
+
     def show(self, images_per_figure: int = 4, scale: float = 5) -> None:
         """
-        Muestra todas las imágenes en figuras con una cuadrícula fija de 2 filas x 2 columnas.
-        
-        Esto garantiza que cada imagen se muestre en un tamaño estándar y con suficiente separación,
+        Muestra todas las imágenes en figuras con una cuadrícula de hasta `images_per_figure` celdas.
+
+        La cuadrícula es lo más cuadrada posible (2 filas x 2 columnas para 4 imágenes), lo que
+        garantiza que cada imagen se muestre en un tamaño estándar y con suficiente separación,
         evitando solapamientos entre imágenes y títulos.
-        
+
         Parámetros:
             images_per_figure (int): Número máximo de imágenes por figura (por defecto, 4).
             scale (float): Factor de escala para definir el tamaño de la figura.
         """
+        import matplotlib.pyplot as plt
         images_list = list(self.images_dict.items())
         n_images = len(images_list)
-        
-        # Se generan figuras de 2x2 para cada grupo de imágenes.
+        rows, columns = _grid(images_per_figure)
+
+        # Se genera una figura con la cuadrícula completa para cada grupo de imágenes.
         for i in range(0, n_images, images_per_figure):
-            fig, axes = plt.subplots(2, 2, figsize=(scale * 2, scale * 2))
+            fig, axes = plt.subplots(rows, columns, figsize=(scale * columns, scale * rows), squeeze=False)
             fig.subplots_adjust(hspace=0.5, wspace=0.5)
             axes = axes.flatten()
-            
+
             current_items = images_list[i:i + images_per_figure]
             for ax, (title, image) in zip(axes, current_items):
                 image_array = self._get_image_array(image)
                 if image_array.ndim == 2:
-                    ax.imshow(image_array, cmap='gray')
+                    # Escala fija (como en las imágenes de 3 canales) para no estirar el contraste.
+                    vmax = 255 if image_array.dtype.kind in 'ui' or image_array.max() > 1 else 1
+                    ax.imshow(image_array, cmap='gray', vmin=0, vmax=vmax)
                 else:
                     ax.imshow(image_array)
                 ax.set_title(title)
                 ax.axis('off')
-            
+
             # Ocultar los ejes no utilizados en la cuadrícula.
             for ax in axes[len(current_items):]:
                 ax.axis('off')
-        
+
         plt.show()
+
+    def save_contact_sheets(self, path: str, images_per_figure: int = 16, columns: Optional[int] = None,
+                            tile_size: int = 256, engine: str = 'matplotlib', dpi: int = 100,
+                            workers: int = 1) -> list[str]:
+        """
+        Guarda las imágenes como hojas de contactos en archivos PNG/JPEG, sin abrir ventanas.
+
+        Cada imagen se reduce a su tamaño de celda antes de dibujarse (los archivos se
+        decodifican directamente a ese tamaño), de modo que el costo por imagen no depende de
+        su resolución. Hay dos motores:
+
+          - 'matplotlib': una única figura con su lienzo Agg se reutiliza en todas las hojas;
+            en cada hoja solo se reemplazan los datos y títulos de cada celda.
+          - 'pillow': la hoja se compone directamente pegando las miniaturas sobre un lienzo
+            de Pillow, sin pasar por matplotlib (el más rápido).
+
+        Parámetros:
+            path (str): Ruta de salida; el formato se deduce de la extensión. Puede contener
+                el campo '{pagina}' (p. ej., 'hojas/qa_{pagina:04d}.png'); si no lo contiene
+                y hay más de una hoja, se agrega '_NNN' antes de la extensión.
+            images_per_figure (int): Número de imágenes por hoja.
+            columns (int | None): Columnas de la cuadrícula (por defecto, lo más cuadrada posible).
+            tile_size (int): Lado de cada celda en píxeles.
+            engine (str): 'matplotlib' o 'pillow'.
+            dpi (int): Resolución de las hojas de matplotlib (el tamaño en píxeles no depende de ella).
+            workers (int): Hilos usados para cargar y reducir las imágenes de cada hoja.
+
+        Retorna:
+            list[str]: Rutas de los archivos generados, en orden.
+
+        Raises:
+            ValueError: Si los parámetros no son válidos o alguna imagen no se puede mostrar.
+        """
+        if engine not in ('matplotlib', 'pillow'):
+            raise ValueError("El motor debe ser 'matplotlib' o 'pillow'")
+        if images_per_figure < 1 or tile_size < 1 or workers < 1:
+            raise ValueError("images_per_figure, tile_size y workers deben ser positivos")
+        images_list = list(self.images_dict.items())
+        pages = max(1, math.ceil(len(images_list) / images_per_figure))
+        rows, columns = _grid(images_per_figure, columns)
+        render = self._render_pillow if engine == 'pillow' else self._matplotlib_renderer(rows, columns, tile_size, dpi)
+
+        def load(item: tuple[str, Any]) -> tuple[str, Image.Image]:
+            title, image = item
+            size = max(1, tile_size - 2 * _TILE_MARGIN)
+            return title, _thumbnail(self._get_image_array(image, size), size)
+
+        paths = []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for page in range(pages):
+                current_items = images_list[page * images_per_figure:(page + 1) * images_per_figure]
+                tiles = list(pool.map(load, current_items)) if workers > 1 else [load(item) for item in current_items]
+                if '{pagina' in path:
+                    output = path.format(pagina=page)
+                elif pages > 1:
+                    root, extension = os.path.splitext(path)
+                    output = f"{root}_{page:03d}{extension}"
+                else:
+                    output = path
+                if os.path.dirname(output):
+                    os.makedirs(os.path.dirname(output), exist_ok=True)
+                render(tiles, output, rows, columns, tile_size)
+                paths.append(output)
+        return paths
+
+    @staticmethod
+    def _render_pillow(tiles: list[tuple[str, Image.Image]], output: str, rows: int, columns: int,
+                       tile_size: int) -> None:
+        """
+        Compone una hoja de contactos pegando las miniaturas sobre un lienzo de Pillow.
+        """
+        cell_height = tile_size + _TITLE_HEIGHT
+        sheet = Image.new('RGB', (columns * tile_size, rows * cell_height), 'white')
+        draw = ImageDraw.Draw(sheet)
+        font = _title_font()
+        for index, (title, thumbnail) in enumerate(tiles):
+            row, column = divmod(index, columns)
+            x, y = column * tile_size, row * cell_height
+            sheet.paste(thumbnail, (x + (tile_size - thumbnail.width) // 2,
+                                    y + _TITLE_HEIGHT + (tile_size - thumbnail.height) // 2))
+            title = _fit_title(title, tile_size - 2 * _TILE_MARGIN, font)
+            draw.text((x + tile_size / 2, y + _TITLE_HEIGHT / 2), title, fill='black', font=font, anchor='mm')
+        sheet.save(output)
+
+    @staticmethod
+    def _matplotlib_renderer(rows: int, columns: int, tile_size: int, dpi: int):
+        """
+        Crea la figura reutilizable del motor 'matplotlib' y retorna la función que dibuja cada hoja.
+
+        La figura se crea sin pyplot (no se registra en el gestor de ventanas ni requiere
+        pantalla) con un eje por celda, y cada eje conserva su AxesImage entre hojas.
+        """
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        cell_height = tile_size + _TITLE_HEIGHT
+        figure = Figure(figsize=(columns * tile_size / dpi, rows * cell_height / dpi), dpi=dpi)
+        FigureCanvasAgg(figure)
+        axes = []
+        for index in range(rows * columns):
+            row, column = divmod(index, columns)
+            ax = figure.add_axes((column / columns, 1 - (row + 1) / rows,
+                                  1 / columns, tile_size / cell_height / rows))
+            ax.axis('off')
+            axes.append(ax)
+        artists: list[Optional[Any]] = [None] * len(axes)
+        font = _title_font()
+
+        def render(tiles: list[tuple[str, Image.Image]], output: str, *_) -> None:
+            for index, ax in enumerate(axes):
+                if index >= len(tiles):
+                    ax.set_visible(False)
+                    continue
+                title, thumbnail = tiles[index]
+                data = np.asarray(thumbnail)
+                if artists[index] is None:
+                    artists[index] = ax.imshow(data, interpolation='nearest')
+                else:
+                    artists[index].set_data(data)
+                    artists[index].set_extent((-0.5, data.shape[1] - 0.5, data.shape[0] - 0.5, -0.5))
+                ax.set_xlim(-0.5, data.shape[1] - 0.5)
+                ax.set_ylim(data.shape[0] - 0.5, -0.5)
+                ax.set_title(_fit_title(title, tile_size - 2 * _TILE_MARGIN, font), fontsize=8)
+                ax.set_visible(True)
+            figure.savefig(output, dpi=dpi, facecolor='white')
+        return render
@@ -0,0 +1,195 @@
+from typing import Callable, Iterator, Optional, Sequence, Union
+import numpy as np
+
+from .ImageProcessor import Imagen, FiltroCurvaTonal, FiltroIdentity, _dimensiones_kernel
+from .Convolution import MODOS_LOCALES
+
+# Una operación puede ser una función Imagen -> Imagen, una estrategia con método
+# 'aplicar' (FiltroStrategy) o una cadena de operaciones (ver Imagen.aplicar_operaciones).
+Operacion = Union[Callable[[Imagen], Imagen], Sequence[Sequence], object]
+
+# Pasos de una cadena que se calculan píxel a píxel (con el rango de la imagen completa, ver
+# EjecutorTeselas._procesar_tesela) y que, por tanto, pueden aplicarse por teselas sin halo.
+_OPERACIONES_PUNTUALES = frozenset({
+    "normalizar", "desnormalizar", "invertir", "ajustar", "gris_promedio", "gris_luminosidad",
+    "gris_tonalidad", "extraer_capa_rgb", "extraer_capa_cmyk", "a_rgb", "rgb_a_cmyk", "cmyk_a_rgb",
+    "rgb_a_hsv", "hsv_a_rgb", "rgb_a_ycbcr", "ycbcr_a_rgb", "rgb_a_lab", "lab_a_rgb",
+})
+
+
+def _halo_operacion(operacion: Operacion) -> int:
+    """
+    Calcula el radio de vecindad que necesita una operación.
+
+    Se reconocen los filtros con atributo 'kernel' o 'kernel_x' (convoluciones), las curvas
+    tonales y, en las cadenas de operaciones, los pasos punto a punto y 'mean_filter'.
+
+    Raises:
+        ValueError: Si la cadena contiene una operación global (p. ej., ecualizar o
+            redimensionar), o si la operación es una función u otra estrategia, cuyo halo
+            no puede deducirse.
+    """
+    for atributo in ("kernel", "kernel_x"):
+        kernel = getattr(operacion, atributo, None)
+        if kernel is not None:
+            return max(np.shape(kernel)) // 2
+    if isinstance(operacion, (FiltroCurvaTonal, FiltroIdentity)):
+        return 0
+    if isinstance(operacion, (list, tuple)):
+        halo = 0
+        for paso in operacion:
+            nombre, *argumentos = paso
+            if nombre == "mean_filter":
+                alto, ancho = _dimensiones_kernel(argumentos[0] if argumentos else 3)
+                halo += max(alto, ancho) // 2
+            elif nombre not in _OPERACIONES_PUNTUALES:
+                raise ValueError(f"La operación '{nombre}' no es local ni punto a punto: no puede "
+                                 "aplicarse por teselas")
+        return halo
+    raise ValueError("No se puede deducir el halo de la operación: indíquelo con 'halo'")
+
+
+def _bordes_locales(operacion: Operacion) -> bool:
+    """
+    Indica si el resultado de la operación en un píxel solo depende de su vecindad (halo).
+
+    No lo cumplen los filtros con un modo de borde no local ('wrap', 'mean', 'median', ...,
+    ver Convolution.MODOS_LOCALES); mean_filter usa 'reflect' y el resto se considera local.
+    """
+    modo = getattr(operacion, "modo", None)
+    return modo is None or modo in MODOS_LOCALES
+
+
+def _como_funcion(operacion: Operacion) -> Callable[[Imagen], Imagen]:
+    """
+    Normaliza una operación a una función Imagen -> Imagen.
+    """
+    if hasattr(operacion, "aplicar"):
+        return operacion.aplicar
+    if isinstance(operacion, (list, tuple)):
+        return lambda imagen: imagen.aplicar_operaciones(operacion)
+    return operacion
+
+
+class EjecutorTeselas:
+    """
+    Ejecutor que procesa imágenes grandes por teselas de tamaño fijo.
+
+    La imagen de entrada puede estar respaldada por un np.memmap (ver Imagen.desde_npy),
+    y la salida puede escribirse directamente en otro archivo mapeado en memoria, de modo
+    que la memoria máxima utilizada es proporcional al tamaño de la tesela y no al de la
+    imagen. Para filtros de vecindad, cada tesela se lee con un margen (halo) de píxeles
+    vecinos que luego se descarta, por lo que los bordes entre teselas no introducen
+    artefactos; en los bordes de la imagen se conserva el padding propio de cada filtro.
+    Con el modo de borde 'wrap', el halo de las teselas del borde se lee del lado opuesto
+    de la imagen. Los modos estadísticos ('mean', 'median', 'maximum', 'minimum') dependen
+    de filas y columnas completas y no se admiten.
+    """
+
+    def __init__(self, tamano_tesela: tuple[int, int] = (512, 512)) -> None:
+        if tamano_tesela[0] < 1 or tamano_tesela[1] < 1:
+            raise ValueError("El tamaño de la tesela debe ser positivo")
+        self.tamano_tesela = tamano_tesela
+
+    def teselas(self, alto: int, ancho: int) -> Iterator[tuple[slice, slice]]:
+        """
+        Genera las regiones (filas, columnas) de cada tesela en orden de filas.
+        """
+        alto_t, ancho_t = self.tamano_tesela
+        for y in range(0, alto, alto_t):
+            for x in range(0, ancho, ancho_t):
+                yield slice(y, min(y + alto_t, alto)), slice(x, min(x + ancho_t, ancho))
+
+    @staticmethod
+    def _procesar_tesela(imagen: Imagen, funcion: Callable[[Imagen], Imagen], filas: slice,
+                         columnas: slice, halo: int, maximo: float, ciclico: bool = False) -> np.ndarray:
+        """
+        Procesa una tesela con su halo y retorna solo la región interior.
+
+        La tesela recibe el máximo de la imagen completa, de modo que las operaciones que
+        detectan el rango ([0, 1] o [0, 255]) deciden igual en todas las teselas. Con
+        `ciclico` (modo 'wrap'), el halo que sale de la imagen se lee del lado opuesto.
+        """
+        datos = imagen.datos
+        alto, ancho = datos.shape[:2]
+        if ciclico:
+            y0, x0 = filas.start - halo, columnas.start - halo
+            indices_filas = np.arange(y0, filas.stop + halo) % alto
+            indices_columnas = np.arange(x0, columnas.stop + halo) % ancho
+            ventana = datos[np.ix_(indices_filas, indices_columnas)]
+        else:
+            y0, y1 = max(filas.start - halo, 0), min(filas.stop + halo, alto)
+            x0, x1 = max(columnas.start - halo, 0), min(columnas.stop + halo, ancho)
+            ventana = np.array(datos[y0:y1, x0:x1])
+        tesela = Imagen(ventana, imagen.precision)
+        tesela._cache()["maximo"] = maximo
+        ventana = tesela.datos
+        resultado = funcion(tesela).datos
+        if resultado.shape[:2] != ventana.shape[:2]:
+            raise ValueError("La operación debe conservar el alto y el ancho de la imagen")
+        return resultado[filas.start - y0:filas.stop - y0, columnas.start - x0:columnas.stop - x0]
+
+    @staticmethod
+    def _preparar_salida(salida: Union[None, str, np.ndarray], forma: tuple, dtype: np.dtype) -> np.ndarray:
+        """
+        Crea o valida el arreglo de salida (en memoria, archivo .npy mapeado o arreglo dado).
+        """
+        if salida is None:
+            return np.empty(forma, dtype=dtype)
+        if isinstance(salida, str):
+            return np.lib.format.open_memmap(salida, mode="w+", dtype=dtype, shape=forma)
+        if salida.shape != forma:
+            raise ValueError(f"La salida debe tener forma {forma}")
+        return salida
+
+    def ejecutar(self, imagen: Imagen, operacion: Operacion, halo: Optional[int] = None,
+                 salida: Union[None, str, np.ndarray] = None) -> Imagen:
+        """
+        Aplica una operación a la imagen tesela por tesela.
+
+        Parámetros:
+            imagen (Imagen): Imagen de entrada (sus datos pueden ser un np.memmap).
+            operacion (Operacion): Función Imagen -> Imagen, FiltroStrategy o cadena de
+                operaciones. Debe conservar el alto y el ancho (puede cambiar canales y tipo).
+            halo (int | None): Margen de vecindad; si es None se deduce de la operación
+                (obligatorio para funciones y estrategias sin kernel).
+            salida (None | str | np.ndarray): Destino del resultado: None (arreglo en memoria),
+                ruta de un archivo .npy (se crea mapeado en memoria) o un arreglo preasignado.
+
+        Retorna:
+            Imagen: Imagen con el resultado (respaldada por la salida indicada).
+
+        Raises:
+            ValueError: Si el halo no puede deducirse, si la cadena contiene operaciones
+                globales (ecualizar, autocontraste, clahe, redimensionar, ...) o si el filtro
+                usa un modo de borde estadístico.
+
+        Nota:
+            El rango de los datos de entrada se detecta una sola vez sobre la imagen completa.
+            En una cadena, los pasos posteriores que detectan el rango de un resultado
+            flotante (p. ej., ajustar tras mean_filter) lo hacen tesela por tesela; conviene
+            normalizar la imagen antes.
+        """
+        datos = imagen.datos
+        if halo is None or isinstance(operacion, (list, tuple)):
+            # Las cadenas se validan aunque se indique el halo.
+            deducido = _halo_operacion(operacion)
+            halo = deducido if halo is None else halo
+        ciclico = getattr(operacion, "modo", None) == "wrap"
+        if not ciclico and not _bordes_locales(operacion):
+            raise ValueError(f"El modo de borde '{operacion.modo}' depende de la imagen completa: "
+                             "no puede aplicarse por teselas")
+        funcion = _como_funcion(operacion)
+        alto, ancho = datos.shape[:2]
+        maximo = imagen._maximo()
+        destino = None
+        for filas, columnas in self.teselas(alto, ancho):
+            bloque = self._procesar_tesela(imagen, funcion, filas, columnas, halo, maximo, ciclico)
+            if destino is None:
+                destino = self._preparar_salida(salida, (alto, ancho) + bloque.shape[2:], bloque.dtype)
+            destino[filas, columnas] = bloque
+        if destino is None:
+            destino = self._preparar_salida(salida, datos.shape, datos.dtype)
+        if isinstance(destino, np.memmap):
+            destino.flush()
+        return Imagen(destino, imagen.precision)
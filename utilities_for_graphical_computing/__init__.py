@@ -1,22 +1,116 @@
+import importlib
+
 from .ImageProcessor import (
     Imagen,
+    Separacion,
     ColorConverter,
     FiltroFactory,
     FiltroStrategy,
     FiltroContraste,
     FiltroIntensidad,
     FiltroIdentity,
+    FiltroCurvaTonal,
+    FiltroGamma,
+)
+from .Histogram import Estadisticas
+from .Precision import (
+    PoliticaPrecision,
+    establecer_precision,
+    obtener_precision,
+    usar_precision,
+)
+from .Instrumentation import (
+    perfilar,
+    agregar_callback,
+    eliminar_callback,
+    Informe,
+    RegistroOperacion,
 )
-from .SimpleImageViewer import SimpleImageViewer
+
+# Nombres que se importan desde su módulo la primera vez que se usan. Así, importar el
+# paquete solo carga lo que necesita Imagen: el visor (y con él matplotlib), Pillow y los
+# ejecutores no se importan hasta que se utilizan.
+_PEREZOSOS = {
+    "ImagenDiferida": "LazyPipeline",
+    "ImagenBatch": "ImageBatch",
+    "procesar_lote": "BatchRunner",
+    "ResultadoLote": "BatchRunner",
+    "leer_fotogramas": "FrameSequence",
+    "EscritorFotogramas": "FrameSequence",
+    "procesar_fotogramas": "FrameSequence",
+    "ServicioImagenes": "ImageService",
+    "ClienteLocal": "ImageService",
+    "EstadisticasServicio": "ImageService",
+    "EjecutorTeselas": "TiledExecutor",
+    "EjecutorParalelo": "ParallelExecutor",
+    "CacheImagenes": "ImageCache",
+    "EstadisticasCache": "ImageCache",
+    "FiltroConvolucion": "Convolution",
+    "FiltroGaussiano": "Convolution",
+    "FiltroEnfoque": "Convolution",
+    "FiltroBordes": "Convolution",
+    "FiltroSobel": "Convolution",
+    "FiltroScharr": "Convolution",
+    "convolucionar": "Convolution",
+    "SimpleImageViewer": "SimpleImageViewer",
+}
+
+
+def __getattr__(nombre: str):
+    modulo = _PEREZOSOS.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(f".{modulo}", __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "Imagen",
+    "Separacion",
+    "ImagenDiferida",
+    "ImagenBatch",
+    "procesar_lote",
+    "ResultadoLote",
+    "leer_fotogramas",
+    "EscritorFotogramas",
+    "procesar_fotogramas",
+    "ServicioImagenes",
+    "ClienteLocal",
+    "EstadisticasServicio",
+    "EjecutorTeselas",
+    "EjecutorParalelo",
+    "CacheImagenes",
+    "EstadisticasCache",
+    "Estadisticas",
+    "PoliticaPrecision",
+    "establecer_precision",
+    "obtener_precision",
+    "usar_precision",
     "ColorConverter",
     "FiltroFactory",
     "FiltroStrategy",
     "FiltroContraste",
     "FiltroIntensidad",
     "FiltroIdentity",
+    "FiltroCurvaTonal",
+    "FiltroGamma",
+    "FiltroConvolucion",
+    "FiltroGaussiano",
+    "FiltroEnfoque",
+    "FiltroBordes",
+    "FiltroSobel",
+    "FiltroScharr",
+    "convolucionar",
+    "perfilar",
+    "agregar_callback",
+    "eliminar_callback",
+    "Informe",
+    "RegistroOperacion",
     "SimpleImageViewer",
 ]
 __version__ = "1.0.0"